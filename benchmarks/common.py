@@ -0,0 +1,87 @@
+"""
+Shared helpers for the Pingala Shunya benchmark scripts.
+Builds synthetic transcripts and measures time and Python memory.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Callable, List, Tuple
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Imported up front so that first-use imports don't count as memory of what is measured
+import numpy  # noqa: F401
+
+# Run from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment, WordSegment  # noqa: E402
+
+WORDS = ["the", "model", "decodes", "speech", "into", "text", "with", "timestamps", "and", "scores"]
+
+
+def synthetic_segments(num_segments: int, words_per_segment: int, seed: int = 0) -> List[TranscriptionSegment]:
+    """Word-timestamped segments shaped like real output: one word every 0.4 s."""
+    rng = random.Random(seed)
+    segments = []
+    t = 0.0
+    for _ in range(num_segments):
+        words = []
+        for _ in range(words_per_segment):
+            words.append(WordSegment(" " + rng.choice(WORDS), t, t + 0.3, rng.random()))
+            t += 0.4
+        segments.append(TranscriptionSegment(
+            start=words[0].start,
+            end=words[-1].end,
+            text="".join(word.word for word in words),
+            words=words,
+            avg_logprob=-rng.random(),
+            no_speech_prob=rng.random() / 10,
+            compression_ratio=1.5,
+            temperature=0.0
+        ))
+    return segments
+
+
+def synthetic_info(segments: List[TranscriptionSegment]) -> TranscriptionInfo:
+    duration = segments[-1].end if segments else 0.0
+    return TranscriptionInfo("en", 0.98, duration, duration, [("en", 0.98), ("hi", 0.01)])
+
+
+def best_time(fn: Callable[[], Any], repeat: int = 3) -> float:
+    """Fastest wall time of repeat calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def retained_memory(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Build an object and return it with the bytes of Python memory it keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, retained
+
+
+def peak_memory(run: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run a function and return its result with the peak Python memory it allocated, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    result = run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, peak
+
+
+def mib(num_bytes: float) -> str:
+    return f"{num_bytes / 2**20:.1f} MiB"
@@ -0,0 +1,192 @@
+"""
+Decoding throughput of the transcription entry points on real audio and a real model.
+Compares the sequential, batched, micro-batched and multi-process paths.
+Developed by Shunya Labs.
+
+Needs faster-whisper (and transformers for --backend transformers) and a model,
+so unlike the other benchmarks it doesn't run on synthetic data. Results depend
+on the hardware; report them together with the command line.
+
+Modes:
+  sequential   transcribe_file per file; with --batch-size, the transformers
+               backend batches the 30 s chunks of each long file
+  batch        transcribe_batch over all files (VAD-packed windows by default)
+  scheduler    transcribe_batch from --threads concurrent callers sharing one
+               BatchScheduler, swept over --max-batch-sizes x --max-wait-ms;
+               reports throughput and per-request latency for each setting
+  processes    ProcessPoolTranscriber at each of --processes worker counts,
+               with the speed-up over the first count
+  repeat       transcribe_file on the first file --repeat times with the cached
+               pipeline and with a pipeline rebuilt on every call, as before
+               the pipeline was cached; needs --backend transformers
+
+Usage:
+  python benchmarks/decode_throughput.py calls/*.wav --mode batch --device cpu --compute-type int8
+  python benchmarks/decode_throughput.py lecture.mp3 --backend transformers --model openai/whisper-tiny --batch-size 8
+  python benchmarks/decode_throughput.py short.wav --mode repeat --backend transformers --model openai/whisper-tiny --device cpu
+"""
+
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import statistics
+import time
+
+import common  # noqa: F401  (adds the source checkout to sys.path)
+
+from pingala_shunya.audio import probe_duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("audio", nargs="+", help="Audio files")
+    parser.add_argument("--mode", choices=["sequential", "batch", "scheduler", "processes", "repeat"], default="sequential")
+    parser.add_argument("--model", default=None)
+    parser.add_argument("--backend", choices=["ct2", "transformers"], default=None)
+    parser.add_argument("--device", default="auto")
+    parser.add_argument("--compute-type", default="auto")
+    parser.add_argument("--language", default=None)
+    parser.add_argument("--beam-size", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent callers in scheduler mode")
+    parser.add_argument("--max-batch-sizes", default="1,4,8,16", help="Scheduler batch sizes to sweep")
+    parser.add_argument("--max-wait-ms", default="0,10,50", help="Scheduler wait times to sweep")
+    parser.add_argument("--processes", default="1,2,4,8", help="Worker counts to compare in processes mode")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    if args.mode == "repeat" and args.backend != "transformers":
+        parser.error("--mode repeat compares transformers pipelines; pass --backend transformers")
+
+    model_kwargs = {
+        "model_name": args.model,
+        "backend": args.backend,
+        "device": args.device,
+        "compute_type": args.compute_type,
+    }
+    params = {"language": args.language, "beam_size": args.beam_size}
+    audio_seconds = sum(probe_duration(path) for path in args.audio)
+
+    if args.mode == "processes":
+        process_scaling(args, model_kwargs, params, audio_seconds)
+        return
+
+    from pingala_shunya import PingalaTranscriber
+
+    with PingalaTranscriber(**model_kwargs) as transcriber:
+        # Warm up, so model loading and first-call setup don't count
+        transcriber.transcribe_file(args.audio[0], **params)
+
+        if args.mode == "scheduler":
+            scheduler_sweep(transcriber, args, params, audio_seconds)
+            return
+        if args.mode == "repeat":
+            pipeline_overhead(transcriber, args, params)
+            return
+
+        start = time.perf_counter()
+        if args.mode == "sequential":
+            for path in args.audio:
+                transcriber.transcribe_file(path, batch_size=args.batch_size, **params)
+        else:
+            transcriber.transcribe_batch(args.audio, batch_size=args.batch_size or 8, **params)
+        report(args, audio_seconds, time.perf_counter() - start)
+
+
+def pipeline_overhead(transcriber, args, params: dict):
+    """Compare per-call time with the cached pipeline and with one rebuilt per call."""
+    from transformers import pipeline
+
+    backend = transcriber.backend
+    cached = backend.pipe
+
+    def rebuild():
+        # What TransformersBackend.transcribe did on every call before the pipeline was cached
+        backend.pipe = pipeline(
+            "automatic-speech-recognition",
+            model=backend.model,
+            tokenizer=backend.processor.tokenizer,
+            feature_extractor=backend.processor.feature_extractor,
+            torch_dtype=backend.torch_dtype,
+            device=backend.torch_device,
+        )
+
+    def per_call(setup):
+        setup_time = total = 0.0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            setup()
+            setup_time += time.perf_counter() - start
+            transcriber.transcribe_file(args.audio[0], use_cache=False, **params)
+            total += time.perf_counter() - start
+        return setup_time / args.repeat, total / args.repeat
+
+    try:
+        rebuilt = per_call(rebuild)
+    finally:
+        backend.pipe = cached
+    reused = per_call(lambda: None)
+
+    print(f"mode=repeat model={args.model} device={args.device} calls={args.repeat} audio={probe_duration(args.audio[0]):.1f} s")
+    print(f"  {'pipeline':<20} {'setup ms':>9} {'ms per call':>11}")
+    for name, (setup_time, total) in (("rebuilt per call", rebuilt), ("cached", reused)):
+        print(f"  {name:<20} {setup_time * 1000:>9.1f} {total * 1000:>11.1f}")
+
+
+def process_scaling(args, model_kwargs: dict, params: dict, audio_seconds: float):
+    """Time ProcessPoolTranscriber at each worker count and compare with the first."""
+    from pingala_shunya.parallel import ProcessPoolTranscriber
+
+    # Worker processes default to the CPU; "auto" would put every model copy on one GPU
+    if model_kwargs["device"] == "auto":
+        model_kwargs = dict(model_kwargs, device="cpu")
+
+    print(f"mode=processes backend={args.backend or 'auto'} files={len(args.audio)}")
+    print(f"  {'workers':>7} {'seconds':>8} {'x real time':>11} {'speed-up':>8}")
+    baseline = None
+    for num_workers in _numbers(args.processes, int):
+        with ProcessPoolTranscriber(num_workers=num_workers, **model_kwargs) as pool:
+            # Warm up every worker, so model loading doesn't count
+            list(pool.transcribe_files(args.audio[:1] * num_workers, **params))
+            start = time.perf_counter()
+            list(pool.transcribe_files(args.audio, **params))
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"  {num_workers:>7} {elapsed:>8.1f} {audio_seconds / elapsed:>10.1f}x {baseline / elapsed:>7.2f}x")
+
+
+def scheduler_sweep(transcriber, args, params: dict, audio_seconds: float):
+    """Time concurrent single-file requests for every max_batch_size and max_wait_ms."""
+
+    def request(path: str) -> float:
+        start = time.perf_counter()
+        transcriber.transcribe_batch([path], **params)
+        return time.perf_counter() - start
+
+    print(f"mode=scheduler callers={args.threads} files={len(args.audio)}")
+    print(f"  {'batch':>5} {'wait ms':>7} {'x real time':>11} {'mean batch':>10} {'p50 latency':>11} {'p95 latency':>11}")
+    for max_batch_size in _numbers(args.max_batch_sizes, int):
+        for max_wait_ms in _numbers(args.max_wait_ms, float):
+            scheduler = transcriber.enable_batching(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as pool:
+                latencies = sorted(pool.map(request, args.audio))
+            elapsed = time.perf_counter() - start
+            p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+            print(
+                f"  {max_batch_size:>5} {max_wait_ms:>7g} {audio_seconds / elapsed:>10.1f}x"
+                f" {scheduler.stats()['mean_batch_size']:>10.1f}"
+                f" {statistics.median(latencies):>10.2f}s {p95:>10.2f}s"
+            )
+
+
+def _numbers(values: str, kind: type) -> List:
+    return [kind(value) for value in values.split(",")]
+
+
+def report(args, audio_seconds: float, elapsed: float):
+    print(f"mode={args.mode} backend={args.backend or 'auto'} files={len(args.audio)} batch_size={args.batch_size}")
+    print(f"  {audio_seconds:.0f} s of audio in {elapsed:.1f} s: {audio_seconds / elapsed:.1f}x real time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Memory retained by a long word-timestamped transcript in each result representation.
+Backs the "Columnar Results" numbers in the README.
+Developed by Shunya Labs.
+
+Usage: python benchmarks/result_memory.py [--segments 3600] [--words-per-segment 25]
+"""
+
+import argparse
+
+from common import mib, retained_memory, synthetic_info, synthetic_segments
+
+from pingala_shunya.result import TranscriptResult
+
+
+class DictWord:
+    """WordSegment as it was before __slots__, with a per-instance __dict__."""
+
+    def __init__(self, word, start, end, probability):
+        self.word = word
+        self.start = start
+        self.end = end
+        self.probability = probability
+
+
+class DictSegment:
+    """TranscriptionSegment as it was before __slots__."""
+
+    def __init__(self, start, end, text, words, avg_logprob, no_speech_prob, compression_ratio, temperature):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.words = words
+        self.avg_logprob = avg_logprob
+        self.no_speech_prob = no_speech_prob
+        self.compression_ratio = compression_ratio
+        self.temperature = temperature
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=3600)
+    parser.add_argument("--words-per-segment", type=int, default=25)
+    args = parser.parse_args()
+
+    def source():
+        # Fresh segments for every build, so each representation owns its strings
+        return synthetic_segments(args.segments, args.words_per_segment)
+
+    info = synthetic_info(source())
+
+    def as_dict_objects():
+        return [
+            DictSegment(
+                s.start, s.end, s.text,
+                [DictWord(w.word, w.start, w.end, w.probability) for w in s.words],
+                s.avg_logprob, s.no_speech_prob, s.compression_ratio, s.temperature
+            )
+            for s in source()
+        ]
+
+    def as_columns():
+        return TranscriptResult.from_segments(source(), info)
+
+    print(f"{args.segments * args.words_per_segment:,} words in {args.segments:,} segments")
+    for name, build in [
+        ("segment objects with __dict__", as_dict_objects),
+        ("segment objects with __slots__", source),
+        ("TranscriptResult", as_columns),
+    ]:
+        _, retained = retained_memory(build)
+        print(f"  {name:32} {mib(retained)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Size, save and load time of the binary transcript format against the CLI's JSON output.
+Backs the "Binary Transcript Files" table in the README.
+Developed by Shunya Labs.
+
+Usage: python benchmarks/serialization.py [--segments 9000] [--words-per-segment 10]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+
+from common import best_time, mib, peak_memory, synthetic_info, synthetic_segments
+
+from pingala_shunya.result import TranscriptResult
+from pingala_shunya.serialization import load_transcript, save_transcript
+from pingala_shunya.transcriber import TranscriptionSegment
+from pingala_shunya.writers import write_segments
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=9000)
+    parser.add_argument("--words-per-segment", type=int, default=10)
+    args = parser.parse_args()
+
+    segments = synthetic_segments(args.segments, args.words_per_segment)
+    info = synthetic_info(segments)
+    result = TranscriptResult.from_segments(segments, info)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "transcript.json")
+        bin_path = os.path.join(directory, "transcript.bin")
+
+        def load_json():
+            with open(json_path, encoding="utf-8") as f:
+                return json.load(f)
+
+        def json_to_segments():
+            return [TranscriptionSegment.from_dict(segment) for segment in load_json()["segments"]]
+
+        json_save = best_time(lambda: write_segments(segments, "json", json_path, info=info, word_timestamps=True))
+        bin_save = best_time(lambda: save_transcript(bin_path, result))
+        bin_save_segments = best_time(lambda: save_transcript(bin_path, segments, info))
+
+        rows = [
+            ("File size", f"{os.path.getsize(json_path) / 1e6:.1f} MB", f"{os.path.getsize(bin_path) / 1e6:.1f} MB"),
+            ("Save", f"{json_save * 1000:.0f} ms",
+             f"{bin_save * 1000:.1f} ms from a TranscriptResult, {bin_save_segments * 1000:.0f} ms from segments"),
+            ("Load", f"{best_time(load_json) * 1000:.0f} ms to dicts, {best_time(json_to_segments) * 1000:.0f} ms to segments",
+             f"{best_time(lambda: load_transcript(bin_path)) * 1000:.1f} ms, "
+             f"{best_time(lambda: load_transcript(bin_path).to_segments()) * 1000:.0f} ms with to_segments()"),
+            ("Peak memory on load", mib(peak_memory(load_json)[1]), mib(peak_memory(lambda: load_transcript(bin_path))[1])),
+        ]
+
+    print(f"{args.segments * args.words_per_segment:,} words in {args.segments:,} segments")
+    for name, json_value, bin_value in rows:
+        print(f"  {name:20} JSON: {json_value:40} Binary: {bin_value}")
+
+
+if __name__ == "__main__":
+    main()
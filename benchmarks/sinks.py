@@ -0,0 +1,50 @@
+"""
+Python memory of writing a corpus to a JSON Lines sink, and what stays per record.
+Backs the "Bulk Output for Datasets" numbers in the README.
+Developed by Shunya Labs.
+
+Usage: python benchmarks/sinks.py [--records 20000] [--words-per-record 100]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from common import mib, peak_memory, synthetic_info, synthetic_segments
+
+from pingala_shunya.sinks import open_sink
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--words-per-record", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    # One record's segments, reused so that only the sink's own memory is measured
+    segments = synthetic_segments(args.words_per_record // 10, 10)
+    info = synthetic_info(segments)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.jsonl")
+
+        def write_corpus():
+            with open_sink(path, batch_size=args.batch_size) as sink:
+                for index in range(args.records):
+                    sink.write(f"corpus/speaker{index % 100:03d}/clip{index:08d}.wav", segments, info)
+                return sink
+
+        sink, peak = peak_memory(write_corpus)
+        ids = sink.completed_ids
+        per_id = (sys.getsizeof(ids) + sum(sys.getsizeof(record_id) for record_id in ids)) / len(ids)
+        size = os.path.getsize(path)
+
+    print(f"{args.records:,} records of {args.words_per_record} words, {size / 1e6:.0f} MB of JSONL")
+    print(f"  Peak Python memory   {mib(peak)}")
+    print(f"  Retained per id      {per_id:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Time to format a long word-timestamped transcript with each writer.
+Backs the "Streaming Writers" numbers in the README.
+Developed by Shunya Labs.
+
+Usage: python benchmarks/writers.py [--words 1000000] [--words-per-segment 20]
+"""
+
+import argparse
+import io
+
+from common import best_time, synthetic_segments
+
+from pingala_shunya.writers import get_writer
+
+
+def old_time_vtt(seconds: float) -> str:
+    """The CLI's timestamp formatting before the writers."""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    milliseconds = int((seconds % 1) * 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+
+
+def old_vtt(segments) -> str:
+    """The CLI's VTT formatter before the writers: string concatenation per word."""
+    lines = ["WEBVTT", ""]
+    for segment in segments:
+        lines.append(f"{old_time_vtt(segment.start)} --> {old_time_vtt(segment.end)}")
+        text_with_words = ""
+        for word in segment.words:
+            text_with_words += f"<{old_time_vtt(word.start)}>{word.word}</{old_time_vtt(word.end)}> "
+        lines.append(text_with_words.strip())
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--words-per-segment", type=int, default=20)
+    args = parser.parse_args()
+
+    segments = synthetic_segments(args.words // args.words_per_segment, args.words_per_segment)
+
+    def write(output_format):
+        return lambda: get_writer(output_format, io.StringIO(), word_timestamps=True).write_all(segments)
+
+    print(f"{args.words:,} words in {len(segments):,} segments, word timestamps on")
+    for name, run in [
+        ("srt", write("srt")),
+        ("tsv", write("tsv")),
+        ("vtt", write("vtt")),
+        ("vtt, old formatter", lambda: old_vtt(segments)),
+    ]:
+        print(f"  {name:20} {best_time(run):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -46,15 +46,64 @@ __version__ = "0.1.7"
 __author__ = "Shunya Labs"
 __email__ = "0@shunyalabs.ai"
 
-from .transcriber import (
-    PingalaTranscriber,
-    TranscriptionSegment,
-    WordSegment,
-    TranscriptionInfo,
-    TranscriptionBackend,
-    CT2Backend,
-    TransformersBackend
-)
+from typing import TYPE_CHECKING
+import importlib
+
+# Public names and the modules defining them. They are imported on first
+# access, so "import pingala_shunya" and the CLI's --help/--version stay fast.
+_LAZY_IMPORTS = {
+    "PingalaTranscriber": ".transcriber",
+    "TranscriptionSegment": ".transcriber",
+    "WordSegment": ".transcriber",
+    "TranscriptionInfo": ".transcriber",
+    "TranscriptionBackend": ".transcriber",
+    "CT2Backend": ".transcriber",
+    "TransformersBackend": ".transcriber",
+    "AudioBuffer": ".audio",
+    "ModelRegistry": ".registry",
+    "get_model_registry": ".registry",
+    "AsyncPingalaTranscriber": ".async_transcriber",
+    "BatchScheduler": ".scheduler",
+    "StreamingSession": ".streaming",
+    "StreamingUpdate": ".streaming",
+    "ProcessPoolTranscriber": ".parallel",
+    "TranscriptResult": ".result",
+    "SegmentView": ".result",
+    "save_transcript": ".serialization",
+    "load_transcript": ".serialization",
+}
+
+if TYPE_CHECKING:
+    from .transcriber import (
+        PingalaTranscriber,
+        TranscriptionSegment,
+        WordSegment,
+        TranscriptionInfo,
+        TranscriptionBackend,
+        CT2Backend,
+        TransformersBackend
+    )
+    from .audio import AudioBuffer
+    from .registry import ModelRegistry, get_model_registry
+    from .async_transcriber import AsyncPingalaTranscriber
+    from .scheduler import BatchScheduler
+    from .streaming import StreamingSession, StreamingUpdate
+    from .parallel import ProcessPoolTranscriber
+    from .result import TranscriptResult, SegmentView
+    from .serialization import save_transcript, load_transcript
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "PingalaTranscriber",
@@ -63,5 +112,17 @@ __all__ = [
     "TranscriptionInfo",
     "TranscriptionBackend",
     "CT2Backend",
-    "TransformersBackend"
+    "TransformersBackend",
+    "AudioBuffer",
+    "ModelRegistry",
+    "get_model_registry",
+    "AsyncPingalaTranscriber",
+    "BatchScheduler",
+    "StreamingSession",
+    "StreamingUpdate",
+    "ProcessPoolTranscriber",
+    "TranscriptResult",
+    "SegmentView",
+    "save_transcript",
+    "load_transcript"
 ] 
@@ -0,0 +1,308 @@
+"""
+Asyncio front end for Pingala Shunya transcription.
+Runs blocking decodes in worker threads with bounded concurrency and queueing.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextlib
+import functools
+import threading
+
+from .audio import AudioInput
+from .transcriber import PingalaTranscriber, TranscriptionSegment, TranscriptionInfo
+
+_DONE = object()
+
+
+class AsyncTranscriptionStream:
+    """
+    Async iterator over the segments of one transcription.
+
+    Decoding starts on the first iteration and each segment is decoded when it is
+    requested, so a slow consumer never buffers more than one segment. The
+    language information is available as info once the first segment has been
+    requested.
+
+    The stream holds a decode slot only while it decodes a segment, so a loop
+    left with break, or a stream that is never finished, doesn't block other
+    requests. Exhaustion, an error, cancelling the consuming task or aclose()
+    stop the backend's decoder; a stream that is dropped unfinished is stopped
+    when it is garbage collected. Use async with or aclose() to stop it promptly.
+    """
+
+    def __init__(self, owner: "AsyncPingalaTranscriber", audio: AudioInput, kwargs: Dict[str, Any]):
+        self.info: Optional[TranscriptionInfo] = None
+        self._owner = owner
+        self._audio = audio
+        self._kwargs = kwargs
+        self._iterator = None
+        self._finished = False
+
+    def __aiter__(self) -> "AsyncTranscriptionStream":
+        return self
+
+    async def __anext__(self) -> TranscriptionSegment:
+        if self._finished:
+            raise StopAsyncIteration
+        owner = self._owner
+        try:
+            async with owner._slot():
+                if self._iterator is None:
+                    self._iterator, self.info = await owner._run(
+                        owner.transcriber.transcribe_stream, self._audio, **self._kwargs
+                    )
+                segment = await owner._run(next, self._iterator, _DONE)
+        except BaseException:
+            await self.aclose()
+            raise
+        if segment is _DONE:
+            await self.aclose()
+            raise StopAsyncIteration
+        return segment
+
+    async def aclose(self):
+        """Stop decoding; further iteration ends immediately."""
+        self._finished = True
+        iterator, self._iterator = self._iterator, None
+        if iterator is not None and hasattr(iterator, "close"):
+            # Closing the backend generator stops faster-whisper from decoding further windows
+            if self._owner._closed:
+                iterator.close()
+            else:
+                await self._owner._run(iterator.close)
+
+    async def __aenter__(self) -> "AsyncTranscriptionStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def __del__(self):
+        # No step is running while the stream is collectable, so the generator can be closed here
+        iterator = getattr(self, "_iterator", None)
+        if iterator is not None and hasattr(iterator, "close"):
+            iterator.close()
+
+
+class AsyncPingalaTranscriber:
+    """
+    Asyncio wrapper around PingalaTranscriber.
+
+    At most max_concurrency decodes run on the wrapped model at once and at
+    most max_queue_size further requests wait for a slot. Callers beyond that
+    are held back in their await until the queue has room (backpressure).
+    Cancelling a request stops its decode at the next segment boundary; the
+    transformers backend decodes a file in one call, so there cancellation only
+    takes effect before decoding starts.
+
+    Example:
+        async with AsyncPingalaTranscriber(max_concurrency=2) as transcriber:
+            segments, info = await transcriber.transcribe("audio.wav")
+
+            async with transcriber.transcribe_stream("long.wav") as stream:
+                async for segment in stream:
+                    print(segment.text)
+    """
+
+    def __init__(
+        self,
+        transcriber: Optional[PingalaTranscriber] = None,
+        max_concurrency: int = 1,
+        max_queue_size: int = 32,
+        **transcriber_kwargs
+    ):
+        """
+        Wrap a transcriber for use from asyncio code.
+
+        Args:
+            transcriber (PingalaTranscriber, optional): Transcriber to wrap. One is created
+                from transcriber_kwargs (blocking while the model loads) if None; use
+                create() to load it without blocking the event loop.
+            max_concurrency (int): Decodes run at the same time on the model (default: 1)
+            max_queue_size (int): Requests allowed to wait for a decode slot (default: 32)
+            **transcriber_kwargs: PingalaTranscriber arguments used when transcriber is None
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size must not be negative")
+
+        self._owns_transcriber = transcriber is None
+        self.transcriber = transcriber if transcriber is not None else PingalaTranscriber(**transcriber_kwargs)
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pingala-async")
+        self._admission: Optional[asyncio.Semaphore] = None
+        self._running: Optional[asyncio.Semaphore] = None
+        self._queued = 0
+        self._active = 0
+        self._closed = False
+
+    @classmethod
+    async def create(
+        cls,
+        max_concurrency: int = 1,
+        max_queue_size: int = 32,
+        **transcriber_kwargs
+    ) -> "AsyncPingalaTranscriber":
+        """Load the model in a worker thread and return a wrapper that owns it."""
+        loop = asyncio.get_running_loop()
+        transcriber = await loop.run_in_executor(None, functools.partial(PingalaTranscriber, **transcriber_kwargs))
+        instance = cls(transcriber, max_concurrency=max_concurrency, max_queue_size=max_queue_size)
+        instance._owns_transcriber = True
+        return instance
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a decode slot."""
+        return self._queued
+
+    @property
+    def active_requests(self) -> int:
+        """Requests currently decoding."""
+        return self._active
+
+    async def transcribe(
+        self,
+        audio_path: AudioInput,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **kwargs
+    ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
+        """
+        Transcribe audio without blocking the event loop.
+
+        Accepts the same arguments as PingalaTranscriber.transcribe_file. Results
+        come from the transcriber's result cache when it has one.
+
+        Returns:
+            Tuple[List[TranscriptionSegment], TranscriptionInfo]: Transcription segments and info
+        """
+        params = dict(beam_size=beam_size, language=language, word_timestamps=word_timestamps, **kwargs)
+        async with self._slot():
+            cancel = threading.Event()
+            try:
+                return await self._run(self._transcribe_sync, audio_path, cancel, params, cancel_event=cancel)
+            finally:
+                cancel.set()
+
+    def transcribe_stream(
+        self,
+        audio_path: AudioInput,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **kwargs
+    ) -> AsyncTranscriptionStream:
+        """
+        Return an async iterator that yields segments as they are decoded.
+
+        Accepts the same arguments as PingalaTranscriber.transcribe_stream. Only
+        the ct2 backend decodes incrementally.
+
+        Returns:
+            AsyncTranscriptionStream: Use with async for, inside async with to stop it early;
+                info holds the language information
+        """
+        params = dict(beam_size=beam_size, language=language, word_timestamps=word_timestamps, **kwargs)
+        return AsyncTranscriptionStream(self, audio_path, params)
+
+    async def detect_language(self, audio_path: AudioInput, **kwargs) -> TranscriptionInfo:
+        """Detect the language of audio without blocking the event loop (see PingalaTranscriber.detect_language)."""
+        async with self._slot():
+            return await self._run(self.transcriber.detect_language, audio_path, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking call that uses the model, such as StreamingSession.feed(),
+        in a worker thread within the concurrency and queue limits.
+        """
+        async with self._slot():
+            return await self._run(fn, *args, **kwargs)
+
+    async def close(self):
+        """Wait for running decodes, stop the worker threads and release an owned model."""
+        if self._closed:
+            return
+        self._closed = True
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self._executor.shutdown, wait=True))
+        if self._owns_transcriber:
+            self.transcriber.close()
+
+    async def __aenter__(self) -> "AsyncPingalaTranscriber":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _transcribe_sync(
+        self,
+        audio_path: AudioInput,
+        cancel: threading.Event,
+        params: Dict[str, Any]
+    ) -> Optional[Tuple[List[TranscriptionSegment], TranscriptionInfo]]:
+        """Decode in a worker thread, checking for cancellation between segments."""
+        if cancel.is_set():
+            return None
+        if self.transcriber.cache is not None:
+            return self.transcriber.transcribe_file(audio_path, **params)
+
+        iterator, info = self.transcriber.transcribe_stream(audio_path, **params)
+        segments = []
+        try:
+            for segment in iterator:
+                if cancel.is_set():
+                    return None
+                segments.append(segment)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        return segments, info
+
+    @contextlib.asynccontextmanager
+    async def _slot(self):
+        """Hold a queue place, then a decode slot, for the duration of a request."""
+        if self._closed:
+            raise RuntimeError("AsyncPingalaTranscriber is closed")
+        if self._admission is None:
+            # Created lazily so they belong to the running event loop
+            self._admission = asyncio.Semaphore(self.max_concurrency + self.max_queue_size)
+            self._running = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._admission:
+            self._queued += 1
+            try:
+                await self._running.acquire()
+            finally:
+                self._queued -= 1
+            self._active += 1
+            try:
+                yield
+            finally:
+                self._active -= 1
+                self._running.release()
+
+    async def _run(self, fn: Callable[..., Any], *args, cancel_event: Optional[threading.Event] = None, **kwargs) -> Any:
+        """
+        Run fn in a worker thread.
+
+        If the awaiting task is cancelled, the worker is signalled through
+        cancel_event and awaited before the cancellation propagates, so the
+        request keeps its slot until the model is actually free.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if cancel_event is not None:
+                cancel_event.set()
+            await asyncio.wait({future})
+            raise
@@ -0,0 +1,349 @@
+"""
+Audio loading helpers for Pingala Shunya transcription.
+Decodes and windows 16 kHz mono audio.
+Developed by Shunya Labs.
+"""
+
+from typing import TYPE_CHECKING, List, Tuple, Optional, Dict, Any, Union, BinaryIO
+from collections import OrderedDict
+import math
+import os
+import threading
+
+if TYPE_CHECKING:
+    # NumPy is imported inside the functions that need it
+    import numpy as np
+
+# Whisper models consume 16 kHz mono audio in 30 second windows
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+WINDOW_SAMPLES = SAMPLE_RATE * WINDOW_SECONDS
+
+
+
+class AudioBuffer:
+    """
+    Decoded 16 kHz mono float32 audio that every PingalaTranscriber method accepts.
+
+    Create one with PingalaTranscriber.load_audio() to decode and resample a file
+    once and reuse the samples for language detection and transcription.
+    """
+
+    def __init__(self, samples: "np.ndarray", source: Optional[str] = None):
+        self.samples = samples
+        self.source = source
+        self.sample_rate = SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return len(self.samples) / self.sample_rate
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the samples."""
+        return self.samples.nbytes
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __repr__(self) -> str:
+        return f"AudioBuffer(source={self.source!r}, duration={self.duration:.2f}s)"
+
+
+class AudioBufferCache:
+    """Thread-safe LRU cache of decoded files, bounded by total sample bytes."""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[Any, ...], AudioBuffer]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(audio_path: Union[str, "os.PathLike[str]"], decoder: str) -> Tuple[Any, ...]:
+        """Build a cache key that changes when the file is modified."""
+        path = os.path.realpath(os.fspath(audio_path))
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size, decoder)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[AudioBuffer]:
+        with self._lock:
+            buffer = self._entries.get(key)
+            if buffer is not None:
+                self._entries.move_to_end(key)
+            return buffer
+
+    def put(self, key: Tuple[Any, ...], buffer: AudioBuffer):
+        with self._lock:
+            if key in self._entries or buffer.nbytes > self.max_bytes:
+                return
+            self._entries[key] = buffer
+            self._size += buffer.nbytes
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Process-wide cache used by PingalaTranscriber.load_audio()
+audio_buffer_cache = AudioBufferCache()
+
+
+# Accepted audio inputs: a path, a file-like object with encoded audio, an AudioBuffer,
+# float32 samples at 16 kHz, or raw 16-bit little-endian mono PCM at 16 kHz
+AudioInput = Union[str, "os.PathLike[str]", BinaryIO, AudioBuffer, "np.ndarray", bytes, bytearray, memoryview]
+
+
+def is_audio_path(audio: Any) -> bool:
+    """Return True if the audio input is a filesystem path."""
+    return isinstance(audio, (str, os.PathLike))
+
+
+def describe_audio(audio: Any) -> str:
+    """Return a short human-readable name for an audio input, used in messages."""
+    if is_audio_path(audio):
+        return os.fspath(audio)
+    if isinstance(audio, AudioBuffer):
+        return audio.source or "<in-memory audio>"
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return "<in-memory PCM audio>"
+    name = getattr(audio, "name", None)
+    if isinstance(name, str):
+        return name
+    if hasattr(audio, "read"):
+        return "<file-like audio>"
+    return "<in-memory audio>"
+
+
+def pcm16_to_float32(data: Union[bytes, bytearray, memoryview]) -> "np.ndarray":
+    """Convert raw 16-bit little-endian mono PCM into float32 samples in [-1, 1)."""
+    import numpy as np
+
+    if len(data) % 2:
+        raise ValueError("PCM byte length must be a multiple of 2 for 16-bit samples")
+    return np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def in_memory_samples(audio: Any) -> Optional["np.ndarray"]:
+    """
+    Return float32 samples for in-memory audio without touching the disk.
+
+    Returns None for paths and file-like objects, which still need decoding.
+    """
+    if isinstance(audio, AudioBuffer):
+        return audio.samples
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return pcm16_to_float32(audio)
+    if is_audio_path(audio) or hasattr(audio, "read"):
+        return None
+
+    import numpy as np
+
+    if not isinstance(audio, np.ndarray):
+        return None
+
+    if audio.ndim != 1:
+        raise ValueError(f"Expected mono audio as a 1-D array, got shape {audio.shape}")
+    if audio.dtype == np.int16:
+        return audio.astype(np.float32) / 32768.0
+    if audio.dtype != np.float32:
+        return audio.astype(np.float32)
+    return audio
+
+
+def as_decoder_input(audio: Any) -> Any:
+    """Normalize an audio input for decoders that accept paths, file objects or arrays."""
+    samples = in_memory_samples(audio)
+    if samples is not None:
+        return samples
+    if is_audio_path(audio):
+        return os.fspath(audio)
+    return audio
+
+
+def decode_audio_head(audio_path: Union[str, BinaryIO], max_duration: Optional[float] = None) -> Tuple["np.ndarray", float]:
+    """
+    Decode at most the first max_duration seconds of an audio file.
+
+    The rest of the file is not resampled, so the cost is bounded by
+    max_duration rather than by the length of the recording.
+
+    Args:
+        audio_path (str or file-like): Path to the audio file or a file object
+        max_duration (float, optional): Seconds to decode. Decodes everything if None.
+
+    Returns:
+        Tuple[np.ndarray, float]: float32 samples at 16 kHz and the full file duration in seconds
+    """
+    import av
+    import numpy as np
+
+    max_samples = None if max_duration is None else int(max_duration * SAMPLE_RATE)
+    resampler = av.audio.resampler.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    chunks = []
+    decoded = 0
+
+    with av.open(audio_path, mode="r", metadata_errors="ignore") as container:
+        duration = _container_duration(container)
+        source_seconds = 0.0
+        truncated = False
+
+        for frame in container.decode(audio=0):
+            source_seconds += frame.samples / float(frame.sample_rate)
+            if truncated:
+                # Duration is not in the metadata; count frames without resampling them
+                continue
+
+            frame.pts = None
+            for resampled in _as_list(resampler.resample(frame)):
+                array = resampled.to_ndarray().reshape(-1)
+                chunks.append(array)
+                decoded += len(array)
+
+            if max_samples is not None and decoded >= max_samples:
+                if duration is not None:
+                    break
+                truncated = True
+        else:
+            if not truncated:
+                for resampled in _as_list(resampler.resample(None)):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+
+    audio = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int16)
+    if max_samples is not None:
+        audio = audio[:max_samples]
+    audio = audio.astype(np.float32) / 32768.0
+
+    if duration is None:
+        duration = source_seconds
+    return audio, duration
+
+
+def probe_duration(audio: Any) -> float:
+    """
+    Estimate the duration of an audio input in seconds without decoding it.
+
+    Paths are probed through their container metadata; inputs whose duration
+    can't be read cheaply count as 0.
+    """
+    samples = in_memory_samples(audio)
+    if samples is not None:
+        return len(samples) / SAMPLE_RATE
+    if not is_audio_path(audio):
+        return 0.0
+
+    try:
+        import av
+
+        with av.open(os.fspath(audio), mode="r", metadata_errors="ignore") as container:
+            duration = _container_duration(container)
+    except Exception:
+        duration = None
+    if duration is None:
+        # Rough guess from the file size at 16 kB/s (128 kbit/s)
+        try:
+            duration = os.path.getsize(audio) / 16000.0
+        except OSError:
+            duration = 0.0
+    return duration
+
+
+def _container_duration(container: Any) -> Optional[float]:
+    """Read the duration of an opened PyAV container from its metadata."""
+    import av
+
+    if container.duration is not None:
+        return container.duration / float(av.time_base)
+
+    stream = container.streams.audio[0]
+    if stream.duration is not None and stream.time_base is not None:
+        return float(stream.duration * stream.time_base)
+    return None
+
+
+def _as_list(frames: Any) -> List[Any]:
+    """Normalize AudioResampler.resample output across PyAV versions."""
+    if frames is None:
+        return []
+    if isinstance(frames, list):
+        return frames
+    return [frames]
+
+
+# Frame length of the silence gate's energy measurement (30 ms)
+SILENCE_FRAME_SAMPLES = SAMPLE_RATE * 30 // 1000
+
+
+def peak_frame_dbfs(samples: "np.ndarray", frame_samples: int = SILENCE_FRAME_SAMPLES) -> float:
+    """
+    Return the RMS level of the loudest frame in dBFS (-inf for empty or all-zero audio).
+
+    Using the loudest frame rather than the overall RMS keeps a short utterance
+    in a long, otherwise silent recording from averaging out.
+    """
+    import numpy as np
+
+    if len(samples) == 0:
+        return float("-inf")
+
+    usable = len(samples) // frame_samples * frame_samples
+    peak = 0.0
+    if usable:
+        frames = samples[:usable].reshape(-1, frame_samples)
+        peak = float(np.einsum("ij,ij->i", frames, frames).max()) / frame_samples
+    if usable < len(samples):
+        tail = samples[usable:]
+        peak = max(peak, float(np.dot(tail, tail)) / len(tail))
+    return 10.0 * math.log10(peak) if peak > 0 else float("-inf")
+
+
+class SilenceGate:
+    """
+    Thread-safe energy gate that flags silent audio before it reaches the model.
+
+    Audio is silent when no 30 ms frame is louder than threshold_db. The gate
+    counts what was skipped so callers can report how much decoding it saved.
+    """
+
+    def __init__(self, threshold_db: float = -50.0):
+        self.threshold_db = threshold_db
+        self._lock = threading.Lock()
+        self._files = 0
+        self._windows = 0
+        self._seconds = 0.0
+
+    def is_silent(self, samples: "np.ndarray") -> bool:
+        """Return True if no frame of samples exceeds the threshold."""
+        return bool(peak_frame_dbfs(samples) < self.threshold_db)
+
+    def record(self, seconds: float, windows: int = 0, whole_file: bool = False):
+        """Count skipped audio: seconds, 30 second windows, and whether a whole file was skipped."""
+        with self._lock:
+            self._seconds += seconds
+            self._windows += windows
+            self._files += int(whole_file)
+
+    def stats(self) -> Dict[str, Any]:
+        """Files and windows skipped as silent and the seconds of audio they held."""
+        with self._lock:
+            return {
+                "files_skipped": self._files,
+                "windows_skipped": self._windows,
+                "seconds_skipped": self._seconds,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._files = 0
+            self._windows = 0
+            self._seconds = 0.0
+
+
+def split_windows(audio: "np.ndarray", window_samples: int = WINDOW_SAMPLES) -> List["np.ndarray"]:
+    """Split audio into consecutive windows of at most window_samples samples."""
+    return [audio[i:i + window_samples] for i in range(0, len(audio), window_samples)]
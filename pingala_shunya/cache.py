@@ -0,0 +1,181 @@
+"""
+On-disk transcription result cache for Pingala Shunya.
+Results are keyed by audio content hash, model and decoding parameters.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from .audio import AudioBuffer, is_audio_path, in_memory_samples
+
+# Bump when the stored payload layout changes so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    """Return the default cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pingala-shunya", "transcripts")
+
+
+class TranscriptionCache:
+    """
+    Size-bounded directory of serialized transcription results.
+
+    Each entry is a JSON file named after its key. Hits refresh the file's
+    modification time and the least recently used entries are deleted once the
+    directory grows past max_size_bytes. Writes are atomic, so several
+    processes can share one directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size_bytes: int = 1024 * 1024 * 1024):
+        self.directory = directory or default_cache_dir()
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._path_hashes: "OrderedDict[Any, str]" = OrderedDict()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._size = sum(size for _, _, size in self._entries())
+
+    def make_key(self, audio: Any, identity: Dict[str, Any], params: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the cache key for an audio input, model identity and decoding parameters.
+
+        Returns None when the audio content can't be hashed without consuming it
+        (non-seekable streams), in which case the result isn't cached.
+        """
+        content_hash = self.hash_audio(audio)
+        if content_hash is None:
+            return None
+
+        key_data = {
+            "version": CACHE_FORMAT_VERSION,
+            "audio": content_hash,
+            "identity": identity,
+            "params": params,
+        }
+        encoded = json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def hash_audio(self, audio: Any) -> Optional[str]:
+        """Return a content hash for any supported audio input."""
+        if is_audio_path(audio):
+            return self._hash_path(os.fspath(audio))
+
+        if hasattr(audio, "read") and not isinstance(audio, AudioBuffer):
+            if not (hasattr(audio, "seekable") and audio.seekable()):
+                return None
+            position = audio.tell()
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: audio.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            audio.seek(position)
+            return "file:" + digest.hexdigest()
+
+        samples = in_memory_samples(audio)
+        if samples is None:
+            return None
+        return "pcm:" + hashlib.sha256(samples.tobytes()).hexdigest()
+
+    def _hash_path(self, path: str) -> str:
+        """Hash file contents, memoized per path, size and modification time."""
+        stat = os.stat(path)
+        memo_key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._path_hashes.get(memo_key)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        content_hash = "file:" + digest.hexdigest()
+
+        with self._lock:
+            self._path_hashes[memo_key] = content_hash
+            if len(self._path_hashes) > 4096:
+                self._path_hashes.popitem(last=False)
+        return content_hash
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored payload for key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError):
+            return None
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any]):
+        """Store a payload atomically and evict old entries if over the size limit."""
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            self._size += os.path.getsize(path)
+            if self._size > self.max_size_bytes:
+                self._evict()
+
+    def clear(self):
+        """Delete every cached result."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def _evict(self):
+        """Delete least recently used entries until the cache is within its limit."""
+        # Rescan: other processes may share the directory
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+        for path, _, entry_size in entries:
+            if size <= self.max_size_bytes:
+                break
+            try:
+                os.unlink(path)
+                size -= entry_size
+            except OSError:
+                pass
+        self._size = size
+
+    def _entries(self):
+        """Yield (path, mtime, size) for every cached result."""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
@@ -3,11 +3,20 @@ Command-line interface for Pingala Shunya transcription by Shunya Labs.
 """
 
 import argparse
+import glob
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from .transcriber import PingalaTranscriber
+from . import __version__
+from .writers import WRITERS, format_timestamp, write_segments
+
+if TYPE_CHECKING:
+    # Imported in main() only when transcribing, so --help and --version start fast
+    from .transcriber import PingalaTranscriber
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -29,7 +38,14 @@ Examples:
   pingala audio.wav --word-timestamps        # Include word-level timing
   pingala audio.wav --show-confidence        # Show confidence scores
   pingala audio.wav --vad                    # Enable voice activity detection
+  pingala audio.wav --cache                  # Reuse cached results for the same audio
+  pingala serve --port 8000                  # Start the HTTP/WebSocket server (see pingala serve --help)
+  pingala a.wav b.wav recordings/ --format srt --output-dir subs/  # Batch mode
+  pingala "calls/**/*.opus" --workers 4 --skip-existing            # Glob with a worker pool
+  pingala corpus/ -r --workers 4 --sink corpus.jsonl               # One resumable JSONL file
+  pingala recordings/ --device cpu --compute-type int8 --processes 8 --output-dir out/  # One model per process
   pingala audio.wav --detect-language        # Detect language only
+  pingala audio.wav --detect-language --detect-vad  # Detect on speech windows
 
 Supported models:
   • Default: shunyalabs/pingala-v1-en-verbatim (High-quality English transcription)
@@ -45,15 +61,65 @@ Developed by Shunya Labs for superior transcription quality.
     )
     
     parser.add_argument(
-        "audio_file",
+        "audio_files",
         type=str,
-        help="Path to the audio file to transcribe"
+        nargs="+",
+        metavar="audio_file",
+        help="Audio files, directories or glob patterns to transcribe"
     )
     
     parser.add_argument(
         "-o", "--output",
         type=str,
-        help="Output file path (default: print to stdout)"
+        help="Output file path for a single input (default: print to stdout)"
+    )
+    
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        help="Directory for per-file outputs (default: next to each input when several files are given)"
+    )
+    
+    parser.add_argument(
+        "--recursive", "-r",
+        action="store_true",
+        help="Search directories recursively for audio files"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of files transcribed concurrently with the shared model (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes for batch mode, each with its own model and a share of the CPU cores; "
+             "they run on the CPU unless --device is given (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip inputs whose output file already exists"
+    )
+    
+    parser.add_argument(
+        "--sink",
+        type=str,
+        metavar="PATH",
+        help="Append one record per input (segments, words, confidences, info) to a .jsonl file or a "
+             ".parquet directory instead of writing per-file outputs; inputs already in it are skipped"
+    )
+    
+    parser.add_argument(
+        "--sink-batch-size",
+        type=int,
+        default=100,
+        help="Records buffered between writes to the --sink output (default: 100)"
     )
     
     parser.add_argument(
@@ -75,17 +141,45 @@ Developed by Shunya Labs for superior transcription quality.
     parser.add_argument(
         "--device",
         type=str,
-        default="cuda",
+        default="auto",
         choices=["cuda", "cpu", "auto"],
-        help="Device to run the model on (default: cuda)"
+        help="Device to run the model on (default: auto, CUDA if a GPU is visible)"
     )
     
     parser.add_argument(
         "--compute-type",
         type=str,
-        default="float16",
-        choices=["float16", "float32", "int8"],
-        help="Compute precision (default: float16)"
+        default="auto",
+        choices=["auto", "float16", "float32", "int8", "int8_float16"],
+        help="Compute precision (default: auto, float16 on CUDA and int8 on CPU)"
+    )
+    
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="Inference threads on CPU per worker (default: 0, the available cores divided by the workers, "
+             "or OMP_NUM_THREADS)"
+    )
+    
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        help="Model replicas decoding in parallel (ct2 only, default: the value of --workers)"
+    )
+    
+    parser.add_argument(
+        "--device-index",
+        type=int,
+        nargs="+",
+        default=[0],
+        help="GPU id(s) to load the model on (default: 0)"
+    )
+    
+    parser.add_argument(
+        "--download-root",
+        type=str,
+        help="Directory for downloaded models (default: the Hugging Face cache)"
     )
     
     parser.add_argument(
@@ -95,6 +189,12 @@ Developed by Shunya Labs for superior transcription quality.
         help="Beam size for decoding (default: 5)"
     )
     
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Chunks decoded per forward pass for audio over 30 seconds (transformers only, default: 8); with --vad on ct2, decode speech windows in batches of this size"
+    )
+    
     parser.add_argument(
         "--language",
         type=str,
@@ -105,8 +205,10 @@ Developed by Shunya Labs for superior transcription quality.
         "--format",
         type=str,
         default="text",
-        choices=["text", "srt", "vtt"],
-        help="Output format (default: text)"
+        choices=list(WRITERS) + ["bin"],
+        help="Output format (default: text); bin is the binary transcript format "
+             "read by pingala_shunya.load_transcript, with times, scores and word probabilities "
+             "as float32, and needs --output or --output-dir"
     )
     
     parser.add_argument(
@@ -130,7 +232,7 @@ Developed by Shunya Labs for superior transcription quality.
     parser.add_argument(
         "--vad",
         action="store_true",
-        help="Enable Voice Activity Detection filtering (ct2 only)"
+        help="Enable Voice Activity Detection filtering"
     )
     
     parser.add_argument(
@@ -139,6 +241,26 @@ Developed by Shunya Labs for superior transcription quality.
         help="Only detect language, don't transcribe"
     )
     
+    parser.add_argument(
+        "--detect-duration",
+        type=float,
+        default=30.0,
+        help="Seconds from the start of the file used for language detection (default: 30)"
+    )
+    
+    parser.add_argument(
+        "--detect-vad",
+        action="store_true",
+        help="Detect language on VAD-selected speech windows instead of the start of the file"
+    )
+    
+    parser.add_argument(
+        "--top-languages",
+        type=int,
+        default=5,
+        help="Number of candidate languages reported by --detect-language (default: 5)"
+    )
+    
     parser.add_argument(
         "--temperature",
         type=float,
@@ -187,6 +309,32 @@ Developed by Shunya Labs for superior transcription quality.
         help="Task type (default: transcribe)"
     )
     
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache transcription results on disk and reuse them for identical audio and settings"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Directory for cached results (implies --cache; default: ~/.cache/pingala-shunya/transcripts)"
+    )
+    
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=1024,
+        help="Maximum size of the result cache in MB (default: 1024)"
+    )
+    
+    parser.add_argument(
+        "--silence-threshold",
+        type=float,
+        metavar="DB",
+        help="Skip audio with no 30 ms frame louder than this level in dBFS (e.g. -50) without running the model"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -196,7 +344,7 @@ Developed by Shunya Labs for superior transcription quality.
     parser.add_argument(
         "--version",
         action="version",
-        version="%(prog)s 0.1.0"
+        version=f"%(prog)s {__version__}"
     )
     
     return parser
@@ -204,92 +352,367 @@ Developed by Shunya Labs for superior transcription quality.
 
 def format_as_srt(segments, output_file: Optional[str] = None, word_timestamps: bool = False):
     """Format transcription segments as SRT subtitles."""
-    lines = []
-    for i, segment in enumerate(segments, 1):
-        start_time = format_time_srt(segment.start)
-        end_time = format_time_srt(segment.end)
-        
-        lines.append(f"{i}")
-        lines.append(f"{start_time} --> {end_time}")
-        
-        if word_timestamps and segment.words:
-            # Include word-level information in SRT
-            text_with_words = ""
-            for word in segment.words:
-                text_with_words += f"{word.word} "
-            lines.append(text_with_words.strip())
-        else:
-            lines.append(segment.text.strip())
-        lines.append("")
-    
-    content = "\n".join(lines)
-    
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
-    else:
-        print(content)
+    write_segments(segments, "srt", output_file, word_timestamps=word_timestamps)
 
 
 def format_as_vtt(segments, output_file: Optional[str] = None, word_timestamps: bool = False):
     """Format transcription segments as WebVTT."""
-    lines = ["WEBVTT", ""]
-    
-    for segment in segments:
-        start_time = format_time_vtt(segment.start)
-        end_time = format_time_vtt(segment.end)
-        
-        lines.append(f"{start_time} --> {end_time}")
-        
-        if word_timestamps and segment.words:
-            # Include word-level information in VTT
-            text_with_words = ""
-            for word in segment.words:
-                word_start = format_time_vtt(word.start)
-                word_end = format_time_vtt(word.end)
-                text_with_words += f"<{word_start}>{word.word}</{word_end}> "
-            lines.append(text_with_words.strip())
-        else:
-            lines.append(segment.text.strip())
-        lines.append("")
-    
-    content = "\n".join(lines)
-    
-    if output_file:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
-    else:
-        print(content)
+    write_segments(segments, "vtt", output_file, word_timestamps=word_timestamps)
+
+
+def format_as_text(segments, output_file: str, show_confidence: bool = False, show_words: bool = False):
+    """Write transcription segments as timestamped plain text."""
+    write_segments(segments, "text", output_file, show_confidence=show_confidence, show_words=show_words)
 
 
 def format_time_srt(seconds: float) -> str:
     """Format time for SRT format (HH:MM:SS,mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+    return format_timestamp(seconds, ",")
 
 
 def format_time_vtt(seconds: float) -> str:
     """Format time for VTT format (HH:MM:SS.mmm)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    milliseconds = int((seconds % 1) * 1000)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{milliseconds:03d}"
+    return format_timestamp(seconds, ".")
+
+
+AUDIO_EXTENSIONS = {
+    ".wav", ".mp3", ".flac", ".ogg", ".opus", ".m4a", ".aac",
+    ".wma", ".webm", ".mp4", ".mkv", ".aiff", ".aif",
+}
+
+OUTPUT_EXTENSIONS = {name: writer.extension for name, writer in WRITERS.items()}
+OUTPUT_EXTENSIONS["bin"] = ".bin"
+
+
+def collect_audio_files(inputs: List[str], recursive: bool = False) -> Tuple[List[Path], List[str]]:
+    """
+    Expand files, directories and glob patterns into a list of audio files.
+    
+    Returns the audio files in input order without duplicates, and the inputs
+    that matched nothing.
+    """
+    files = []
+    missing = []
+    
+    for item in inputs:
+        if any(char in item for char in "*?["):
+            matches = [Path(match) for match in sorted(glob.glob(item, recursive=True))]
+            matches = [match for match in matches if match.is_file()]
+        else:
+            path = Path(item)
+            if path.is_dir():
+                candidates = path.rglob("*") if recursive else path.iterdir()
+                matches = sorted(
+                    candidate for candidate in candidates
+                    if candidate.is_file() and candidate.suffix.lower() in AUDIO_EXTENSIONS
+                )
+            elif path.exists():
+                matches = [path]
+            else:
+                matches = []
+        
+        if not matches:
+            missing.append(item)
+        files.extend(matches)
+    
+    seen = set()
+    unique = []
+    for path in files:
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique, missing
+
+
+def output_path_for(
+    audio_path: Path,
+    output_format: str,
+    output_dir: Optional[str],
+    root: Optional[Path] = None
+) -> Path:
+    """
+    Return the per-file output path for an input in batch mode.
+    
+    Under output_dir, the input's directory relative to root is kept, so that
+    inputs with the same name in different directories get different outputs.
+    """
+    if not output_dir:
+        directory = audio_path.parent
+    elif root is not None:
+        directory = Path(output_dir) / Path(os.path.abspath(audio_path.parent)).relative_to(root)
+    else:
+        directory = Path(output_dir)
+    return directory / (audio_path.stem + OUTPUT_EXTENSIONS[output_format])
+
+
+def output_paths_for(audio_files: List[Path], output_format: str, output_dir: Optional[str]) -> List[Path]:
+    """
+    Return the output path of every input in batch mode.
+    
+    Under output_dir, inputs keep their directories relative to the deepest
+    directory they all share (a/x.wav and b/x.wav give out/a/x.srt and
+    out/b/x.srt).
+    
+    Raises:
+        ValueError: If inputs still share an output, e.g. x.wav and x.mp3 in one directory
+    """
+    root = None
+    if output_dir and audio_files:
+        root = Path(os.path.commonpath([os.path.abspath(path.parent) for path in audio_files]))
+    paths = [output_path_for(path, output_format, output_dir, root) for path in audio_files]
+    
+    inputs_by_output = {}
+    for audio_path, output_path in zip(audio_files, paths):
+        inputs_by_output.setdefault(os.path.abspath(output_path), []).append(str(audio_path))
+    collisions = [
+        f"{output_path} <- {', '.join(inputs)}"
+        for output_path, inputs in inputs_by_output.items() if len(inputs) > 1
+    ]
+    if collisions:
+        raise ValueError("several inputs would write the same output:\n  " + "\n  ".join(collisions))
+    return paths
+
+
+def transcribe_params(args: argparse.Namespace) -> dict:
+    """Transcription parameters from the command line."""
+    return dict(
+        beam_size=args.beam_size,
+        language=args.language,
+        word_timestamps=args.word_timestamps,
+        temperature=args.temperature,
+        compression_ratio_threshold=args.compression_ratio_threshold,
+        log_prob_threshold=args.log_prob_threshold,
+        no_speech_threshold=args.no_speech_threshold,
+        initial_prompt=args.initial_prompt,
+        hotwords=args.hotwords,
+        task=args.task,
+        batch_size=args.batch_size
+    )
+
+
+def transcribe_audio(transcriber: "PingalaTranscriber", audio_path: Path, args: argparse.Namespace, stream: bool = False):
+    """
+    Transcribe one file with the options from the command line.
+    
+    With stream=True the segments may be a lazy iterator that decodes while
+    it is consumed (not with --vad or the result cache).
+    """
+    params = transcribe_params(args)
+    
+    # Choose transcription method based on options
+    if args.vad:
+        return transcriber.transcribe_with_vad(str(audio_path), **params)
+    if stream and transcriber.cache is None:
+        return transcriber.transcribe_stream(str(audio_path), **params)
+    return transcriber.transcribe_file(str(audio_path), **params)
+
+
+def write_output(segments, output_file: Optional[str], args: argparse.Namespace, info=None) -> int:
+    """
+    Write segments in the selected format to a file, or to stdout if output_file is None.
+    
+    Segments are written as they are consumed, so a lazy iterator is streamed.
+    Returns the number of segments written.
+    """
+    if args.format == "bin":
+        from .result import TranscriptResult
+        from .serialization import save_transcript
+        
+        result = TranscriptResult.from_segments(segments, info)
+        save_transcript(output_file, result)
+        return len(result)
+    
+    options = {"word_timestamps": args.word_timestamps}
+    if args.format == "text":
+        options.update(show_confidence=args.show_confidence, show_words=args.show_words)
+        if output_file is None:
+            options["time_width"] = 6  # Aligned columns on the terminal
+    if output_file is None:
+        options["flush"] = True
+    return write_segments(segments, args.format, output_file, info=info, **options)
+
+
+def run_batch(transcriber: Optional["PingalaTranscriber"], audio_files: List[Path], args: argparse.Namespace, pool=None) -> int:
+    """
+    Transcribe many files with one loaded model and a pool of worker threads,
+    or with a ProcessPoolTranscriber if pool is given.
+    
+    Returns the number of files that failed.
+    """
+    sink = None
+    if args.sink:
+        from .sinks import open_sink
+        
+        try:
+            sink = open_sink(args.sink, batch_size=args.sink_batch_size)
+        except (ValueError, RuntimeError, OSError) as e:
+            print(f"Error opening sink: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    if sink is not None:
+        output_paths = [Path(args.sink)] * len(audio_files)
+    else:
+        try:
+            output_paths = output_paths_for(audio_files, args.format, args.output_dir)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    
+    jobs = []
+    skipped = 0
+    for audio_path, output_path in zip(audio_files, output_paths):
+        if sink is not None:
+            if str(audio_path) in sink:
+                skipped += 1
+                if args.verbose:
+                    print(f"Skipping {audio_path}: already in {args.sink}")
+                continue
+        elif args.output_dir:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+        if sink is None and args.skip_existing and output_path.exists():
+            skipped += 1
+            if args.verbose:
+                print(f"Skipping {audio_path}: {output_path} exists")
+            continue
+        jobs.append((audio_path, output_path))
+    
+    lock = threading.Lock()
+    stats = {"done": 0, "failed": 0, "audio_seconds": 0.0}
+    
+    def record(job, result):
+        audio_path, output_path = job
+        try:
+            if isinstance(result, Exception):
+                raise result
+            segments, info = result
+            if sink is not None:
+                sink.write(str(audio_path), segments, info)
+            else:
+                write_output(segments, str(output_path), args, info)
+        except Exception as e:
+            with lock:
+                stats["failed"] += 1
+            print(f"Error processing '{audio_path}': {e}", file=sys.stderr)
+            return
+        
+        with lock:
+            stats["done"] += 1
+            stats["audio_seconds"] += info.duration
+            if args.verbose:
+                print(f"[{stats['done'] + stats['failed']}/{len(jobs)}] {audio_path} -> {output_path} "
+                      f"({info.duration:.1f}s, {info.language})")
+    
+    def process(job):
+        try:
+            result = transcribe_audio(transcriber, job[0], args)
+        except Exception as e:
+            result = e
+        record(job, result)
+    
+    start_time = time.perf_counter()
+    try:
+        if pool is not None:
+            results = pool.transcribe_files(
+                (str(audio_path) for audio_path, _ in jobs),
+                use_vad=args.vad,
+                return_exceptions=True,
+                **transcribe_params(args)
+            )
+            for job, result in zip(jobs, results):
+                record(job, result)
+        elif args.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                list(executor.map(process, jobs))
+        else:
+            for job in jobs:
+                process(job)
+    finally:
+        # Flushes the last partial batch, also when interrupted, so a rerun resumes after it
+        if sink is not None:
+            sink.close()
+    elapsed = time.perf_counter() - start_time
+    
+    speed = stats["audio_seconds"] / elapsed if elapsed > 0 else 0.0
+    print(
+        f"Processed {stats['done']} files ({stats['failed']} failed, {skipped} skipped): "
+        f"{stats['audio_seconds']:.1f}s of audio in {elapsed:.1f}s "
+        f"({speed:.1f}x real time, {stats['done'] / elapsed if elapsed > 0 else 0.0:.2f} files/s)",
+        file=sys.stderr
+    )
+    if transcriber is not None and transcriber.silence_gate is not None:
+        silence = transcriber.silence_gate.stats()
+        print(
+            f"Silence gate skipped {silence['files_skipped']} files and {silence['windows_skipped']} windows "
+            f"({silence['seconds_skipped']:.1f}s of audio)",
+            file=sys.stderr
+        )
+    return stats["failed"]
 
 
 def main():
     """Main entry point for the CLI."""
+    if sys.argv[1:2] == ["serve"]:
+        from .server import main as serve_main
+        serve_main(sys.argv[2:])
+        return
+    
     parser = create_parser()
     args = parser.parse_args()
     
-    # Check if audio file exists
-    audio_path = Path(args.audio_file)
-    if not audio_path.exists():
-        print(f"Error: Audio file '{args.audio_file}' not found.", file=sys.stderr)
+    # Expand inputs and check that they exist
+    audio_files, missing = collect_audio_files(args.audio_files, args.recursive)
+    for item in missing:
+        print(f"Error: Audio file '{item}' not found.", file=sys.stderr)
+    if missing or not audio_files:
+        sys.exit(1)
+    
+    if args.sink and args.output:
+        print("Error: --sink and --output are exclusive.", file=sys.stderr)
+        sys.exit(1)
+    batch_mode = len(audio_files) > 1 or args.output_dir is not None or args.sink is not None
+    if batch_mode and args.output:
+        print("Error: --output takes a single input; use --output-dir for several files.", file=sys.stderr)
+        sys.exit(1)
+    if args.format == "bin" and not batch_mode and not args.output:
+        print("Error: --format bin writes a file; use --output or --output-dir.", file=sys.stderr)
         sys.exit(1)
+    if args.workers < 1 or args.processes < 1:
+        print("Error: --workers and --processes must be at least 1.", file=sys.stderr)
+        sys.exit(1)
+    
+    device_index = args.device_index[0] if len(args.device_index) == 1 else args.device_index
+    
+    # Several inputs on several processes: each worker loads its own model
+    if batch_mode and args.processes > 1 and not args.detect_language:
+        from .parallel import ProcessPoolTranscriber
+        
+        try:
+            pool = ProcessPoolTranscriber(
+                num_workers=args.processes,
+                cpu_threads=args.cpu_threads or None,
+                model_name=args.model,
+                # One model per worker would crowd a single GPU, so "auto" means CPU here
+                device="cpu" if args.device == "auto" else args.device,
+                compute_type=args.compute_type,
+                backend=args.backend,
+                device_index=device_index,
+                download_root=args.download_root,
+                silence_threshold_db=args.silence_threshold
+            )
+        except Exception as e:
+            print(f"Error starting worker processes: {e}", file=sys.stderr)
+            sys.exit(1)
+        with pool:
+            failed = run_batch(None, audio_files, args, pool=pool)
+        if failed:
+            sys.exit(1)
+        return
+    
+    from .cache import default_cache_dir
+    from .transcriber import PingalaTranscriber
     
     # Initialize transcriber
     try:
@@ -302,11 +725,22 @@ def main():
             print(f"  Device: {args.device}")
             print(f"  Compute type: {args.compute_type}")
         
+        cache_dir = args.cache_dir
+        if args.cache and not cache_dir:
+            cache_dir = default_cache_dir()
+        
         transcriber = PingalaTranscriber(
             model_name=args.model,
             device=args.device,
             compute_type=args.compute_type,
-            backend=args.backend
+            backend=args.backend,
+            cache_dir=cache_dir,
+            cache_max_size=args.cache_size * 1024 * 1024,
+            cpu_threads=args.cpu_threads,
+            num_workers=args.num_workers or args.workers,
+            device_index=device_index,
+            download_root=args.download_root,
+            silence_threshold_db=args.silence_threshold
         )
         
         if args.verbose:
@@ -315,6 +749,7 @@ def main():
             print(f"    Backend: {model_info.get('backend', 'unknown')}")
             print(f"    Model: {model_info.get('model_name', 'unknown')}")
             print(f"    Device: {model_info.get('device', 'unknown')}")
+            print(f"    Compute type: {model_info.get('compute_type', 'unknown')}")
         
     except Exception as e:
         print(f"Error initializing transcriber: {e}", file=sys.stderr)
@@ -326,64 +761,56 @@ def main():
     
     # Language detection only
     if args.detect_language:
-        try:
-            if args.verbose:
-                print(f"Detecting language for: {args.audio_file}")
-            
-            info = transcriber.detect_language(str(audio_path))
-            
-            print(f"Detected language: {info.language}")
-            print(f"Confidence: {info.language_probability:.3f}")
-            print(f"Duration: {info.duration:.2f} seconds")
-            print(f"Duration after VAD: {info.duration_after_vad:.2f} seconds")
-            
-        except Exception as e:
-            print(f"Error during language detection: {e}", file=sys.stderr)
-            sys.exit(1)
+        failed = False
+        for audio_path in audio_files:
+            try:
+                if args.verbose:
+                    print(f"Detecting language for: {audio_path}")
+                
+                info = transcriber.detect_language(
+                    str(audio_path),
+                    max_duration=args.detect_duration,
+                    vad_filter=args.detect_vad,
+                    top_k=args.top_languages
+                )
+                
+                if len(audio_files) > 1:
+                    print(f"{audio_path}:")
+                print(f"Detected language: {info.language}")
+                print(f"Confidence: {info.language_probability:.3f}")
+                print(f"Duration: {info.duration:.2f} seconds")
+                print(f"Duration after VAD: {info.duration_after_vad:.2f} seconds")
+                if info.all_language_probs:
+                    print("Top languages: " + ", ".join(
+                        f"{language} ({probability:.3f})" for language, probability in info.all_language_probs
+                    ))
+                
+            except Exception as e:
+                print(f"Error during language detection: {e}", file=sys.stderr)
+                if len(audio_files) == 1:
+                    sys.exit(1)
+                failed = True
         
+        if failed:
+            sys.exit(1)
+        return
+    
+    # Several inputs: one model, a worker pool and one output file per input
+    if batch_mode:
+        if run_batch(transcriber, audio_files, args):
+            sys.exit(1)
         return
     
-    # Transcribe audio
+    audio_path = audio_files[0]
+    
+    # Transcribe audio; segments are written as they are decoded
     try:
         if args.verbose:
-            print(f"Transcribing audio file: {args.audio_file}")
+            print(f"Transcribing audio file: {audio_path}")
             print(f"Parameters: beam_size={args.beam_size}, language={args.language}")
             print(f"Word timestamps: {args.word_timestamps}, VAD: {args.vad}")
         
-        # Choose transcription method based on options
-        if args.vad:
-            segments, info = transcriber.transcribe_with_vad(
-                str(audio_path),
-                beam_size=args.beam_size,
-                language=args.language,
-                word_timestamps=args.word_timestamps,
-                temperature=args.temperature,
-                compression_ratio_threshold=args.compression_ratio_threshold,
-                log_prob_threshold=args.log_prob_threshold,
-                no_speech_threshold=args.no_speech_threshold,
-                initial_prompt=args.initial_prompt,
-                hotwords=args.hotwords,
-                task=args.task
-            )
-        else:
-            segments, info = transcriber.transcribe_file(
-                str(audio_path),
-                beam_size=args.beam_size,
-                language=args.language,
-                word_timestamps=args.word_timestamps,
-                temperature=args.temperature,
-                compression_ratio_threshold=args.compression_ratio_threshold,
-                log_prob_threshold=args.log_prob_threshold,
-                no_speech_threshold=args.no_speech_threshold,
-                initial_prompt=args.initial_prompt,
-                hotwords=args.hotwords,
-                task=args.task
-            )
-        
-        if args.verbose:
-            print(f"Transcription completed. Found {len(segments)} segments.")
-            print(f"Language: {info.language} (confidence: {info.language_probability:.3f})")
-            print(f"Audio duration: {info.duration:.2f}s")
+        segments, info = transcribe_audio(transcriber, audio_path, args, stream=True)
         
     except Exception as e:
         print(f"Error during transcription: {e}", file=sys.stderr)
@@ -391,32 +818,22 @@ def main():
     
     # Output results
     try:
-        if args.format == "srt":
-            format_as_srt(segments, args.output, args.word_timestamps)
-        elif args.format == "vtt":
-            format_as_vtt(segments, args.output, args.word_timestamps)
-        else:  # text format
-            if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    for segment in segments:
-                        confidence_str = f" (conf: {segment.confidence:.3f})" if args.show_confidence and segment.confidence else ""
-                        f.write(f"[{segment.start:.2f}s -> {segment.end:.2f}s]{confidence_str} {segment.text}\n")
-                        
-                        if args.show_words and segment.words:
-                            f.write("  Words: ")
-                            for word in segment.words:
-                                f.write(f"{word.word}[{word.start:.1f}-{word.end:.1f}]({word.probability:.2f}) ")
-                            f.write("\n")
-            else:
-                transcriber.print_transcription(segments, args.show_confidence, args.show_words)
+        count = write_output(segments, args.output, args, info)
         
-        if args.verbose and args.output:
-            print(f"Transcription saved to: {args.output}")
+        if args.verbose:
+            print(f"Transcription completed. Found {count} segments.")
+            print(f"Language: {info.language} (confidence: {info.language_probability:.3f})")
+            print(f"Audio duration: {info.duration:.2f}s")
+            if args.output:
+                print(f"Transcription saved to: {args.output}")
             
-    except Exception as e:
+    except OSError as e:
         print(f"Error saving output: {e}", file=sys.stderr)
         sys.exit(1)
+    except Exception as e:
+        print(f"Error during transcription: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
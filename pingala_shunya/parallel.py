@@ -0,0 +1,177 @@
+"""
+Multi-process transcription for Pingala Shunya.
+Shards files across worker processes that each hold their own model.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import heapq
+import multiprocessing
+import os
+
+from .audio import AudioInput, probe_duration
+from .transcriber import PingalaTranscriber, TranscriptionSegment, TranscriptionInfo, available_cpu_count
+
+# Model of the current worker process, loaded once by _init_worker
+_worker_transcriber: Optional[PingalaTranscriber] = None
+
+
+def _init_worker(transcriber_kwargs: Dict[str, Any], cpu_threads: int):
+    """Load the worker's model with its share of the CPU threads."""
+    global _worker_transcriber
+
+    # Inherited by OpenMP-based libraries the worker imports
+    os.environ["OMP_NUM_THREADS"] = str(cpu_threads)
+    _worker_transcriber = PingalaTranscriber(**transcriber_kwargs)
+
+
+def _transcribe_in_worker(
+    audio_path: AudioInput,
+    use_vad: bool,
+    params: Dict[str, Any]
+) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
+    if use_vad:
+        return _worker_transcriber.transcribe_with_vad(audio_path, **params)
+    return _worker_transcriber.transcribe_file(audio_path, **params)
+
+
+class ProcessPoolTranscriber:
+    """
+    Pool of worker processes, each with its own copy of the model.
+
+    One model instance rarely keeps a many-core CPU busy, and converting
+    segments in Python is serialized by the GIL. The pool starts num_workers
+    processes (spawned, so no CUDA or thread state is inherited) and gives each
+    cpu_threads inference threads, by default an even share of the cores.
+    Files are probed as they enter a bounded lookahead window and dispatched
+    longest first within it, so that one long recording doesn't end up last on
+    an otherwise idle pool. Results are yielded in input order.
+
+    Example:
+        with ProcessPoolTranscriber(num_workers=8, model_name="shunyalabs/pingala-v1-en-verbatim",
+                                    device="cpu", compute_type="int8") as pool:
+            for segments, info in pool.transcribe_files(paths, language="en"):
+                ...
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+        **transcriber_kwargs
+    ):
+        """
+        Start the worker processes; each loads its model before taking work.
+
+        Args:
+            num_workers (int, optional): Worker processes. Defaults to one per 4 CPU cores.
+            cpu_threads (int, optional): Inference threads per worker. Defaults to the
+                CPU cores divided evenly between the workers.
+            **transcriber_kwargs: PingalaTranscriber arguments (model_name, device, compute_type, backend, ...)
+        """
+        cpu_count = available_cpu_count()
+        self.num_workers = num_workers or max(1, cpu_count // 4)
+        if self.num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.cpu_threads = cpu_threads or max(1, cpu_count // self.num_workers)
+
+        transcriber_kwargs.setdefault("device", "cpu")
+        transcriber_kwargs.setdefault("compute_type", "int8")
+        transcriber_kwargs["cpu_threads"] = self.cpu_threads
+        self.transcriber_kwargs = transcriber_kwargs
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(transcriber_kwargs, self.cpu_threads)
+        )
+
+    def transcribe_files(
+        self,
+        audio_paths: Iterable[AudioInput],
+        use_vad: bool = False,
+        return_exceptions: bool = False,
+        lookahead: Optional[int] = None,
+        **kwargs
+    ) -> Iterator[Union[Tuple[List[TranscriptionSegment], TranscriptionInfo], Exception]]:
+        """
+        Transcribe files on the worker processes and yield results in input order.
+
+        At most lookahead files past the next result are probed, queued or held
+        as finished results, so memory and start-up time don't grow with the
+        corpus, and audio_paths may be a lazy iterable. Up to twice num_workers
+        files are submitted to the pool at a time, the longest first.
+
+        Args:
+            audio_paths (Iterable[AudioInput]): Paths, or picklable in-memory audio
+            use_vad (bool): Use transcribe_with_vad instead of transcribe_file (default: False)
+            return_exceptions (bool): Yield a file's exception in place of its result
+                instead of raising it (default: False)
+            lookahead (int, optional): Files in flight ahead of the next result
+                (default: 4 per worker)
+            **kwargs: Transcription parameters (see PingalaTranscriber.transcribe_file)
+
+        Yields:
+            Tuple[List[TranscriptionSegment], TranscriptionInfo]: Segments and info per file
+        """
+        lookahead = lookahead or 4 * self.num_workers
+        if lookahead < 1:
+            raise ValueError("lookahead must be at least 1")
+
+        sources = enumerate(audio_paths)
+        exhausted = False
+        # Probed files waiting for a worker, longest first: (-duration, index, audio)
+        ready: List[Tuple[float, int, AudioInput]] = []
+        # Submitted files whose results haven't been yielded yet
+        futures: Dict[int, Any] = {}
+        next_index = 0
+
+        try:
+            while True:
+                while not exhausted and len(ready) + len(futures) < lookahead:
+                    item = next(sources, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, audio_path = item
+                    heapq.heappush(ready, (-probe_duration(audio_path), index, audio_path))
+
+                # Only as much work as the pool starts soon, so later, longer files can still go first
+                running = sum(not future.done() for future in futures.values())
+                while ready and running < 2 * self.num_workers:
+                    _, index, audio_path = heapq.heappop(ready)
+                    futures[index] = self._executor.submit(_transcribe_in_worker, audio_path, use_vad, kwargs)
+                    running += 1
+
+                future = futures.pop(next_index, None)
+                if future is None:
+                    if not ready:
+                        return
+                    # The next file is still queued behind longer ones: wait for a worker
+                    wait([f for f in futures.values() if not f.done()], return_when=FIRST_COMPLETED)
+                    continue
+
+                next_index += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    result = e
+                yield result
+        finally:
+            # Stop work nobody will collect if the caller stops iterating early
+            for future in futures.values():
+                future.cancel()
+
+    def close(self):
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ProcessPoolTranscriber":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,160 @@
+"""
+Process-wide model registry for Pingala Shunya.
+Shares loaded models between transcribers with the same configuration.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+
+
+class _RegistryEntry:
+    """A loaded model with its reference count and estimated size."""
+
+    def __init__(self, model: Any, size: int):
+        self.model = model
+        self.size = size
+        self.refcount = 0
+
+
+class ModelRegistry:
+    """
+    Reference-counted store of loaded models keyed by their configuration.
+
+    Transcribers acquire a model by key and release it when closed. Models that
+    are still referenced are never evicted. Released models stay resident while
+    the total estimated size fits in max_memory_bytes and are evicted least
+    recently used first; without a budget they are dropped as soon as the last
+    reference is released.
+
+    Models load outside the registry lock, so different models load in
+    parallel; concurrent requests for a model that is loading wait for that
+    load instead of starting another.
+    """
+
+    def __init__(self, max_memory_bytes: Optional[int] = None):
+        self.max_memory_bytes = max_memory_bytes
+        self._entries: "OrderedDict[Hashable, _RegistryEntry]" = OrderedDict()
+        # Loads in progress; the future completes once the model is resident
+        self._loading: Dict[Hashable, Future] = {}
+        self._lock = threading.RLock()
+
+    def acquire(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        size_fn: Optional[Callable[[Any], int]] = None
+    ) -> Any:
+        """
+        Return the model for key, loading it with loader() if it isn't resident.
+
+        Args:
+            key (Hashable): Model configuration, e.g. (backend, model, device, compute_type)
+            loader (Callable): Loads and returns the model
+            size_fn (Callable, optional): Estimates the resident size of a loaded model in bytes
+
+        Returns:
+            Any: The shared model object
+
+        Raises:
+            Exception: Whatever loader() raised, also in threads that waited for that load
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return self._reference(key, entry)
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = Future()
+                    break
+            # Another thread is loading this model; once it's resident, take a reference
+            loading.result()
+
+        try:
+            model = loader()
+            size = size_fn(model) if size_fn else 0
+        except Exception as e:
+            with self._lock:
+                del self._loading[key]
+            loading.set_exception(e)
+            raise
+        except BaseException:
+            # Interrupted: let a waiting thread load the model itself
+            with self._lock:
+                del self._loading[key]
+            loading.set_result(None)
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            entry = self._entries[key] = _RegistryEntry(model, size)
+            model = self._reference(key, entry)
+        loading.set_result(None)
+        return model
+
+    def release(self, key: Hashable):
+        """Drop one reference to the model for key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            self._evict()
+
+    def set_memory_budget(self, max_memory_bytes: Optional[int]):
+        """Change the memory budget for idle models and evict down to it."""
+        with self._lock:
+            self.max_memory_bytes = max_memory_bytes
+            self._evict()
+
+    def clear(self):
+        """Evict every model that is no longer referenced."""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.refcount == 0]:
+                del self._entries[key]
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated bytes held by all resident models."""
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Describe resident models, least recently used first."""
+        with self._lock:
+            return [
+                {"key": key, "refcount": entry.refcount, "size": entry.size}
+                for key, entry in self._entries.items()
+            ]
+
+    def _reference(self, key: Hashable, entry: _RegistryEntry) -> Any:
+        """Count a new reference to a resident model; called with the lock held."""
+        self._entries.move_to_end(key)
+        entry.refcount += 1
+        self._evict()
+        return entry.model
+
+    def _evict(self):
+        """Evict idle models, least recently used first, until within budget."""
+        idle = [key for key, entry in self._entries.items() if entry.refcount == 0]
+        if self.max_memory_bytes is None:
+            for key in idle:
+                del self._entries[key]
+            return
+
+        usage = sum(entry.size for entry in self._entries.values())
+        for key in idle:
+            if usage <= self.max_memory_bytes:
+                break
+            usage -= self._entries.pop(key).size
+
+
+_default_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide registry used by PingalaTranscriber."""
+    return _default_registry
@@ -0,0 +1,226 @@
+"""
+Dynamic micro-batching for Pingala Shunya backends.
+Collects 30 second windows from concurrent callers into shared forward passes.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+import json
+import threading
+import time
+
+from .audio import AudioInput, WINDOW_SAMPLES
+from .transcriber import (
+    TranscriptionBackend,
+    TranscriptionSegment,
+    TranscriptionInfo,
+    _build_transcribe_params,
+    _transcribe_batched,
+)
+
+
+class _WindowRequest:
+    """One window waiting for a batch, with the future its caller blocks on."""
+
+    __slots__ = ("window", "language", "arrival", "future")
+
+    def __init__(self, window: Any, language: Optional[str]):
+        self.window = window
+        self.language = language
+        self.arrival = time.monotonic()
+        self.future: Future = Future()
+
+
+class BatchScheduler:
+    """
+    Groups windows submitted by concurrent callers into batched backend calls.
+
+    Callers use detect_language_windows() and decode_windows() as if they were
+    talking to the backend; each call blocks until its windows have been run.
+    A single worker thread waits until max_batch_size windows with the same
+    decoding options are queued, or until the oldest has waited max_wait_ms,
+    and then runs them in one forward pass. A larger max_wait_ms trades latency
+    for fuller batches; max_wait_ms=0 runs whatever is queued immediately.
+
+    The worker is the only thread that calls the backend, so the backend is
+    never used concurrently through the scheduler.
+    """
+
+    def __init__(self, backend: TranscriptionBackend, max_batch_size: int = 8, max_wait_ms: float = 10.0):
+        """
+        Start a scheduler in front of a loaded backend.
+
+        Args:
+            backend (TranscriptionBackend): Backend implementing detect_language_windows() and decode_windows()
+            max_batch_size (int): Most windows run in one forward pass (default: 8)
+            max_wait_ms (float): Longest time a window waits for the batch to fill (default: 10)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        # Queued windows grouped by operation and decoding options
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()
+        self._options: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._batches = 0
+        self._windows = 0
+
+        self._worker = threading.Thread(target=self._run, name="pingala-batch-scheduler", daemon=True)
+        self._worker.start()
+
+    def detect_language_windows(self, windows: List[Any]) -> List[List[Tuple[str, float]]]:
+        """Return sorted (language, probability) pairs for each window, batched with other callers."""
+        return self._submit("detect", {}, windows, [None] * len(windows))
+
+    def decode_windows(
+        self,
+        windows: List[Any],
+        languages: List[Optional[str]],
+        task: str = "transcribe",
+        beam_size: int = 5,
+        **kwargs
+    ) -> List[TranscriptionSegment]:
+        """Decode windows, batched with other callers that use the same decoding options."""
+        options = dict(kwargs, task=task, beam_size=beam_size)
+        return self._submit("decode", options, windows, languages)
+
+    def transcribe(
+        self,
+        audio: AudioInput,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        **kwargs
+    ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
+        """
+        Transcribe decoded audio window by window through the shared batches.
+
+        Args:
+            audio (AudioInput): Audio accepted by the backend's load_audio()
+            beam_size (int): Beam size for decoding (default: 5)
+            language (str, optional): Language code (e.g., "en"). Detected if None.
+            task (str): Task type - "transcribe" or "translate" (default: "transcribe")
+            **kwargs: Additional transcription parameters (see PingalaTranscriber.transcribe_batch)
+
+        Returns:
+            Tuple[List[TranscriptionSegment], TranscriptionInfo]: One segment per 30 second window and info
+        """
+        params = _build_transcribe_params(beam_size=beam_size, language=language, task=task, **kwargs)
+        params.pop("batch_size")
+        params.pop("word_timestamps")
+
+        samples = self.backend.load_audio(audio)
+        # Submit every window at once; the scheduler splits them into batches
+        num_windows = max(1, -(-len(samples) // WINDOW_SAMPLES))
+        return next(_transcribe_batched(self, [samples], batch_size=num_windows, **params))
+
+    def stats(self) -> Dict[str, Any]:
+        """Batches run, windows processed, mean batch size and windows still queued."""
+        with self._condition:
+            queued = sum(len(queue) for queue in self._queues.values())
+            return {
+                "batches": self._batches,
+                "windows": self._windows,
+                "mean_batch_size": self._windows / self._batches if self._batches else 0.0,
+                "queued_windows": queued,
+            }
+
+    def close(self):
+        """Finish queued windows and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not threading.current_thread():
+            self._worker.join()
+
+    def __enter__(self) -> "BatchScheduler":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _submit(self, operation: str, options: Dict[str, Any], windows: List[Any], languages: List[Optional[str]]) -> List[Any]:
+        """Queue windows and block until the worker has run all of them."""
+        key = operation + ":" + json.dumps(options, sort_keys=True, default=str)
+        requests = [_WindowRequest(window, language) for window, language in zip(windows, languages)]
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchScheduler is closed")
+            self._options.setdefault(key, (operation, options))
+            self._queues.setdefault(key, deque()).extend(requests)
+            self._condition.notify_all()
+
+        return [request.future.result() for request in requests]
+
+    def _next_batch(self) -> Optional[Tuple[str, Dict[str, Any], List[_WindowRequest]]]:
+        """Wait for a full batch or the oldest window's deadline, then dequeue a batch."""
+        with self._condition:
+            while True:
+                if not self._queues:
+                    if self._closed:
+                        return None
+                    self._condition.wait()
+                    continue
+
+                # Prefer a full batch; otherwise the group holding the oldest window
+                full = [queue_key for queue_key, queue in self._queues.items() if len(queue) >= self.max_batch_size]
+                key = full[0] if full else min(self._queues, key=lambda queue_key: self._queues[queue_key][0].arrival)
+                queue = self._queues[key]
+                deadline = queue[0].arrival + self.max_wait_ms / 1000.0
+                remaining = deadline - time.monotonic()
+                if len(queue) < self.max_batch_size and remaining > 0 and not self._closed:
+                    self._condition.wait(remaining)
+                    continue
+
+                batch = [queue.popleft() for _ in range(min(self.max_batch_size, len(queue)))]
+                operation, options = self._options[key]
+                if not queue:
+                    del self._queues[key]
+                    del self._options[key]
+                return operation, options, batch
+
+    def _run(self):
+        """Worker loop: run batches until closed and drained."""
+        while True:
+            item = self._next_batch()
+            if item is None:
+                return
+            operation, options, batch = item
+
+            try:
+                windows = [request.window for request in batch]
+                if operation == "detect":
+                    results = self.backend.detect_language_windows(windows)
+                else:
+                    results = self.backend.decode_windows(
+                        windows,
+                        [request.language for request in batch],
+                        **options
+                    )
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            with self._condition:
+                self._batches += 1
+                self._windows += len(batch)
+            for request, result in zip(batch, results):
+                request.future.set_result(result)
+            # Callers whose window got no result would otherwise wait forever
+            if len(results) != len(batch):
+                error = RuntimeError(
+                    f"Backend returned {len(results)} results for a batch of {len(batch)} windows"
+                )
+                for request in batch[len(results):]:
+                    request.future.set_exception(error)
@@ -0,0 +1,188 @@
+"""
+Binary transcript files for Pingala Shunya.
+Stores a TranscriptResult's columns in a versioned layout that loads with mmap.
+Times, segment scores and word probabilities are float32, like TranscriptResult,
+so segments load back with these values rounded to about 7 significant digits.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Union
+import json
+import mmap
+import os
+import struct
+import threading
+
+from .result import TranscriptResult
+from .transcriber import TranscriptionInfo
+
+# File layout (integers little-endian):
+#   magic (4 bytes) | version (uint16) | flags (uint16, reserved) | header length (uint32)
+#   header: UTF-8 JSON with the info and the columns as {name, dtype, offset, count}
+#   data: the columns, at their offsets from the data start, each 8-byte aligned;
+#         the data starts at the first 8-byte boundary after the header
+MAGIC = b"PGTR"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGNMENT = 8
+
+# Stored columns and their on-disk dtypes; the text buffer is stored as UTF-8
+# and its offsets stay in characters, since the text is decoded on load
+_COLUMNS = {
+    "starts": "<f4",
+    "ends": "<f4",
+    "text_offsets": "<i8",
+    "avg_logprobs": "<f4",
+    "no_speech_probs": "<f4",
+    "compression_ratios": "<f4",
+    "temperatures": "<f4",
+    "word_offsets": "<i8",
+    "word_starts": "<f4",
+    "word_ends": "<f4",
+    "word_probabilities": "<f4",
+    "word_text_offsets": "<i8",
+    "text_buffer": "u1",
+}
+
+
+def dumps_transcript(result: TranscriptResult) -> bytes:
+    """Serialize a TranscriptResult to bytes in the transcript file format (see save_transcript)."""
+    import numpy as np
+
+    parts = []
+    columns = []
+    position = 0
+    for name, dtype in _COLUMNS.items():
+        if name == "text_buffer":
+            data = result.text_buffer.encode("utf-8")
+            count = len(data)
+        else:
+            array = np.ascontiguousarray(getattr(result, name), dtype=dtype)
+            data = array.tobytes()
+            count = len(array)
+        padding = _padding(position)
+        if padding:
+            parts.append(b"\0" * padding)
+            position += padding
+        columns.append({"name": name, "dtype": dtype, "offset": position, "count": count})
+        parts.append(data)
+        position += len(data)
+
+    header = json.dumps({
+        "info": result.info.to_dict() if result.info is not None else None,
+        "segments": len(result),
+        "words": result.word_count,
+        "columns": columns,
+    }, separators=(",", ":")).encode("utf-8")
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header))
+    return b"".join([preamble, header, b"\0" * _padding(len(preamble) + len(header))] + parts)
+
+
+def save_transcript(
+    path: Union[str, "os.PathLike[str]"],
+    transcript: Union[TranscriptResult, Iterable[Any]],
+    info: Optional[TranscriptionInfo] = None
+):
+    """
+    Write a transcript to a binary file.
+
+    Unlike the text formats, the file keeps every segment score and word
+    probability, stored as float32 like the times. It is written to a
+    temporary file and renamed into place, so readers never see a partial file.
+
+    Args:
+        path (str or PathLike): Destination file
+        transcript (TranscriptResult or Iterable): A result, or segments to pack into one
+        info (TranscriptionInfo, optional): Info for the segments (ignored for a TranscriptResult)
+    """
+    if not isinstance(transcript, TranscriptResult):
+        transcript = TranscriptResult.from_segments(transcript, info)
+
+    path = os.fspath(path)
+    # Unique per thread, so concurrent saves to one path never share a temporary file.
+    # A named file rather than mkstemp, which would create it readable by the owner only
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(dumps_transcript(transcript))
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def loads_transcript(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> TranscriptResult:
+    """
+    Read a transcript from a buffer in the transcript file format.
+
+    The numeric columns are NumPy views of the buffer, not copies; only the
+    text is decoded.
+
+    Args:
+        data (bytes-like): The file contents, e.g. from dumps_transcript() or a memory map
+
+    Returns:
+        TranscriptResult: Columnar segments and words with the transcription info
+
+    Raises:
+        ValueError: If the buffer is not a transcript file, is truncated or has a newer version
+    """
+    import numpy as np
+
+    if len(data) < _PREAMBLE.size:
+        raise ValueError("Not a Pingala transcript file: too short")
+    magic, version, _, header_length = _PREAMBLE.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a Pingala transcript file: bad magic bytes")
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Transcript file format version {version} is newer than the supported "
+            f"version {FORMAT_VERSION}; upgrade pingala-shunya to read it"
+        )
+
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(bytes(data[_PREAMBLE.size:header_end]).decode("utf-8"))
+    data_start = header_end + _padding(header_end)
+
+    columns: Dict[str, Any] = {}
+    for column in header["columns"]:
+        dtype = np.dtype(column["dtype"])
+        offset = data_start + column["offset"]
+        if offset + column["count"] * dtype.itemsize > len(data):
+            raise ValueError(f"Transcript file is truncated in column {column['name']}")
+        columns[column["name"]] = np.frombuffer(data, dtype=dtype, count=column["count"], offset=offset)
+
+    missing = set(_COLUMNS) - set(columns)
+    if missing:
+        raise ValueError(f"Transcript file is missing columns: {', '.join(sorted(missing))}")
+
+    text_buffer = columns.pop("text_buffer").tobytes().decode("utf-8")
+    info = TranscriptionInfo.from_dict(header["info"]) if header["info"] is not None else None
+    return TranscriptResult(text_buffer=text_buffer, info=info, **columns)
+
+
+def load_transcript(path: Union[str, "os.PathLike[str]"], use_mmap: bool = True) -> TranscriptResult:
+    """
+    Read a transcript file written by save_transcript().
+
+    With use_mmap, the file is memory-mapped and the timing and score columns
+    are read-only views of the mapping, paged in by the OS as they are read.
+    The mapping stays open as long as the result's arrays reference it.
+
+    Args:
+        path (str or PathLike): Transcript file
+        use_mmap (bool): Map the file instead of reading it into memory (default: True)
+
+    Returns:
+        TranscriptResult: Columnar segments and words with the transcription info
+    """
+    with open(path, "rb") as f:
+        if not use_mmap or os.fstat(f.fileno()).st_size == 0:
+            return loads_transcript(f.read())
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads_transcript(mapped)
+
+
+def _padding(position: int) -> int:
+    """Bytes needed to advance position to the next 8-byte boundary."""
+    return -position % _ALIGNMENT
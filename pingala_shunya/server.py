@@ -0,0 +1,322 @@
+"""
+Local HTTP/WebSocket transcription server for Pingala Shunya.
+Keeps one model warm and serves REST and streaming requests from a shared worker pool.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, List, Optional
+import argparse
+import io
+import json
+import sys
+
+from .async_transcriber import AsyncPingalaTranscriber
+from .streaming import StreamingSession, StreamingUpdate
+
+# Content types whose body is raw 16-bit little-endian mono PCM at 16 kHz
+PCM_CONTENT_TYPES = {"audio/pcm", "audio/l16", "audio/x-raw"}
+
+_BOOL_PARAMS = ("word_timestamps", "vad_filter")
+_INT_PARAMS = ("beam_size", "batch_size")
+_FLOAT_PARAMS = ("temperature", "no_speech_threshold", "log_prob_threshold", "compression_ratio_threshold")
+_STR_PARAMS = ("language", "task", "initial_prompt", "hotwords")
+
+
+def parse_request_params(values: Any) -> Dict[str, Any]:
+    """Convert query string or form values into transcription parameters."""
+    params = {}
+    for name in _STR_PARAMS:
+        if values.get(name):
+            params[name] = values[name]
+    for name in _INT_PARAMS:
+        if values.get(name):
+            params[name] = int(values[name])
+    for name in _FLOAT_PARAMS:
+        if values.get(name):
+            params[name] = float(values[name])
+    for name in _BOOL_PARAMS:
+        if values.get(name):
+            params[name] = str(values[name]).lower() in ("1", "true", "yes", "on")
+    return params
+
+
+class TranscriptionServer:
+    """
+    aiohttp application serving one warm model.
+
+    Endpoints:
+        GET  /health         Model info, queue depth and active requests
+        POST /v1/transcribe  One raw audio body, or several multipart "file" fields
+        GET  /v1/stream      WebSocket: binary 16 kHz 16-bit PCM chunks in, JSON segments out
+                             (committed and partial, see StreamingSession)
+
+    Every request goes through one AsyncPingalaTranscriber, so its concurrency
+    limit applies across REST and WebSocket clients. Requests arriving while
+    the queue is full get HTTP 503.
+    """
+
+    def __init__(self, transcriber: AsyncPingalaTranscriber, max_upload_size: int = 512 * 1024 * 1024):
+        self.transcriber = transcriber
+        self.max_upload_size = max_upload_size
+
+    def create_app(self) -> Any:
+        """Build the aiohttp web.Application."""
+        try:
+            from aiohttp import web
+        except ImportError:
+            raise RuntimeError("The server needs aiohttp. Install with: pip install 'pingala-shunya[server]'")
+
+        app = web.Application(client_max_size=self.max_upload_size)
+        app.router.add_get("/health", self.health)
+        app.router.add_post("/v1/transcribe", self.transcribe)
+        app.router.add_get("/v1/stream", self.stream)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    async def health(self, request: Any) -> Any:
+        from aiohttp import web
+
+        model_info = self.transcriber.transcriber.get_model_info()
+        return web.json_response({
+            "status": "ok",
+            "model": model_info,
+            "queue_depth": self.transcriber.queue_depth,
+            "active_requests": self.transcriber.active_requests,
+            "max_concurrency": self.transcriber.max_concurrency,
+            "max_queue_size": self.transcriber.max_queue_size,
+        }, dumps=_dumps)
+
+    async def transcribe(self, request: Any) -> Any:
+        from aiohttp import web
+        import asyncio
+
+        try:
+            params = parse_request_params(request.query)
+            inputs = []
+            if request.content_type.startswith("multipart/"):
+                form = await request.post()
+                params.update(parse_request_params(form))
+                for field in form.getall("file", []):
+                    if hasattr(field, "file"):
+                        inputs.append((field.filename, io.BytesIO(field.file.read())))
+            else:
+                body = await request.read()
+                if body:
+                    audio = body if request.content_type in PCM_CONTENT_TYPES else io.BytesIO(body)
+                    inputs.append((None, audio))
+        except ValueError as e:
+            return _error(400, f"Invalid request: {e}")
+
+        if not inputs:
+            return _error(400, "No audio in request: send an audio body or multipart 'file' fields")
+        if self._queue_full(len(inputs)):
+            return _error(503, "Transcription queue is full, retry later")
+
+        try:
+            results = await asyncio.gather(*[
+                self.transcriber.transcribe(audio, **params) for _, audio in inputs
+            ])
+        except (TypeError, ValueError) as e:
+            return _error(400, str(e))
+        except Exception as e:
+            return _error(500, str(e))
+
+        return web.json_response({
+            "results": [
+                {
+                    "filename": filename,
+                    "info": info.to_dict(),
+                    "segments": [segment.to_dict() for segment in segments],
+                }
+                for (filename, _), (segments, info) in zip(inputs, results)
+            ]
+        }, dumps=_dumps)
+
+    async def stream(self, request: Any) -> Any:
+        """
+        Transcribe a live PCM stream with a StreamingSession.
+
+        The client may first send a JSON text message with transcription
+        parameters, then binary 16-bit PCM chunks, and finally {"type": "end"}.
+        About every second of audio, words on which two consecutive hypotheses
+        agree are sent as {"type": "segment", ...}, and the rest, which later
+        messages may revise, as {"type": "partial", ...}. {"type": "done",
+        "info": ...} closes the stream.
+        """
+        from aiohttp import web, WSMsgType
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        params = parse_request_params(request.query)
+        state = _StreamState(self.transcriber)
+
+        async for message in ws:
+            if message.type == WSMsgType.BINARY:
+                try:
+                    await self._send_update(ws, await state.feed(message.data, params))
+                except Exception as e:
+                    await ws.send_json({"type": "error", "error": str(e)})
+                    break
+            elif message.type == WSMsgType.TEXT:
+                try:
+                    data = json.loads(message.data)
+                except ValueError:
+                    await ws.send_json({"type": "error", "error": "Text messages must be JSON"})
+                    continue
+                if data.get("type") == "end":
+                    try:
+                        await self._send_update(ws, await state.finish(params))
+                        await ws.send_json({"type": "done", "info": state.info()}, dumps=_dumps)
+                    except Exception as e:
+                        await ws.send_json({"type": "error", "error": str(e)})
+                    break
+                try:
+                    params.update(parse_request_params(data))
+                except ValueError as e:
+                    await ws.send_json({"type": "error", "error": f"Invalid parameters: {e}"})
+            elif message.type == WSMsgType.ERROR:
+                break
+
+        await ws.close()
+        return ws
+
+    async def _send_update(self, ws: Any, update: Any):
+        if update is None:
+            return
+        for segment in update.committed:
+            await ws.send_json({"type": "segment", "segment": segment.to_dict()}, dumps=_dumps)
+        if update.partial is not None:
+            await ws.send_json({"type": "partial", "segment": update.partial.to_dict()}, dumps=_dumps)
+
+    def _queue_full(self, requests: int) -> bool:
+        transcriber = self.transcriber
+        waiting = transcriber.queue_depth + transcriber.active_requests + requests
+        return waiting > transcriber.max_concurrency + transcriber.max_queue_size
+
+    async def _on_cleanup(self, app: Any):
+        await self.transcriber.close()
+
+
+class _StreamState:
+    """
+    StreamingSession of one WebSocket stream.
+
+    The session is created with the parameters in effect when the first audio
+    arrives, and every decode runs through the shared AsyncPingalaTranscriber,
+    so streams count against its concurrency limit.
+    """
+
+    def __init__(self, transcriber: AsyncPingalaTranscriber):
+        self.transcriber = transcriber
+        self.session: Optional[StreamingSession] = None
+        self._pending = bytearray()
+
+    async def feed(self, data: bytes, params: Dict[str, Any]) -> Optional[StreamingUpdate]:
+        # Keep an odd trailing byte until the next chunk completes the sample
+        self._pending.extend(data)
+        usable = len(self._pending) - len(self._pending) % 2
+        if not usable:
+            return None
+        chunk = bytes(self._pending[:usable])
+        del self._pending[:usable]
+        return await self.transcriber.run(self._session(params).feed, chunk)
+
+    async def finish(self, params: Dict[str, Any]) -> StreamingUpdate:
+        return await self.transcriber.run(self._session(params).finish)
+
+    def _session(self, params: Dict[str, Any]) -> StreamingSession:
+        if self.session is None:
+            params = dict(params)
+            # The session always decodes with word timestamps and prompts with its own committed text
+            params.pop("word_timestamps", None)
+            params.pop("initial_prompt", None)
+            self.session = StreamingSession(self.transcriber.transcriber, **params)
+        return self.session
+
+    def info(self) -> Dict[str, Any]:
+        session = self.session
+        duration = session.duration if session is not None else 0.0
+        return {
+            "language": (session.language if session is not None else None) or "unknown",
+            "language_probability": session.language_probability if session is not None else 0.0,
+            "duration": duration,
+            "duration_after_vad": duration,
+            "all_language_probs": [],
+        }
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _error(status: int, message: str) -> Any:
+    from aiohttp import web
+
+    return web.json_response({"error": message}, status=status)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for pingala serve."""
+    parser = argparse.ArgumentParser(
+        prog="pingala serve",
+        description="Serve Pingala Shunya transcription over HTTP and WebSocket",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  pingala serve                                       # Default model on 127.0.0.1:8000
+  pingala serve --model tiny --device cpu --compute-type int8 --port 9000
+  curl -F file=@audio.wav http://127.0.0.1:8000/v1/transcribe
+  curl --data-binary @audio.wav "http://127.0.0.1:8000/v1/transcribe?language=en"
+        """
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000)")
+    parser.add_argument("--model", type=str, default=None, help="Model name or path (default: shunyalabs/pingala-v1-en-verbatim)")
+    parser.add_argument("--backend", choices=["ct2", "transformers"], help="Backend to use (auto-detected if not specified)")
+    parser.add_argument("--device", default="auto", help="Device to use: cuda, cpu, auto (default: auto)")
+    parser.add_argument("--compute-type", default="auto", help="Compute type: auto, float16, float32, int8 (default: auto)")
+    parser.add_argument(
+        "--cpu-threads",
+        type=int,
+        default=0,
+        help="Inference threads on CPU per concurrent decode (default: 0, the available cores divided by "
+             "--max-concurrency, or OMP_NUM_THREADS)"
+    )
+    parser.add_argument("--device-index", type=int, nargs="+", default=[0], help="GPU id(s) to load the model on (default: 0)")
+    parser.add_argument("--download-root", type=str, help="Directory for downloaded models")
+    parser.add_argument("--max-concurrency", type=int, default=1, help="Decodes run at the same time on the model (default: 1)")
+    parser.add_argument("--max-queue-size", type=int, default=32, help="Requests allowed to wait before returning 503 (default: 32)")
+    parser.add_argument("--max-upload-mb", type=int, default=512, help="Largest accepted request body in MB (default: 512)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """Entry point for pingala serve."""
+    args = create_parser().parse_args(argv)
+
+    try:
+        from aiohttp import web
+    except ImportError:
+        print("Error: pingala serve needs aiohttp. Install with: pip install 'pingala-shunya[server]'", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        transcriber = AsyncPingalaTranscriber(
+            max_concurrency=args.max_concurrency,
+            max_queue_size=args.max_queue_size,
+            model_name=args.model,
+            device=args.device,
+            compute_type=args.compute_type,
+            backend=args.backend,
+            cpu_threads=args.cpu_threads,
+            num_workers=args.max_concurrency,
+            device_index=args.device_index[0] if len(args.device_index) == 1 else args.device_index,
+            download_root=args.download_root
+        )
+    except Exception as e:
+        print(f"Error initializing transcriber: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    server = TranscriptionServer(transcriber, max_upload_size=args.max_upload_mb * 1024 * 1024)
+    web.run_app(server.create_app(), host=args.host, port=args.port)
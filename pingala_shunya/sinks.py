@@ -0,0 +1,317 @@
+"""
+Bulk transcription sinks for Pingala Shunya.
+Appends one record per transcribed file to JSON Lines or Parquet, in batches, with resume.
+Developed by Shunya Labs.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+import glob
+import json
+import os
+import threading
+import warnings
+
+from .transcriber import TranscriptionInfo
+
+DEFAULT_SINK_BATCH_SIZE = 100
+
+
+def transcription_record(record_id: str, segments: Iterable[Any], info: TranscriptionInfo) -> Dict[str, Any]:
+    """
+    Build the record a sink stores for one file.
+
+    The info fields are top-level columns next to the id and the full text;
+    each segment is its to_dict() plus its confidence.
+
+    Args:
+        record_id (str): Unique id of the file, e.g. its path or a dataset row id
+        segments (Iterable): Transcription segments of the file
+        info (TranscriptionInfo): Transcription info of the file
+
+    Returns:
+        Dict[str, Any]: JSON-compatible record
+    """
+    segment_records = []
+    texts = []
+    for segment in segments:
+        data = segment.to_dict()
+        data["confidence"] = segment.confidence
+        segment_records.append(data)
+        texts.append(segment.text.strip())
+
+    record = {"id": str(record_id), "text": " ".join(texts)}
+    record.update(info.to_dict())
+    record["segments"] = segment_records
+    return record
+
+
+class TranscriptSink:
+    """
+    Base class for sinks that append transcription records in batches.
+
+    Records are buffered and written batch_size at a time, so memory use is
+    bounded by one batch however many files are transcribed. On opening, the
+    ids already in the output are loaded, and write() ignores those ids, so a
+    run that was interrupted can be restarted over the same inputs and only
+    transcribes what is missing. Only the set of ids grows with the corpus.
+
+    write() may be called from several threads. Use the sink as a context
+    manager, or call close(), to flush the last partial batch; records are
+    flushed even when the block exits with an exception.
+    """
+
+    # File extension of the output
+    extension = ""
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_SINK_BATCH_SIZE):
+        """
+        Args:
+            path (str): Output path
+            batch_size (int): Records buffered between writes (default: 100)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.path = os.fspath(path)
+        self.batch_size = batch_size
+        self.count = 0
+        self._buffer: List[Any] = []
+        self._lock = threading.Lock()
+        self.completed_ids: Set[str] = self._load_ids()
+
+    def __contains__(self, record_id: Any) -> bool:
+        """Whether a record with this id was written, in this run or an earlier one."""
+        return str(record_id) in self.completed_ids
+
+    def write(self, record_id: Any, segments: Iterable[Any], info: TranscriptionInfo) -> bool:
+        """
+        Buffer the record for one file, writing the batch when it is full.
+
+        Returns:
+            bool: False if a record with this id was already written
+        """
+        record_id = str(record_id)
+        if record_id in self.completed_ids:
+            return False
+        encoded = self._encode(transcription_record(record_id, segments, info))
+        with self._lock:
+            if record_id in self.completed_ids:
+                return False
+            self.completed_ids.add(record_id)
+            self._buffer.append(encoded)
+            self.count += 1
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+        return True
+
+    def flush(self):
+        """Write the buffered records."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Write the buffered records and release the output."""
+        self.flush()
+
+    def _flush(self):
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._write_batch(batch)
+
+    def _load_ids(self) -> Set[str]:
+        raise NotImplementedError
+
+    def _encode(self, record: Dict[str, Any]) -> Any:
+        return record
+
+    def _write_batch(self, batch: List[Any]):
+        raise NotImplementedError
+
+    def __enter__(self) -> "TranscriptSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class JSONLSink(TranscriptSink):
+    """
+    One JSON record per line in a single appendable file.
+
+    Records are encoded when they are written, so a batch is buffered as
+    strings. On opening, a last line cut short by a crash is truncated, and
+    unreadable lines elsewhere are skipped with a warning but left in place;
+    the files of both are transcribed again.
+    """
+
+    extension = ".jsonl"
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_SINK_BATCH_SIZE):
+        super().__init__(path, batch_size)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _load_ids(self) -> Set[str]:
+        ids = set()
+        if not os.path.exists(self.path):
+            return ids
+
+        position = 0
+        torn_at = None
+        unterminated = False
+        skipped = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    record_id = json.loads(line)["id"]
+                except (ValueError, KeyError, TypeError):
+                    if line.endswith(b"\n"):
+                        skipped += 1
+                    else:
+                        torn_at = position  # Only the last line can lack its newline
+                else:
+                    ids.add(record_id)
+                    unterminated = not line.endswith(b"\n")
+                position += len(line)
+
+        if skipped:
+            warnings.warn(f"Skipped {skipped} unreadable lines in {self.path}; their files will be transcribed again")
+        if torn_at is not None:
+            # A record cut short by a crash mid-write; later appends would be glued onto it
+            warnings.warn(f"Truncating an incomplete record of {position - torn_at} bytes at the end of {self.path}")
+            with open(self.path, "r+b") as f:
+                f.truncate(torn_at)
+        elif unterminated:
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+        return ids
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def _write_batch(self, batch: List[str]):
+        self._file.write("".join(batch))
+        self._file.flush()
+
+    def close(self):
+        super().close()
+        self._file.close()
+
+
+class ParquetSink(TranscriptSink):
+    """
+    A directory of Parquet part files, one per batch (requires pyarrow).
+
+    Each flush writes part-NNNNN.parquet through a temporary file and a
+    rename, so a crash never leaves a partial part. The directory reads as one
+    table, e.g. with datasets.load_dataset("parquet", data_files=".../*.parquet").
+    """
+
+    extension = ".parquet"
+
+    def __init__(self, path: str, batch_size: int = DEFAULT_SINK_BATCH_SIZE):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow. Install with: pip install pyarrow")
+        os.makedirs(path, exist_ok=True)
+        super().__init__(path, batch_size)
+        self._next_part = max((int(os.path.basename(part)[5:-8]) for part in self._parts()), default=-1) + 1
+
+    def _parts(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(glob.escape(self.path), "part-[0-9]*.parquet")))
+
+    def _load_ids(self) -> Set[str]:
+        import pyarrow.parquet as pq
+
+        ids = set()
+        for part in self._parts():
+            ids.update(pq.read_table(part, columns=["id"]).column("id").to_pylist())
+        return ids
+
+    def _encode(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        record["all_language_probs"] = [
+            {"language": language, "probability": probability}
+            for language, probability in record["all_language_probs"]
+        ]
+        return record
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(batch, schema=_parquet_schema())
+        part = os.path.join(self.path, f"part-{self._next_part:05d}.parquet")
+        temporary = f"{part}.tmp"
+        pq.write_table(table, temporary)
+        os.replace(temporary, part)
+        self._next_part += 1
+
+
+def _parquet_schema():
+    """Arrow schema of transcription_record(), fixed so that batches with missing values agree."""
+    import pyarrow as pa
+
+    word = pa.struct([
+        ("word", pa.string()),
+        ("start", pa.float64()),
+        ("end", pa.float64()),
+        ("probability", pa.float64()),
+    ])
+    segment = pa.struct([
+        ("start", pa.float64()),
+        ("end", pa.float64()),
+        ("text", pa.string()),
+        ("words", pa.list_(word)),
+        ("avg_logprob", pa.float64()),
+        ("no_speech_prob", pa.float64()),
+        ("compression_ratio", pa.float64()),
+        ("temperature", pa.float64()),
+        ("confidence", pa.float64()),
+    ])
+    return pa.schema([
+        ("id", pa.string()),
+        ("text", pa.string()),
+        ("language", pa.string()),
+        ("language_probability", pa.float64()),
+        ("duration", pa.float64()),
+        ("duration_after_vad", pa.float64()),
+        ("all_language_probs", pa.list_(pa.struct([("language", pa.string()), ("probability", pa.float64())]))),
+        ("segments", pa.list_(segment)),
+    ])
+
+
+# Sink class for each format name
+SINKS = {
+    "jsonl": JSONLSink,
+    "parquet": ParquetSink,
+}
+
+
+def open_sink(
+    path: str,
+    sink_format: Optional[str] = None,
+    batch_size: int = DEFAULT_SINK_BATCH_SIZE
+) -> TranscriptSink:
+    """
+    Open a bulk sink, resuming from the records already in it.
+
+    Args:
+        path (str): A .jsonl file or a .parquet directory
+        sink_format (str, optional): "jsonl" or "parquet"; inferred from the path's extension if not given
+        batch_size (int): Records buffered between writes (default: 100)
+
+    Returns:
+        TranscriptSink: The sink, to be closed when done
+    """
+    if sink_format is None:
+        extension = os.path.splitext(os.fspath(path).rstrip("/\\"))[1].lower()
+        sink_format = {".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}.get(extension)
+        if sink_format is None:
+            raise ValueError(f"Cannot infer the sink format of {path}; use a .jsonl or .parquet path")
+    try:
+        sink_class = SINKS[sink_format]
+    except KeyError:
+        raise ValueError(f"Unsupported sink format: {sink_format}. Supported: {', '.join(SINKS)}")
+    return sink_class(path, batch_size)
@@ -0,0 +1,350 @@
+"""
+Live audio transcription for Pingala Shunya.
+Commits words from a sliding window once consecutive hypotheses agree (LocalAgreement).
+Developed by Shunya Labs.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import re
+import time
+
+from .audio import AudioInput, SAMPLE_RATE, in_memory_samples
+from .transcriber import PingalaTranscriber, TranscriptionSegment, WordSegment
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_NORMALIZE = re.compile(r"[^\w']+")
+
+
+class StreamingUpdate:
+    """Output of one StreamingSession step."""
+
+    def __init__(self, committed: List[TranscriptionSegment], partial: Optional[TranscriptionSegment]):
+        self.committed = committed
+        self.partial = partial
+
+    def __bool__(self) -> bool:
+        return bool(self.committed) or self.partial is not None
+
+    def __repr__(self) -> str:
+        return f"StreamingUpdate(committed={self.committed!r}, partial={self.partial!r})"
+
+
+class StreamingSession:
+    """
+    Incremental transcription of live 16 kHz mono audio.
+
+    Audio is appended with feed(). Once min_chunk_seconds of new audio has
+    arrived, the buffered audio is transcribed again and the words on which
+    this hypothesis and the previous one agree are committed as final
+    (LocalAgreement-2). The rest is returned as a partial segment that later
+    updates may revise. Committed audio is trimmed from the buffer, which never
+    grows past max_buffer_seconds, so each step decodes a bounded window
+    rather than the whole stream.
+
+    Example:
+        session = transcriber.create_streaming_session(language="en")
+        for chunk in microphone_chunks():
+            update = session.feed(chunk)
+            for segment in update.committed:
+                print(segment.text)
+        for segment in session.finish().committed:
+            print(segment.text)
+    """
+
+    def __init__(
+        self,
+        transcriber: PingalaTranscriber,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        beam_size: int = 5,
+        min_chunk_seconds: float = 1.0,
+        max_buffer_seconds: float = 15.0,
+        prompt_chars: int = 200,
+        **transcribe_kwargs
+    ):
+        """
+        Start a streaming session.
+
+        Args:
+            transcriber (PingalaTranscriber): Transcriber used to decode the window
+            language (str, optional): Language code (e.g., "en"). Detected on the first step if None.
+            task (str): Task type - "transcribe" or "translate" (default: "transcribe")
+            beam_size (int): Beam size for decoding (default: 5)
+            min_chunk_seconds (float): New audio needed before the window is decoded again (default: 1.0)
+            max_buffer_seconds (float): Longest window decoded per step (default: 15.0)
+            prompt_chars (int): Committed text passed as the prompt of each step (default: 200)
+            **transcribe_kwargs: Additional transcription parameters (see transcribe_file)
+        """
+        import numpy as np
+
+        if min_chunk_seconds <= 0:
+            raise ValueError("min_chunk_seconds must be positive")
+        if max_buffer_seconds < 2 * min_chunk_seconds:
+            raise ValueError("max_buffer_seconds must be at least twice min_chunk_seconds")
+
+        self.transcriber = transcriber
+        self.language = language
+        self.language_probability = 1.0 if language else 0.0
+        self.task = task
+        self.beam_size = beam_size
+        self.min_chunk_seconds = min_chunk_seconds
+        self.max_buffer_seconds = max_buffer_seconds
+        self.prompt_chars = prompt_chars
+        self.transcribe_kwargs = transcribe_kwargs
+
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_offset = 0.0  # Stream time of buffer[0] in seconds
+        self.committed_words: List[WordSegment] = []
+        self.decode_seconds = 0.0  # Time spent decoding, for real-time factor measurements
+        self._previous: List[WordSegment] = []
+        self._unprocessed = 0
+        self._finished = False
+
+    @property
+    def duration(self) -> float:
+        """Seconds of audio received so far."""
+        return self.buffer_offset + len(self.buffer) / SAMPLE_RATE
+
+    @property
+    def committed_end(self) -> float:
+        """Stream time up to which the transcript is final."""
+        return self.committed_words[-1].end if self.committed_words else 0.0
+
+    def feed(self, audio: Union[bytes, bytearray, memoryview, "np.ndarray"]) -> StreamingUpdate:
+        """
+        Append 16-bit PCM bytes or float32 samples and decode if enough new audio arrived.
+
+        Returns:
+            StreamingUpdate: Newly committed segments and the current partial hypothesis
+        """
+        import numpy as np
+
+        if self._finished:
+            raise RuntimeError("StreamingSession is finished")
+
+        samples = in_memory_samples(audio)
+        if samples is None:
+            raise TypeError("feed() takes 16-bit PCM bytes or a NumPy array of samples")
+        self.buffer = np.concatenate([self.buffer, samples])
+        self._unprocessed += len(samples)
+
+        if self._unprocessed < self.min_chunk_seconds * SAMPLE_RATE:
+            return StreamingUpdate([], None)
+        return self._step(final=False)
+
+    def finish(self) -> StreamingUpdate:
+        """Decode the remaining audio and commit everything; the session can't be fed afterwards."""
+        if self._finished:
+            return StreamingUpdate([], None)
+        self._finished = True
+        if len(self.buffer) == 0:
+            return StreamingUpdate([], None)
+        return self._step(final=True)
+
+    def transcript(self) -> str:
+        """Committed text so far."""
+        return "".join(word.word for word in self.committed_words).strip()
+
+    def _step(self, final: bool) -> StreamingUpdate:
+        self._unprocessed = 0
+        hypothesis = self._transcribe_buffer()
+
+        if final:
+            newly_committed = hypothesis
+            self._previous = []
+        else:
+            # LocalAgreement-2: commit the prefix shared with the previous hypothesis
+            agreed = 0
+            for previous, current in zip(self._previous, hypothesis):
+                if _normalize(previous.word) != _normalize(current.word):
+                    break
+                agreed += 1
+            newly_committed = hypothesis[:agreed]
+            self._previous = hypothesis[agreed:]
+
+            if not newly_committed and len(self.buffer) >= self.max_buffer_seconds * SAMPLE_RATE:
+                # No agreement within the longest window; commit all but the last word to bound latency
+                newly_committed = hypothesis[:-1]
+                self._previous = hypothesis[-1:]
+
+        self.committed_words.extend(newly_committed)
+        self._trim_buffer(final)
+
+        committed = [_to_segment(newly_committed)] if newly_committed else []
+        partial = _to_segment(self._previous) if self._previous else None
+        return StreamingUpdate(committed, partial)
+
+    def _transcribe_buffer(self) -> List[WordSegment]:
+        """Decode the buffer and return uncommitted words with stream timestamps."""
+        params = dict(self.transcribe_kwargs)
+        prompt = self.transcript()[-self.prompt_chars:] if self.prompt_chars else ""
+
+        start = time.perf_counter()
+        segments, info = self.transcriber.transcribe_file(
+            self.buffer,
+            beam_size=self.beam_size,
+            language=self.language,
+            task=self.task,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None,
+            use_cache=False,  # Every window is new audio; caching would only churn the disk
+            **params
+        )
+        self.decode_seconds += time.perf_counter() - start
+
+        if self.language is None and info.language != "unknown":
+            # Keep the language from the first step so hypotheses stay comparable
+            self.language = info.language
+            self.language_probability = info.language_probability
+
+        words = []
+        for segment in segments:
+            for word in segment.words or _interpolate_words(segment):
+                words.append(WordSegment(
+                    word.word,
+                    word.start + self.buffer_offset,
+                    word.end + self.buffer_offset,
+                    word.probability
+                ))
+
+        # Drop words that belong to audio already committed, then any repeated committed tail
+        committed_end = self.committed_end
+        words = [word for word in words if word.start >= committed_end - 0.1]
+        if self.committed_words and words:
+            for size in range(min(5, len(words), len(self.committed_words)), 0, -1):
+                tail = [_normalize(word.word) for word in self.committed_words[-size:]]
+                head = [_normalize(word.word) for word in words[:size]]
+                if tail == head:
+                    words = words[size:]
+                    break
+        return words
+
+    def _trim_buffer(self, final: bool):
+        """Drop committed audio from the buffer so the decoded window stays bounded."""
+        if final:
+            self.buffer_offset += len(self.buffer) / SAMPLE_RATE
+            self.buffer = self.buffer[:0]
+            return
+
+        cut = int((self.committed_end - self.buffer_offset) * SAMPLE_RATE)
+        # Never keep more than max_buffer_seconds, even if nothing could be committed
+        cut = max(cut, len(self.buffer) - int(self.max_buffer_seconds * SAMPLE_RATE))
+        cut = max(0, min(cut, len(self.buffer)))
+        if cut:
+            self.buffer = self.buffer[cut:]
+            self.buffer_offset += cut / SAMPLE_RATE
+            self._previous = [word for word in self._previous if word.end > self.buffer_offset]
+
+
+def replay_file(
+    transcriber: PingalaTranscriber,
+    audio_path: AudioInput,
+    chunk_seconds: float = 0.5,
+    realtime: bool = True,
+    **session_kwargs
+) -> Dict[str, Any]:
+    """
+    Feed a file to a StreamingSession chunk by chunk and measure commit latency.
+
+    The latency of a committed word is the wall-clock time between the moment
+    its audio was fed and the moment it was committed; its lag is how much
+    audio had been fed after the word ended when it was committed. With
+    realtime=True, chunks are fed no faster than real time, as a live source
+    would produce them.
+
+    Args:
+        transcriber (PingalaTranscriber): Transcriber used by the session
+        audio_path (AudioInput): Audio to replay
+        chunk_seconds (float): Audio per feed() call (default: 0.5)
+        realtime (bool): Pace chunks at real-time speed (default: True)
+        **session_kwargs: StreamingSession arguments
+
+    Returns:
+        Dict[str, Any]: Committed segments, latency and lag statistics in seconds and the real-time factor
+    """
+    audio = transcriber.load_audio(audio_path).samples
+    session = StreamingSession(transcriber, **session_kwargs)
+    chunk = max(1, int(chunk_seconds * SAMPLE_RATE))
+
+    segments = []
+    latencies = []
+    lags = []
+    fed_at = []  # (stream time, wall time) for each chunk fed
+    started = time.perf_counter()
+
+    def record(update: StreamingUpdate):
+        now = time.perf_counter()
+        for segment in update.committed:
+            segments.append(segment)
+            for word in segment.words:
+                # First chunk that contained the end of the word
+                fed = next((wall for stream_end, wall in fed_at if stream_end >= word.end), fed_at[-1][1])
+                latencies.append(now - fed)
+                lags.append(max(0.0, float(session.duration - word.end)))
+
+    for position in range(0, len(audio), chunk):
+        if realtime:
+            delay = started + position / SAMPLE_RATE - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        piece = audio[position:position + chunk]
+        fed_at.append(((position + len(piece)) / SAMPLE_RATE, time.perf_counter()))
+        record(session.feed(piece))
+    record(session.finish())
+
+    latencies.sort()
+    lags.sort()
+    duration = len(audio) / SAMPLE_RATE
+
+    def percentile(values: List[float], fraction: float) -> Optional[float]:
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    return {
+        "segments": segments,
+        "duration": duration,
+        "words": len(latencies),
+        "latency_mean": sum(latencies) / len(latencies) if latencies else None,
+        "latency_p50": percentile(latencies, 0.5),
+        "latency_p90": percentile(latencies, 0.9),
+        "latency_max": latencies[-1] if latencies else None,
+        "lag_mean": sum(lags) / len(lags) if lags else None,
+        "lag_p90": percentile(lags, 0.9),
+        "real_time_factor": session.decode_seconds / duration if duration else None,
+    }
+
+
+def _normalize(word: str) -> str:
+    return _NORMALIZE.sub("", word.lower())
+
+
+def _interpolate_words(segment: TranscriptionSegment) -> List[WordSegment]:
+    """Spread a segment's words evenly over its duration for backends without word timestamps."""
+    tokens = segment.text.split()
+    if not tokens:
+        return []
+    step = (segment.end - segment.start) / len(tokens)
+    return [
+        WordSegment(" " + token, segment.start + i * step, segment.start + (i + 1) * step, 1.0)
+        for i, token in enumerate(tokens)
+    ]
+
+
+def _to_segment(words: List[WordSegment]) -> TranscriptionSegment:
+    probabilities = [word.probability for word in words if word.probability]
+    avg_logprob = None
+    if probabilities:
+        import math
+
+        avg_logprob = sum(math.log(max(probability, 1e-10)) for probability in probabilities) / len(probabilities)
+    return TranscriptionSegment(
+        start=words[0].start,
+        end=words[-1].end,
+        text="".join(word.word for word in words).strip(),
+        words=list(words),
+        avg_logprob=avg_logprob
+    )
@@ -4,15 +4,46 @@ Supports multiple backends: ct2 (CTranslate2), transformers.
 Developed by Shunya Labs.
 """
 
-from typing import List, Tuple, Optional, Iterator, Dict, Any, Union
+from typing import TYPE_CHECKING, List, Tuple, Optional, Iterator, Iterable, Dict, Any, Union
 from abc import ABC, abstractmethod
+from collections import deque
+import json
 import os
+import threading
 import warnings
 
+from .audio import (
+    SAMPLE_RATE,
+    WINDOW_SAMPLES,
+    WINDOW_SECONDS,
+    AudioInput,
+    AudioBuffer,
+    SilenceGate,
+    audio_buffer_cache,
+    is_audio_path,
+    describe_audio,
+    in_memory_samples,
+    as_decoder_input,
+    decode_audio_head,
+    split_windows
+)
+from .vad import DEFAULT_VAD_PARAMETERS, pack_speech_windows, select_speech_windows, speech_windows, vad_available
+from .registry import get_model_registry
+from .cache import TranscriptionCache
+
+if TYPE_CHECKING:
+    # These modules import this one, so the methods returning them import them on call
+    from .scheduler import BatchScheduler
+    from .streaming import StreamingSession
+    from .result import TranscriptResult
+
 
 class WordSegment:
     """Represents a word-level transcription segment with timing and confidence."""
     
+    # No per-instance __dict__: long word-timestamped transcripts hold millions of these
+    __slots__ = ("word", "start", "end", "probability")
+    
     def __init__(self, word: str, start: float, end: float, probability: float):
         self.word = word
         self.start = start
@@ -24,11 +55,25 @@ class WordSegment:
     
     def __repr__(self) -> str:
         return f"WordSegment(word='{self.word}', start={self.start}, end={self.end}, probability={self.probability})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {"word": self.word, "start": self.start, "end": self.end, "probability": self.probability}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WordSegment":
+        """Rebuild from the output of to_dict()."""
+        return cls(data["word"], data["start"], data["end"], data["probability"])
 
 
 class TranscriptionSegment:
     """Represents a transcription segment with timing information and metadata."""
     
+    __slots__ = (
+        "start", "end", "text", "words",
+        "avg_logprob", "no_speech_prob", "compression_ratio", "temperature"
+    )
+    
     def __init__(
         self, 
         start: float, 
@@ -62,11 +107,40 @@ class TranscriptionSegment:
     
     def __repr__(self) -> str:
         return f"TranscriptionSegment(start={self.start}, end={self.end}, text='{self.text}', confidence={self.confidence})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+            "words": [word.to_dict() for word in self.words],
+            "avg_logprob": self.avg_logprob,
+            "no_speech_prob": self.no_speech_prob,
+            "compression_ratio": self.compression_ratio,
+            "temperature": self.temperature
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionSegment":
+        """Rebuild from the output of to_dict()."""
+        return cls(
+            start=data["start"],
+            end=data["end"],
+            text=data["text"],
+            words=[WordSegment.from_dict(word) for word in data.get("words") or []],
+            avg_logprob=data.get("avg_logprob"),
+            no_speech_prob=data.get("no_speech_prob"),
+            compression_ratio=data.get("compression_ratio"),
+            temperature=data.get("temperature")
+        )
 
 
 class TranscriptionInfo:
     """Contains metadata about the transcription process."""
     
+    __slots__ = ("language", "language_probability", "duration", "duration_after_vad", "all_language_probs")
+    
     def __init__(
         self,
         language: str,
@@ -83,6 +157,27 @@ class TranscriptionInfo:
     
     def __repr__(self) -> str:
         return f"TranscriptionInfo(language='{self.language}', confidence={self.language_probability:.3f}, duration={self.duration:.2f}s)"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "language": self.language,
+            "language_probability": self.language_probability,
+            "duration": self.duration,
+            "duration_after_vad": self.duration_after_vad,
+            "all_language_probs": [[language, probability] for language, probability in self.all_language_probs]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionInfo":
+        """Rebuild from the output of to_dict()."""
+        return cls(
+            language=data["language"],
+            language_probability=data["language_probability"],
+            duration=data["duration"],
+            duration_after_vad=data["duration_after_vad"],
+            all_language_probs=[tuple(item) for item in data.get("all_language_probs") or []]
+        )
 
 
 class TranscriptionBackend(ABC):
@@ -96,37 +191,148 @@ class TranscriptionBackend(ABC):
     @abstractmethod
     def transcribe(
         self, 
-        audio_path: str, 
+        audio_path: AudioInput, 
         **kwargs
     ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
         """Transcribe audio file."""
         pass
     
+    def transcribe_stream(
+        self,
+        audio_path: AudioInput,
+        **kwargs
+    ) -> Tuple[Iterator[TranscriptionSegment], TranscriptionInfo]:
+        """
+        Transcribe audio file, returning a lazy segment iterator and the info.
+        
+        Backends without incremental decoding transcribe the whole file first.
+        """
+        segments, info = self.transcribe(audio_path, **kwargs)
+        return iter(segments), info
+    
     @abstractmethod
-    def detect_language(self, audio_path: str) -> TranscriptionInfo:
+    def detect_language(self, audio_path: AudioInput, **kwargs) -> TranscriptionInfo:
         """Detect language of audio file."""
         pass
     
+    def detect_language_windows(self, windows: List[Any]) -> List[List[Tuple[str, float]]]:
+        """
+        Detect the language of each 30 second window in a single batch.
+        
+        Returns one list of (language, probability) pairs per window, most likely first.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support windowed language detection")
+    
+    def decode_windows(
+        self,
+        windows: List[Any],
+        languages: List[Optional[str]],
+        task: str = "transcribe",
+        beam_size: int = 5,
+        **kwargs
+    ) -> List[TranscriptionSegment]:
+        """
+        Decode a batch of windows of at most 30 seconds in one forward pass.
+        
+        Returns one segment per window with times relative to the window start.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batched window decoding")
+    
+    def load_audio(self, audio_path: AudioInput) -> Any:
+        """Decode audio to float32 samples at 16 kHz."""
+        samples = in_memory_samples(audio_path)
+        if samples is not None:
+            return samples
+        audio, _ = decode_audio_head(as_decoder_input(audio_path))
+        return audio
+    
     @abstractmethod
     def get_model_info(self) -> Dict[str, Any]:
         """Get model information."""
         pass
+    
+    def unload(self):
+        """Release this backend's reference to its shared model."""
+        key = getattr(self, "_registry_key", None)
+        if key is not None:
+            self._registry_key = None
+            get_model_registry().release(key)
+    
+    def _detect_language_from_audio(
+        self,
+        audio: Any,
+        duration: float,
+        max_duration: Optional[float] = 30.0,
+        vad_filter: bool = False,
+        vad_parameters: Optional[Dict[str, Any]] = None,
+        num_windows: int = 3,
+        top_k: int = 5
+    ) -> TranscriptionInfo:
+        """Run windowed language detection on decoded audio and average the window scores."""
+        if len(audio) == 0:
+            raise RuntimeError("Audio appears to be empty or corrupted")
+        
+        duration_after_vad = duration
+        windows = []
+        if vad_filter:
+            windows, duration_after_vad = select_speech_windows(audio, num_windows, vad_parameters)
+        if not windows:
+            # No VAD or no speech found: use the leading windows
+            if max_duration is not None:
+                audio = audio[:int(max_duration * SAMPLE_RATE)]
+            windows = split_windows(audio)[:max(1, num_windows)]
+        
+        totals: Dict[str, float] = {}
+        for window_probs in self.detect_language_windows(windows):
+            for language, probability in window_probs:
+                totals[language] = totals.get(language, 0.0) + probability
+        
+        ranked = sorted(
+            ((language, total / len(windows)) for language, total in totals.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        
+        return TranscriptionInfo(
+            language=ranked[0][0],
+            language_probability=ranked[0][1],
+            duration=duration,
+            duration_after_vad=duration_after_vad,
+            all_language_probs=ranked[:top_k]
+        )
 
 
 class CT2Backend(TranscriptionBackend):
-    """Backend using CTranslate2 for optimized inference."""
+    """
+    Backend using CTranslate2 for optimized inference.
+    
+    Thread-safe: every call keeps its decoding state, including the language and
+    word-timestamp fallbacks, in local variables, and CTranslate2 runs up to
+    num_workers calls on the shared model in parallel, queueing the rest.
+    """
     
     def __init__(self):
         self.model = None
+        self.model_path = None
         self.model_name = None
         self.device = None
         self.compute_type = None
+        # Whether the model has alignment heads for word timestamps; None if unknown
+        self.word_timestamps_supported = None
+        self._tokenizers = {}
+        self._tokenizers_lock = threading.Lock()
+        self._registry_key = None
     
     def load_model(self, model_name: str, device: str, compute_type: str, **kwargs):
-        """Load CTranslate2 model via faster-whisper."""
+        """Load CTranslate2 model via faster-whisper, shared through the model registry."""
+        key = ("ct2", model_name, device, compute_type, _options_key(kwargs))
         try:
-            from faster_whisper import WhisperModel
-            self.model = WhisperModel(model_name, device=device, compute_type=compute_type)
+            self.model, self.model_path, self.word_timestamps_supported = get_model_registry().acquire(
+                key,
+                lambda: self._create_model(model_name, device, compute_type, **kwargs),
+                size_fn=lambda loaded: _directory_size(loaded[1])
+            )
+            self._registry_key = key
             self.model_name = model_name
             self.device = device
             self.compute_type = compute_type
@@ -135,18 +341,106 @@ class CT2Backend(TranscriptionBackend):
         except Exception as e:
             raise RuntimeError(f"Failed to load CTranslate2 model '{model_name}': {e}")
     
+    @staticmethod
+    def _create_model(model_name: str, device: str, compute_type: str, **kwargs) -> Tuple[Any, str, Optional[bool]]:
+        """Resolve the model directory and load a WhisperModel and its word-timestamp support."""
+        from faster_whisper import WhisperModel
+        from faster_whisper.utils import download_model
+        
+        if os.path.isdir(model_name):
+            model_path = model_name
+        else:
+            model_path = download_model(model_name, cache_dir=kwargs.get("download_root"))
+        model = WhisperModel(model_path, device=device, compute_type=compute_type, **kwargs)
+        return model, model_path, _has_alignment_heads(model_path)
+    
+    def unload(self):
+        """Release the shared WhisperModel."""
+        super().unload()
+        self.model = None
+        self.model_path = None
+        self.word_timestamps_supported = None
+        self._tokenizers = {}
+    
     def transcribe(
         self, 
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         word_timestamps: bool = False,
         language: Optional[str] = None,
         **kwargs
     ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
         """Transcribe using CTranslate2."""
+        segments, info = self.transcribe_stream(
+            audio_path,
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+            **kwargs
+        )
+        return list(segments), info
+    
+    def transcribe_stream(
+        self,
+        audio_path: AudioInput,
+        beam_size: int = 5,
+        word_timestamps: bool = False,
+        language: Optional[str] = None,
+        **kwargs
+    ) -> Tuple[Iterator[TranscriptionSegment], TranscriptionInfo]:
+        """
+        Transcribe using CTranslate2, yielding segments as faster-whisper decodes them.
+        
+        Only language detection runs before this method returns; each segment is
+        decoded when the returned iterator is advanced.
+        """
         if self.model is None:
             raise RuntimeError("Model not loaded")
         
+        # Long-form batching is a transformers pipeline option
+        kwargs.pop("batch_size", None)
+        
+        if word_timestamps and self.word_timestamps_supported is False:
+            # Known from the model config, so don't start a decode that would fail and restart
+            warnings.warn(
+                f"Word-level timestamps not supported by this model ('{self.model_name}'). "
+                "The model lacks 'alignment_heads' configuration. "
+                "Transcribing without word timestamps.",
+                UserWarning
+            )
+            word_timestamps = False
+        
+        if not is_audio_path(audio_path):
+            # Decode file objects once so the fallbacks can restart from the samples
+            audio_path = self.load_audio(audio_path)
+        
+        segments, info, language = self._start_transcription(
+            audio_path,
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+            **kwargs
+        )
+        
+        iterator = self._iter_segments(
+            segments,
+            audio_path,
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+            **kwargs
+        )
+        return iterator, self._convert_info(info)
+    
+    def _start_transcription(
+        self,
+        audio_path: AudioInput,
+        beam_size: int,
+        word_timestamps: bool,
+        language: Optional[str],
+        **kwargs
+    ) -> Tuple[Iterator[Any], Any, Optional[str]]:
+        """Start a faster-whisper transcription, applying the language and alignment fallbacks."""
         try:
             segments, info = self.model.transcribe(
                 audio_path,
@@ -159,31 +453,33 @@ class CT2Backend(TranscriptionBackend):
             # Handle language detection failure - fallback to English
             if language is None:
                 warnings.warn(
-                    f"Language detection failed for audio file '{audio_path}'. "
+                    f"Language detection failed for audio file '{describe_audio(audio_path)}'. "
                     "This can happen with very short audio, silent audio, or corrupted files. "
                     "Falling back to English. You can specify language explicitly (e.g., language='en') to avoid this warning.",
                     UserWarning
                 )
+                language = "en"  # Fallback to English
                 try:
                     segments, info = self.model.transcribe(
                         audio_path,
                         beam_size=beam_size,
                         word_timestamps=word_timestamps,
-                        language="en",  # Fallback to English
+                        language=language,
                         **kwargs
                     )
                 except Exception as fallback_error:
                     raise RuntimeError(
-                        f"Transcription failed for audio file '{audio_path}'. "
+                        f"Transcription failed for audio file '{describe_audio(audio_path)}'. "
                         f"Language detection failed and fallback to English also failed: {fallback_error}. "
                         "Please check if the audio file is valid and not corrupted."
                     )
             else:
                 # Re-raise if language was explicitly specified
-                raise RuntimeError(f"Transcription failed for audio file '{audio_path}' with specified language '{language}': {e}")
+                raise RuntimeError(f"Transcription failed for audio file '{describe_audio(audio_path)}' with specified language '{language}': {e}")
         except RuntimeError as e:
             # Handle alignment heads error for word timestamps
             if "alignment_heads" in str(e) and word_timestamps:
+                self.word_timestamps_supported = False
                 warnings.warn(
                     f"Word-level timestamps not supported by this model ('{self.model_name}'). "
                     "The model lacks 'alignment_heads' configuration. "
@@ -200,75 +496,283 @@ class CT2Backend(TranscriptionBackend):
                     **kwargs
                 )
             else:
-                raise RuntimeError(f"Transcription failed for audio file '{audio_path}': {e}")
+                raise RuntimeError(f"Transcription failed for audio file '{describe_audio(audio_path)}': {e}")
         except Exception as e:
-            raise RuntimeError(f"Transcription failed for audio file '{audio_path}': {e}")
+            raise RuntimeError(f"Transcription failed for audio file '{describe_audio(audio_path)}': {e}")
         
-        result = []
-        try:
-            for segment in segments:
-                words = []
-                if word_timestamps and hasattr(segment, 'words') and segment.words:
-                    for word in segment.words:
-                        words.append(WordSegment(
-                            word=word.word,
-                            start=word.start,
-                            end=word.end,
-                            probability=word.probability
-                        ))
-                
-                result.append(TranscriptionSegment(
-                    start=segment.start,
-                    end=segment.end,
-                    text=segment.text,
-                    words=words,
-                    avg_logprob=getattr(segment, 'avg_logprob', None),
-                    no_speech_prob=getattr(segment, 'no_speech_prob', None),
-                    compression_ratio=getattr(segment, 'compression_ratio', None),
-                    temperature=getattr(segment, 'temperature', None)
-                ))
-        except RuntimeError as e:
-            # Handle alignment heads error during segment processing
-            if "alignment_heads" in str(e) and word_timestamps:
+        return segments, info, language
+    
+    def _iter_segments(
+        self,
+        segments: Iterator[Any],
+        audio_path: AudioInput,
+        beam_size: int,
+        word_timestamps: bool,
+        language: Optional[str],
+        **kwargs
+    ) -> Iterator[TranscriptionSegment]:
+        """Convert faster-whisper segments lazily as they are decoded."""
+        emitted = 0
+        while True:
+            try:
+                for segment in segments:
+                    emitted += 1
+                    yield self._convert_segment(segment, word_timestamps)
+                return
+            except RuntimeError as e:
+                # Handle alignment heads error during segment processing
+                if "alignment_heads" not in str(e) or not word_timestamps:
+                    raise
+                self.word_timestamps_supported = False
+                if emitted:
+                    # Restarting now would decode the already emitted audio again
+                    raise RuntimeError(
+                        f"Word-level timestamps failed for model '{self.model_name}' after "
+                        f"{emitted} segments of '{describe_audio(audio_path)}' were produced: {e}. "
+                        "Transcribe again with word_timestamps=False."
+                    )
                 warnings.warn(
                     f"Word-level timestamps failed during processing for model '{self.model_name}'. "
                     "Retrying without word timestamps.",
                     UserWarning
                 )
-                # Retry the entire transcription without word timestamps
-                return self.transcribe(
+                # Only the first window was decoded, so restart it without word timestamps
+                word_timestamps = False
+                segments, _, language = self._start_transcription(
                     audio_path,
                     beam_size=beam_size,
-                    word_timestamps=False,  # Disable word timestamps
+                    word_timestamps=False,
                     language=language,
                     **kwargs
                 )
-            else:
-                raise
+    
+    @staticmethod
+    def _convert_segment(segment: Any, word_timestamps: bool) -> TranscriptionSegment:
+        """Convert a faster-whisper segment into a TranscriptionSegment."""
+        words = []
+        if word_timestamps and hasattr(segment, 'words') and segment.words:
+            for word in segment.words:
+                words.append(WordSegment(
+                    word=word.word,
+                    start=word.start,
+                    end=word.end,
+                    probability=word.probability
+                ))
         
-        transcription_info = TranscriptionInfo(
+        return TranscriptionSegment(
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            words=words,
+            avg_logprob=getattr(segment, 'avg_logprob', None),
+            no_speech_prob=getattr(segment, 'no_speech_prob', None),
+            compression_ratio=getattr(segment, 'compression_ratio', None),
+            temperature=getattr(segment, 'temperature', None)
+        )
+    
+    @staticmethod
+    def _convert_info(info: Any) -> TranscriptionInfo:
+        """Convert faster-whisper transcription info into a TranscriptionInfo."""
+        return TranscriptionInfo(
             language=info.language,
             language_probability=info.language_probability,
             duration=info.duration,
             duration_after_vad=info.duration_after_vad
         )
+    
+    def detect_language(
+        self,
+        audio_path: AudioInput,
+        max_duration: Optional[float] = 30.0,
+        vad_filter: bool = False,
+        vad_parameters: Optional[Dict[str, Any]] = None,
+        num_windows: int = 3,
+        top_k: int = 5
+    ) -> TranscriptionInfo:
+        """Detect language using CTranslate2 on the first seconds or on VAD-selected speech."""
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
         
-        return result, transcription_info
+        try:
+            samples = in_memory_samples(audio_path)
+            if samples is not None:
+                audio, duration = samples, len(samples) / SAMPLE_RATE
+            elif vad_filter:
+                # Speech can be anywhere in the file, so the whole file is decoded
+                audio = self.load_audio(audio_path)
+                duration = len(audio) / SAMPLE_RATE
+            else:
+                audio, duration = decode_audio_head(as_decoder_input(audio_path), max_duration)
+        except Exception as e:
+            raise RuntimeError(f"Failed to decode audio file '{describe_audio(audio_path)}': {e}")
+        
+        try:
+            return self._detect_language_from_audio(
+                audio,
+                duration,
+                max_duration=max_duration,
+                vad_filter=vad_filter,
+                vad_parameters=vad_parameters,
+                num_windows=num_windows,
+                top_k=top_k
+            )
+        except Exception as e:
+            raise RuntimeError(f"Language detection failed for audio file '{describe_audio(audio_path)}': {e}")
     
-    def detect_language(self, audio_path: str) -> TranscriptionInfo:
-        """Detect language using CTranslate2."""
+    def detect_language_windows(self, windows: List[Any]) -> List[List[Tuple[str, float]]]:
+        """Detect language per window with one encoder pass over the whole batch."""
         if self.model is None:
             raise RuntimeError("Model not loaded")
         
-        segments, info = self.model.transcribe(audio_path, beam_size=1)
-        list(segments)  # Consume generator to populate info
+        if not self.model.model.is_multilingual:
+            return [[("en", 1.0)] for _ in windows]
         
-        return TranscriptionInfo(
-            language=info.language,
-            language_probability=info.language_probability,
-            duration=info.duration,
-            duration_after_vad=info.duration_after_vad
+        encoder_output = self._encode(self._window_features(windows))
+        results = self.model.model.detect_language(encoder_output)
+        
+        # Tokens look like "<|en|>"
+        return [[(token[2:-2], probability) for token, probability in result] for result in results]
+    
+    def decode_windows(
+        self,
+        windows: List[Any],
+        languages: List[Optional[str]],
+        task: str = "transcribe",
+        beam_size: int = 5,
+        patience: float = 1.0,
+        length_penalty: float = 1.0,
+        repetition_penalty: float = 1.0,
+        no_repeat_ngram_size: int = 0,
+        temperature: Union[float, List[float], Tuple[float, ...]] = 0.0,
+        suppress_blank: bool = True,
+        suppress_tokens: Optional[List[int]] = [-1],
+        initial_prompt: Optional[str] = None,
+        **kwargs
+    ) -> List[TranscriptionSegment]:
+        """Decode windows as one CTranslate2 encoder/decoder batch without timestamps."""
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        
+        languages = self._resolve_window_languages(windows, languages)
+        encoder_output = self._encode(self._window_features(windows))
+        
+        tokenizers = [self._get_tokenizer(task, language) for language in languages]
+        prompts = [self._window_prompt(tokenizer, initial_prompt) for tokenizer in tokenizers]
+        
+        if isinstance(temperature, (list, tuple)):
+            temperature = temperature[0]
+        options = {
+            "beam_size": beam_size,
+            "patience": patience,
+            "length_penalty": length_penalty,
+            "repetition_penalty": repetition_penalty,
+            "no_repeat_ngram_size": no_repeat_ngram_size,
+        }
+        if temperature > 0:
+            options.update(beam_size=1, sampling_temperature=temperature, sampling_topk=0)
+        
+        results = self.model.model.generate(
+            encoder_output,
+            prompts,
+            max_length=getattr(self.model, "max_length", 448),
+            return_scores=True,
+            return_no_speech_prob=True,
+            suppress_blank=suppress_blank,
+            suppress_tokens=suppress_tokens or [],
+            **options
         )
+        
+        segments = []
+        for window, tokenizer, result in zip(windows, tokenizers, results):
+            tokens = result.sequences_ids[0]
+            seq_len = len(tokens)
+            # Same normalisation as faster-whisper's generate_with_fallback
+            avg_logprob = result.scores[0] * (seq_len ** length_penalty) / (seq_len + 1)
+            segments.append(TranscriptionSegment(
+                start=0.0,
+                end=len(window) / SAMPLE_RATE,
+                text=tokenizer.decode([token for token in tokens if token < tokenizer.eot]),
+                words=[],
+                avg_logprob=avg_logprob,
+                no_speech_prob=result.no_speech_prob,
+                compression_ratio=None,
+                temperature=temperature
+            ))
+        return segments
+    
+    def load_audio(self, audio_path: AudioInput) -> Any:
+        """Decode audio with faster-whisper's decoder; in-memory audio is used as is."""
+        samples = in_memory_samples(audio_path)
+        if samples is not None:
+            return samples
+        
+        from faster_whisper import decode_audio
+        
+        try:
+            return decode_audio(as_decoder_input(audio_path), sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            raise RuntimeError(f"Failed to decode audio file '{describe_audio(audio_path)}': {e}")
+    
+    def _resolve_window_languages(self, windows: List[Any], languages: List[Optional[str]]) -> List[str]:
+        """Fill in missing window languages by batched detection."""
+        missing = [i for i, language in enumerate(languages) if language is None]
+        if not missing:
+            return list(languages)
+        
+        languages = list(languages)
+        detected = self.detect_language_windows([windows[i] for i in missing])
+        for i, window_probs in zip(missing, detected):
+            languages[i] = window_probs[0][0]
+        return languages
+    
+    def _get_tokenizer(self, task: str, language: Optional[str]) -> Any:
+        """Return a cached faster-whisper tokenizer for a task and language."""
+        key = (task, language)
+        with self._tokenizers_lock:
+            tokenizer = self._tokenizers.get(key)
+            if tokenizer is None:
+                from faster_whisper.tokenizer import Tokenizer
+                tokenizer = Tokenizer(
+                    self.model.hf_tokenizer,
+                    self.model.model.is_multilingual,
+                    task=task,
+                    language=language
+                )
+                self._tokenizers[key] = tokenizer
+        return tokenizer
+    
+    @staticmethod
+    def _window_prompt(tokenizer: Any, initial_prompt: Optional[str] = None) -> List[int]:
+        """Build the decoder prompt for a single window without timestamps."""
+        prompt = []
+        if initial_prompt:
+            # Whisper keeps at most half of the 448-token context for previous text
+            prompt.append(tokenizer.sot_prev)
+            prompt.extend(tokenizer.encode(" " + initial_prompt.strip())[-223:])
+        prompt.extend(tokenizer.sot_sequence)
+        prompt.append(tokenizer.no_timestamps)
+        return prompt
+    
+    def _encode(self, features: Any) -> Any:
+        """Run the encoder on a (batch, n_mels, frames) feature array."""
+        import ctranslate2
+        import numpy as np
+        
+        storage = ctranslate2.StorageView.from_array(np.ascontiguousarray(features, dtype=np.float32))
+        # Keep multi-GPU outputs on the CPU so they can be fed to any replica
+        to_cpu = self.model.model.device == "cuda" and len(self.model.model.device_index) > 1
+        return self.model.model.encode(storage, to_cpu=to_cpu)
+    
+    def _window_features(self, windows: List[Any]) -> Any:
+        """Compute padded log-mel features for a batch of windows of at most 30 seconds."""
+        import numpy as np
+        
+        feature_extractor = self.model.feature_extractor
+        features = []
+        for window in windows:
+            padded = np.pad(window, (0, max(0, WINDOW_SAMPLES - len(window))))
+            features.append(feature_extractor(padded)[:, :feature_extractor.nb_max_frames])
+        return np.stack(features)
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get CTranslate2 model info."""
@@ -277,35 +781,107 @@ class CT2Backend(TranscriptionBackend):
             "model_name": self.model_name,
             "device": self.device,
             "compute_type": self.compute_type,
+            "word_timestamps": self.word_timestamps_supported,
             "model_size_in_memory": getattr(self.model, "model_size_in_memory", "Unknown") if self.model else None
         }
 
 
+# Long-form transformers decoding: overlap between 30 second chunks and chunks per forward pass
+LONG_FORM_STRIDE_SECONDS = 5
+LONG_FORM_BATCH_SIZE = 8
+
+
+class _TransformersModel:
+    """
+    Whisper model, processor and ASR pipeline loaded together for the registry.
+    
+    Hugging Face pipelines keep per-call state on the pipeline object, so every
+    backend sharing this model runs inference under its lock.
+    """
+    
+    def __init__(
+        self,
+        model_name: str,
+        device: str,
+        compute_type: str,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        device_index: Union[int, List[int]] = 0,
+        download_root: Optional[str] = None
+    ):
+        from transformers import WhisperForConditionalGeneration, WhisperProcessor, pipeline
+        import torch
+        
+        # Resolve device and dtype once; every call reuses them
+        use_cuda = device in ("cuda", "auto") and torch.cuda.is_available()
+        if isinstance(device_index, (list, tuple)):
+            device_index = device_index[0]  # The pipeline runs on a single device
+        self.torch_device = torch.device(f"cuda:{device_index}" if use_cuda else "cpu")
+        self.torch_dtype = torch.float16 if use_cuda and compute_type != "float32" else torch.float32
+        if cpu_threads > 0:
+            # Process-wide PyTorch setting
+            torch.set_num_threads(cpu_threads)
+        
+        # Load model and processor using Whisper-specific classes
+        self.model = WhisperForConditionalGeneration.from_pretrained(model_name, cache_dir=download_root)
+        self.processor = WhisperProcessor.from_pretrained(model_name, cache_dir=download_root)
+        
+        # Move model to device with the dtype the pipeline feeds it
+        self.model = self.model.to(self.torch_device, dtype=self.torch_dtype)
+        self.model.eval()
+        self.lock = threading.RLock()
+        
+        # Create pipeline with explicit tokenizer and feature_extractor
+        self.pipe = pipeline(
+            "automatic-speech-recognition",
+            model=self.model,
+            tokenizer=self.processor.tokenizer,
+            feature_extractor=self.processor.feature_extractor,
+            torch_dtype=self.torch_dtype,
+            device=self.torch_device,
+        )
+    
+    def size_in_bytes(self) -> int:
+        return sum(param.numel() * param.element_size() for param in self.model.parameters())
+
+
 class TransformersBackend(TranscriptionBackend):
-    """Backend using Hugging Face transformers library."""
+    """
+    Backend using Hugging Face transformers library.
+    
+    Thread-safe: inference on a shared model is serialized by the model's lock,
+    while audio loading and result conversion run concurrently.
+    """
     
     def __init__(self):
         self.model = None
         self.processor = None
+        self.pipe = None
         self.model_name = None
         self.device = None
+        self.torch_device = None
+        self.torch_dtype = None
+        self._lock = threading.RLock()
+        self._registry_key = None
     
     def load_model(self, model_name: str, device: str, compute_type: str, **kwargs):
-        """Load transformers model."""
+        """Load transformers model and build the ASR pipeline once, shared through the model registry."""
+        key = ("transformers", model_name, device, compute_type, _options_key(kwargs))
         try:
-            from transformers import WhisperForConditionalGeneration, WhisperProcessor
-            import torch
-            
+            loaded = get_model_registry().acquire(
+                key,
+                lambda: _TransformersModel(model_name, device, compute_type, **kwargs),
+                size_fn=lambda loaded: loaded.size_in_bytes()
+            )
+            self._registry_key = key
             self.model_name = model_name
             self.device = device
-            
-            # Load model and processor using Whisper-specific classes
-            self.model = WhisperForConditionalGeneration.from_pretrained(model_name)
-            self.processor = WhisperProcessor.from_pretrained(model_name)
-            
-            # Move model to device
-            device_obj = torch.device(device if device == "cuda" and torch.cuda.is_available() else "cpu")
-            self.model = self.model.to(device_obj)
+            self.model = loaded.model
+            self.processor = loaded.processor
+            self.pipe = loaded.pipe
+            self.torch_device = loaded.torch_device
+            self.torch_dtype = loaded.torch_dtype
+            self._lock = loaded.lock
             
         except ImportError:
             raise RuntimeError("transformers backend not available. Install with: pip install transformers torch librosa")
@@ -314,66 +890,102 @@ class TransformersBackend(TranscriptionBackend):
     
     def transcribe(
         self, 
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         word_timestamps: bool = False,
         language: Optional[str] = None,
+        task: str = "transcribe",
+        batch_size: Optional[int] = None,
+        vad_filter: bool = False,
+        vad_parameters: Optional[Dict[str, Any]] = None,
         **kwargs
     ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
-        """Transcribe using transformers."""
-        if self.model is None or self.processor is None:
+        """
+        Transcribe using transformers.
+        
+        Audio longer than 30 seconds is split into overlapping chunks that are
+        decoded batch_size at a time and stitched back together, with segment
+        timestamps relative to the start of the file. With vad_filter, only the
+        detected speech is decoded, packed into 30 second windows with one
+        segment per window.
+        """
+        if self.pipe is None:
             raise RuntimeError("Model not loaded")
         
         try:
-            import torch
-            import librosa
-            from transformers import pipeline
-            import numpy as np
-            
             # Load and preprocess audio with librosa first to handle various formats
-            try:
-                audio, sr = librosa.load(audio_path, sr=16000)
-                duration = len(audio) / sr
-                
-                # Ensure audio is not empty
-                if len(audio) == 0:
-                    raise ValueError("Audio file appears to be empty or corrupted")
-                
-            except Exception as audio_error:
-                raise RuntimeError(
-                    f"Failed to load audio file '{audio_path}'. "
-                    f"Supported formats: wav, mp3, flac, ogg, opus, m4a. "
-                    f"Error: {audio_error}"
-                )
+            audio = self.load_audio(audio_path)
+            duration = len(audio) / SAMPLE_RATE
             
-            # Create pipeline with explicit tokenizer and feature_extractor
-            pipe = pipeline(
-                "automatic-speech-recognition",
-                model=self.model,
-                tokenizer=self.processor.tokenizer,
-                feature_extractor=self.processor.feature_extractor,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-                device=torch.device(self.device if self.device == "cuda" and torch.cuda.is_available() else "cpu"),
-            )
+            if vad_filter:
+                # The pipeline can't skip silence, so decode the packed speech windows directly
+                return next(_transcribe_batched(
+                    self,
+                    [audio],
+                    batch_size=batch_size or LONG_FORM_BATCH_SIZE,
+                    language=language,
+                    task=task,
+                    beam_size=beam_size,
+                    vad_filter=True,
+                    vad_parameters=vad_parameters
+                ))
             
-            # Process the preprocessed audio array instead of file path
-            result = pipe(audio)
+            language_probability = 1.0
+            all_language_probs = None
+            generate_kwargs = {"num_beams": beam_size}
+            if getattr(self.model.generation_config, "lang_to_id", None):
+                if language is None:
+                    # Detect once so every chunk is decoded in the same language
+                    all_language_probs = self.detect_language_windows([audio[:WINDOW_SAMPLES]])[0]
+                    language, language_probability = all_language_probs[0]
+                generate_kwargs["language"] = language
+                generate_kwargs["task"] = task
+            
+            pipe_kwargs = {
+                "return_timestamps": True,
+                "generate_kwargs": generate_kwargs,
+            }
+            if duration > WINDOW_SECONDS:
+                pipe_kwargs.update(
+                    chunk_length_s=WINDOW_SECONDS,
+                    stride_length_s=LONG_FORM_STRIDE_SECONDS,
+                    batch_size=batch_size or LONG_FORM_BATCH_SIZE
+                )
+            
+            try:
+                with self._lock:
+                    result = self.pipe(audio, **pipe_kwargs)
+            except ValueError as timestamp_error:
+                # Some fine-tuned checkpoints never learned timestamp tokens, which transformers
+                # reports as a ValueError about timestamps; anything else is a real failure
+                if "timestamp" not in str(timestamp_error).lower():
+                    raise
+                warnings.warn(
+                    f"Timestamp prediction failed for this model, transcribing without segment timestamps: {timestamp_error}"
+                )
+                pipe_kwargs["return_timestamps"] = False
+                with self._lock:
+                    result = self.pipe(audio, **pipe_kwargs)
             
             # Process results
             segments = []
-            if "chunks" in result:
-                for chunk in result["chunks"]:
-                    segments.append(TranscriptionSegment(
-                        start=chunk["timestamp"][0] if chunk["timestamp"][0] is not None else 0.0,
-                        end=chunk["timestamp"][1] if chunk["timestamp"][1] is not None else duration,
-                        text=chunk["text"].strip(),
-                        words=[],  # Transformers doesn't provide word-level timestamps by default
-                        avg_logprob=None,
-                        no_speech_prob=None,
-                        compression_ratio=None,
-                        temperature=None
-                    ))
-            else:
+            for chunk in result.get("chunks") or []:
+                text = chunk["text"].strip()
+                if not text:
+                    continue
+                start, end = chunk["timestamp"]
+                segments.append(TranscriptionSegment(
+                    start=start if start is not None else 0.0,
+                    end=min(end, duration) if end is not None else duration,
+                    text=text,
+                    words=[],  # Transformers doesn't provide word-level timestamps by default
+                    avg_logprob=None,
+                    no_speech_prob=None,
+                    compression_ratio=None,
+                    temperature=None
+                ))
+            
+            if not segments and result["text"].strip():
                 # Single segment result
                 segments.append(TranscriptionSegment(
                     start=0.0,
@@ -389,9 +1001,10 @@ class TransformersBackend(TranscriptionBackend):
             # Create transcription info
             transcription_info = TranscriptionInfo(
                 language=language or "unknown",
-                language_probability=1.0,
+                language_probability=language_probability,
                 duration=duration,
-                duration_after_vad=duration
+                duration_after_vad=duration,
+                all_language_probs=all_language_probs
             )
             
             return segments, transcription_info
@@ -401,35 +1014,242 @@ class TransformersBackend(TranscriptionBackend):
         except Exception as e:
             raise RuntimeError(f"Transcription failed: {e}")
     
-    def detect_language(self, audio_path: str) -> TranscriptionInfo:
-        """Detect language using transformers (basic implementation)."""
+    def detect_language(
+        self,
+        audio_path: AudioInput,
+        max_duration: Optional[float] = 30.0,
+        vad_filter: bool = False,
+        vad_parameters: Optional[Dict[str, Any]] = None,
+        num_windows: int = 3,
+        top_k: int = 5
+    ) -> TranscriptionInfo:
+        """Detect language using the Whisper decoder's language token scores."""
+        if self.model is None or self.processor is None:
+            raise RuntimeError("Model not loaded")
+        
         try:
             import librosa
             
-            audio, sr = librosa.load(audio_path, sr=16000)
-            duration = len(audio) / sr
+            if not is_audio_path(audio_path):
+                audio = self.load_audio(audio_path)
+                duration = len(audio) / SAMPLE_RATE
+            elif vad_filter:
+                audio, _ = librosa.load(audio_path, sr=SAMPLE_RATE)
+                duration = len(audio) / SAMPLE_RATE
+            else:
+                audio, _ = librosa.load(audio_path, sr=SAMPLE_RATE, duration=max_duration)
+                duration = librosa.get_duration(path=audio_path)
             
-            # Basic language detection (could be enhanced with dedicated models)
-            return TranscriptionInfo(
-                language="unknown",
-                language_probability=0.5,
-                duration=duration,
-                duration_after_vad=duration
+            return self._detect_language_from_audio(
+                audio,
+                duration,
+                max_duration=max_duration,
+                vad_filter=vad_filter,
+                vad_parameters=vad_parameters,
+                num_windows=num_windows,
+                top_k=top_k
             )
         except Exception as e:
             raise RuntimeError(f"Language detection failed: {e}")
     
+    def load_audio(self, audio_path: AudioInput) -> Any:
+        """Decode audio with librosa, which handles OPUS, OGG and M4A; in-memory audio is used as is."""
+        try:
+            audio = in_memory_samples(audio_path)
+            if audio is None:
+                import librosa
+                
+                audio, _ = librosa.load(as_decoder_input(audio_path), sr=SAMPLE_RATE)
+            
+            # Ensure audio is not empty
+            if len(audio) == 0:
+                raise ValueError("Audio file appears to be empty or corrupted")
+            return audio
+        except Exception as audio_error:
+            raise RuntimeError(
+                f"Failed to load audio file '{describe_audio(audio_path)}'. "
+                f"Supported formats: wav, mp3, flac, ogg, opus, m4a. "
+                f"Error: {audio_error}"
+            )
+    
+    def decode_windows(
+        self,
+        windows: List[Any],
+        languages: List[Optional[str]],
+        task: str = "transcribe",
+        beam_size: int = 5,
+        **kwargs
+    ) -> List[TranscriptionSegment]:
+        """Decode windows as one batched WhisperForConditionalGeneration.generate call."""
+        if self.model is None or self.processor is None:
+            raise RuntimeError("Model not loaded")
+        
+        import torch
+        
+        features = self.processor.feature_extractor(
+            list(windows),
+            sampling_rate=SAMPLE_RATE,
+            return_tensors="pt"
+        ).input_features.to(self.torch_device, dtype=self.torch_dtype)
+        
+        generate_kwargs = {"num_beams": beam_size}
+        if getattr(self.model.generation_config, "lang_to_id", None):
+            if any(language is None for language in languages):
+                detected = self.detect_language_windows(windows)
+                languages = [language or probs[0][0] for language, probs in zip(languages, detected)]
+            generate_kwargs["language"] = languages[0] if len(set(languages)) == 1 else list(languages)
+            generate_kwargs["task"] = task
+        
+        with self._lock, torch.no_grad():
+            sequences = self.model.generate(features, **generate_kwargs)
+        texts = self.processor.batch_decode(sequences, skip_special_tokens=True)
+        
+        return [
+            TranscriptionSegment(
+                start=0.0,
+                end=len(window) / SAMPLE_RATE,
+                text=text.strip(),
+                words=[],
+                avg_logprob=None,
+                no_speech_prob=None,
+                compression_ratio=None,
+                temperature=None
+            )
+            for window, text in zip(windows, texts)
+        ]
+    
+    def detect_language_windows(self, windows: List[Any]) -> List[List[Tuple[str, float]]]:
+        """Score the language tokens after <|startoftranscript|> for a batch of windows."""
+        import torch
+        
+        lang_to_id = getattr(self.model.generation_config, "lang_to_id", None)
+        if not lang_to_id:
+            # English-only checkpoints have no language tokens
+            return [[("en", 1.0)] for _ in windows]
+        
+        features = self.processor.feature_extractor(
+            list(windows),
+            sampling_rate=SAMPLE_RATE,
+            return_tensors="pt"
+        ).input_features.to(self.torch_device, dtype=self.torch_dtype)
+        decoder_input_ids = torch.full(
+            (len(windows), 1),
+            self.model.generation_config.decoder_start_token_id,
+            device=self.torch_device
+        )
+        
+        tokens = list(lang_to_id)
+        with self._lock, torch.no_grad():
+            logits = self.model(input_features=features, decoder_input_ids=decoder_input_ids).logits[:, -1]
+        probs = logits[:, [lang_to_id[token] for token in tokens]].float().softmax(dim=-1).cpu().tolist()
+        
+        return [
+            sorted(
+                ((token[2:-2], probability) for token, probability in zip(tokens, window_probs)),
+                key=lambda item: item[1],
+                reverse=True
+            )
+            for window_probs in probs
+        ]
+    
+    def unload(self):
+        """Release the shared model and pipeline."""
+        super().unload()
+        self.model = None
+        self.processor = None
+        self.pipe = None
+    
     def get_model_info(self) -> Dict[str, Any]:
         """Get transformers model info."""
         return {
             "backend": "transformers",
             "model_name": self.model_name,
             "device": self.device,
-            "compute_type": "auto",
+            "compute_type": str(self.torch_dtype).replace("torch.", "") if self.torch_dtype is not None else "auto",
             "model_size_in_memory": "Unknown"
         }
 
 
+def _directory_size(path: str) -> int:
+    """Total size in bytes of the files under a model directory."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _has_alignment_heads(model_path: str) -> Optional[bool]:
+    """
+    Read from a converted model's config.json whether it lists alignment heads.
+    
+    CTranslate2 needs them for word timestamps. Returns None if the config
+    can't be read, in which case support is found out while decoding.
+    """
+    try:
+        with open(os.path.join(model_path, "config.json"), encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return bool(config.get("alignment_heads"))
+
+
+def _options_key(options: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Hashable form of model load options for registry keys."""
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value) for name, value in options.items()
+    ))
+
+
+def _cuda_available(backend_name: str) -> bool:
+    """Return True if the backend's runtime can see a CUDA device."""
+    try:
+        if backend_name == "ct2":
+            import ctranslate2
+            
+            return ctranslate2.get_cuda_device_count() > 0
+        
+        import torch
+        
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+def available_cpu_count() -> int:
+    """CPU cores this process may run on, respecting affinity masks (e.g. taskset, cgroup cpusets)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _resolve_device(
+    device: str,
+    compute_type: Optional[str],
+    cpu_threads: int,
+    backend_name: str,
+    num_workers: int = 1
+) -> Tuple[str, str, int]:
+    """
+    Resolve device="auto", compute_type=None/"auto" and cpu_threads=0 for this host.
+    
+    Auto picks CUDA with float16 when a GPU is visible and CPU with int8 otherwise.
+    On CPU, cpu_threads=0 splits the available cores between the ct2 model's
+    num_workers replicas (each runs cpu_threads threads), unless OMP_NUM_THREADS is set.
+    """
+    if device == "auto":
+        device = "cuda" if _cuda_available(backend_name) else "cpu"
+    if compute_type in (None, "auto"):
+        compute_type = "float16" if device == "cuda" else "int8"
+    if device == "cpu" and cpu_threads == 0 and "OMP_NUM_THREADS" not in os.environ:
+        replicas = max(1, num_workers) if backend_name == "ct2" else 1
+        cpu_threads = max(1, available_cpu_count() // replicas)
+    return device, compute_type, cpu_threads
+
+
 def _detect_model_backend(model_name: str, backend: Optional[str] = None) -> str:
     """Auto-detect appropriate backend for a model."""
     if backend:
@@ -447,6 +1267,184 @@ def _detect_model_backend(model_name: str, backend: Optional[str] = None) -> str
     return "ct2"
 
 
+# Defaults shared by every PingalaTranscriber entry point (mirrors transcribe_file)
+_TRANSCRIBE_DEFAULTS: Dict[str, Any] = {
+    "beam_size": 5,
+    "best_of": None,
+    "patience": 1.0,
+    "length_penalty": 1.0,
+    "repetition_penalty": 1.0,
+    "no_repeat_ngram_size": 0,
+    "temperature": 0.0,
+    "compression_ratio_threshold": 2.4,
+    "log_prob_threshold": -1.0,
+    "no_speech_threshold": 0.6,
+    "condition_on_previous_text": True,
+    "prompt_reset_on_temperature": 0.5,
+    "initial_prompt": None,
+    "prefix": None,
+    "suppress_blank": True,
+    "suppress_tokens": [-1],
+    "without_timestamps": False,
+    "max_initial_timestamp": 0.0,
+    "word_timestamps": False,
+    "prepend_punctuations": "\"'([{-",
+    "append_punctuations": "\"'.。,，!！?？:：\")]}",
+    "vad_filter": False,
+    "vad_parameters": None,
+    "language": None,
+    "task": "transcribe",
+    "hotwords": None,
+    "hallucination_silence_threshold": None,
+    "batch_size": None,
+}
+
+
+def _check_audio_input(audio: AudioInput):
+    """Raise FileNotFoundError for audio paths that don't exist; other inputs pass through."""
+    if is_audio_path(audio) and not os.path.exists(audio):
+        raise FileNotFoundError(f"Audio file not found: {os.fspath(audio)}")
+
+
+def _build_transcribe_params(**overrides) -> Dict[str, Any]:
+    """Merge transcription parameter overrides into the transcribe_file defaults."""
+    unknown = set(overrides) - set(_TRANSCRIBE_DEFAULTS)
+    if unknown:
+        raise TypeError(f"Unexpected transcription parameter(s): {', '.join(sorted(unknown))}")
+    
+    params = dict(_TRANSCRIBE_DEFAULTS)
+    params.update(overrides)
+    params["vad_parameters"] = params["vad_parameters"] or {}
+    return params
+
+
+class _BatchFile:
+    """Bookkeeping for one input of a batched transcription."""
+    
+    def __init__(self, duration: float, num_windows: int, language: Optional[str], speech_duration: float):
+        self.duration = duration
+        self.speech_duration = speech_duration
+        self.language = language
+        self.language_probability = 1.0 if language else 0.0
+        self.all_language_probs = []
+        self.segments = [None] * num_windows
+        self.remaining = num_windows
+    
+    def result(self) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
+        segments = [segment for segment in self.segments if segment is not None]
+        info = TranscriptionInfo(
+            language=self.language or "unknown",
+            language_probability=self.language_probability,
+            duration=self.duration,
+            duration_after_vad=self.speech_duration,
+            all_language_probs=self.all_language_probs
+        )
+        return segments, info
+
+
+def _transcribe_batched(
+    engine: Any,
+    audios: Iterable[Any],
+    batch_size: int = 8,
+    language: Optional[str] = None,
+    task: str = "transcribe",
+    log_prob_threshold: Optional[float] = -1.0,
+    no_speech_threshold: Optional[float] = 0.6,
+    vad_filter: bool = False,
+    vad_parameters: Optional[Dict[str, Any]] = None,
+    silence_gate: Optional[SilenceGate] = None,
+    **decode_params
+) -> Iterator[Tuple[List[TranscriptionSegment], TranscriptionInfo]]:
+    """
+    Transcribe decoded audios by packing their 30 second windows into shared batches.
+    
+    engine provides detect_language_windows() and decode_windows() (a backend or a
+    scheduler). Audios are consumed lazily and results are yielded in input order
+    as soon as every window of an input has been decoded. With vad_filter, only the
+    detected speech is packed into windows and segment times are mapped back to
+    the original audio. Windows that silence_gate finds silent are not decoded.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    
+    files: List[_BatchFile] = []
+    pending = deque()
+    next_result = 0
+    
+    def run_batch(items):
+        # Detect the language of each new input from its first window
+        undetected = []
+        for file_index, window_index, _, window in items:
+            state = files[file_index]
+            if state.language is None and window_index == 0:
+                undetected.append((state, window))
+        if undetected:
+            detected = engine.detect_language_windows([window for _, window in undetected])
+            for (state, _), window_probs in zip(undetected, detected):
+                state.language, state.language_probability = window_probs[0]
+                state.all_language_probs = window_probs[:5]
+        
+        segments = engine.decode_windows(
+            [window for _, _, _, window in items],
+            [files[file_index].language for file_index, _, _, _ in items],
+            task=task,
+            **decode_params
+        )
+        
+        for (file_index, window_index, window, _), segment in zip(items, segments):
+            state = files[file_index]
+            state.remaining -= 1
+            
+            # Same silence rule as faster-whisper: high no-speech and low log probability
+            silent = (
+                no_speech_threshold is not None
+                and segment.no_speech_prob is not None
+                and segment.no_speech_prob > no_speech_threshold
+                and (log_prob_threshold is None or segment.avg_logprob < log_prob_threshold)
+            )
+            if silent or not segment.text.strip():
+                continue
+            
+            segment.start = window.to_source_time(segment.start)
+            segment.end = window.to_source_time(segment.end)
+            state.segments[window_index] = segment
+    
+    def completed():
+        nonlocal next_result
+        while next_result < len(files) and files[next_result].remaining == 0:
+            yield files[next_result].result()
+            files[next_result] = None  # Release the finished input
+            next_result += 1
+    
+    for audio in audios:
+        if vad_filter:
+            windows = speech_windows(audio, vad_parameters)
+        else:
+            windows = pack_speech_windows(audio, [{"start": 0, "end": len(audio)}])
+        if silence_gate is not None and windows:
+            silent = [silence_gate.is_silent(window.samples) for window in windows]
+            if any(silent):
+                silence_gate.record(
+                    sum(len(window) for window, skip in zip(windows, silent) if skip) / SAMPLE_RATE,
+                    windows=sum(silent),
+                    whole_file=all(silent)
+                )
+                windows = [window for window, skip in zip(windows, silent) if not skip]
+        file_index = len(files)
+        speech_duration = sum(len(window) for window in windows) / SAMPLE_RATE
+        files.append(_BatchFile(len(audio) / SAMPLE_RATE, len(windows), language, speech_duration))
+        for window_index, window in enumerate(windows):
+            pending.append((file_index, window_index, window, window.samples))
+        
+        while len(pending) >= batch_size:
+            run_batch([pending.popleft() for _ in range(batch_size)])
+        yield from completed()
+    
+    while pending:
+        run_batch([pending.popleft() for _ in range(min(batch_size, len(pending)))])
+    yield from completed()
+
+
 class PingalaTranscriber:
     """
     Speech transcription class by Shunya Labs.
@@ -454,6 +1452,14 @@ class PingalaTranscriber:
     This class provides a unified interface for transcribing audio files using
     different backends: ct2 (CTranslate2) and transformers.
     Optimized for Shunya Labs models with superior performance.
+    
+    Thread safety: one instance can serve many threads at once. The transcription,
+    language detection and load_audio methods keep their state per call and share
+    only the model and the locked audio, result and model caches. With ct2, set
+    num_workers to the number of threads that should decode in parallel; the
+    transformers backend runs one inference at a time per model. Configure the
+    instance (enable_batching()) before sharing it, and call close() once the
+    threads are done.
     """
     
     DEFAULT_MODEL_NAME = "shunyalabs/pingala-v1-en-verbatim"
@@ -462,8 +1468,15 @@ class PingalaTranscriber:
         self, 
         model_name: Optional[str] = None,
         device: str = "cuda", 
-        compute_type: str = "float16",
-        backend: Optional[str] = None
+        compute_type: Optional[str] = None,
+        backend: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_max_size: int = 1024 * 1024 * 1024,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        device_index: Union[int, List[int]] = 0,
+        download_root: Optional[str] = None,
+        silence_threshold_db: Optional[float] = None
     ):
         """
         Initialize the Pingala transcriber by Shunya Labs.
@@ -475,17 +1488,50 @@ class PingalaTranscriber:
                 - Shunya Labs models: "shunyalabs/pingala-v1-en-verbatim"
                 - Custom Hugging Face models (as needed)
                 - Local model paths: "/path/to/local/model"
-            device (str): Device ("cuda", "cpu", "auto")  
-            compute_type (str): Precision ("float16", "float32", "int8")
+            device (str): Device ("cuda", "cpu", "auto"). "auto" uses CUDA if a GPU is visible.
+            compute_type (str, optional): Precision ("float16", "float32", "int8", "int8_float16").
+                Defaults to float16 on CUDA and int8 on CPU.
             backend (str, optional): Backend ("ct2", "transformers"). Auto-detects if None.
+            cache_dir (str, optional): Directory of the on-disk result cache used by
+                transcribe_file. Caching is disabled if None.
+            cache_max_size (int): Size limit of the result cache in bytes (default: 1 GiB)
+            cpu_threads (int): Inference threads on CPU, per replica with num_workers. 0 divides
+                the cores available to the process between the replicas, or uses
+                OMP_NUM_THREADS if it is set (default: 0)
+            num_workers (int): Model replicas that can decode in parallel, so
+                transcribe calls from that many threads run concurrently (ct2 only, default: 1)
+            device_index (int or List[int]): GPU id(s) to load the model on (default: 0)
+            download_root (str, optional): Directory for downloaded models
+                (default: the Hugging Face cache)
+            silence_threshold_db (float, optional): Skip audio whose loudest 30 ms frame is
+                quieter than this level in dBFS (e.g. -50) without running the model.
+                Silent inputs get an empty result; disabled if None.
+        
+        Transcribers with the same model, backend, device and compute type share one
+        loaded model through the process-wide registry (see get_model_registry()).
+        Call close() or use the transcriber as a context manager to release it.
         """
         self.model_name = model_name or self.DEFAULT_MODEL_NAME
-        self.device = device
-        self.compute_type = compute_type
+        self.cache = TranscriptionCache(cache_dir, cache_max_size) if cache_dir else None
+        self.scheduler = None
+        # Counters are available through silence_gate.stats()
+        self.silence_gate = SilenceGate(silence_threshold_db) if silence_threshold_db is not None else None
         
         # Detect or set backend
         self.backend_name = _detect_model_backend(self.model_name, backend)
         
+        device, compute_type, cpu_threads = _resolve_device(
+            device, compute_type, cpu_threads, self.backend_name, num_workers
+        )
+        self.device = device
+        self.compute_type = compute_type
+        self.load_options = {
+            "cpu_threads": cpu_threads,
+            "num_workers": num_workers,
+            "device_index": device_index,
+            "download_root": download_root
+        }
+        
         # Initialize backend
         if self.backend_name == "ct2":
             self.backend = CT2Backend()
@@ -496,23 +1542,116 @@ class PingalaTranscriber:
         
         # Load model
         try:
-            self.backend.load_model(self.model_name, device, compute_type)
+            self.backend.load_model(self.model_name, device, compute_type, **self.load_options)
         except Exception as e:
             # Fallback to ct2 if model loading fails with transformers
             if self.backend_name == "transformers":
                 warnings.warn(f"Failed to load with transformers backend: {e}. Falling back to ct2.")
                 self.backend_name = "ct2"
                 self.backend = CT2Backend()
-                self.backend.load_model(self.model_name, device, compute_type)
+                self.backend.load_model(self.model_name, device, compute_type, **self.load_options)
             else:
                 raise
     
-    def detect_language(self, audio_path: str) -> TranscriptionInfo:
+    def load_audio(self, audio_path: AudioInput) -> AudioBuffer:
+        """
+        Decode and resample audio once and return a reusable AudioBuffer.
+        
+        Every method of this class accepts the returned buffer. Decoded files are
+        kept in a process-wide cache keyed by path, size and modification time, and
+        methods given a path that was already loaded reuse the cached samples.
+        
+        Args:
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
+        
+        Returns:
+            AudioBuffer: Decoded 16 kHz mono samples
+        
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+            RuntimeError: If decoding fails
+        """
+        if isinstance(audio_path, AudioBuffer):
+            return audio_path
+        
+        _check_audio_input(audio_path)
+        if not is_audio_path(audio_path):
+            return AudioBuffer(self.backend.load_audio(audio_path), source=describe_audio(audio_path))
+        
+        key = audio_buffer_cache.key_for(audio_path, type(self.backend).__name__)
+        buffer = audio_buffer_cache.get(key)
+        if buffer is None:
+            buffer = AudioBuffer(self.backend.load_audio(audio_path), source=os.fspath(audio_path))
+            audio_buffer_cache.put(key, buffer)
+        return buffer
+    
+    def _cached_audio(self, audio_path: AudioInput) -> AudioInput:
+        """Swap a path for its AudioBuffer if load_audio() already decoded it."""
+        if not is_audio_path(audio_path):
+            return audio_path
+        try:
+            key = audio_buffer_cache.key_for(audio_path, type(self.backend).__name__)
+        except OSError:
+            return audio_path
+        return audio_buffer_cache.get(key) or audio_path
+    
+    def _gate_silence(
+        self,
+        audio_path: AudioInput,
+        language: Optional[str]
+    ) -> Tuple[AudioInput, Optional[TranscriptionInfo]]:
+        """
+        Check audio against the silence gate before it reaches the backend.
+        
+        Returns the audio to pass on (decoded once when the gate is enabled, so
+        the backend doesn't decode it again) and, for silent audio, the info of
+        its empty result. The decoded samples are not added to the audio buffer
+        cache: only load_audio() fills it, so gating a corpus doesn't evict the
+        files the caller chose to keep.
         """
-        Detect the language of an audio file.
+        audio = self._cached_audio(audio_path)
+        if self.silence_gate is None:
+            return audio, None
+        
+        if isinstance(audio, AudioBuffer):
+            buffer = audio
+        else:
+            buffer = AudioBuffer(self.backend.load_audio(audio), source=describe_audio(audio))
+        if not self.silence_gate.is_silent(buffer.samples):
+            return buffer, None
+        
+        self.silence_gate.record(buffer.duration, windows=-(-len(buffer) // WINDOW_SAMPLES), whole_file=True)
+        return buffer, TranscriptionInfo(
+            language=language or "unknown",
+            language_probability=1.0 if language else 0.0,
+            duration=buffer.duration,
+            duration_after_vad=0.0,
+            all_language_probs=None
+        )
+    
+    def detect_language(
+        self,
+        audio_path: AudioInput,
+        max_duration: Optional[float] = 30.0,
+        vad_filter: bool = False,
+        vad_parameters: Optional[Dict[str, Any]] = None,
+        num_windows: int = 3,
+        top_k: int = 5
+    ) -> TranscriptionInfo:
+        """
+        Detect the language of an audio file without transcribing it.
+        
+        Only the first max_duration seconds are decoded, or, with vad_filter,
+        up to num_windows speech windows spread across the file.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
+            max_duration (float, optional): Seconds from the start to analyse (default: 30.0).
+                None analyses up to num_windows windows from the start.
+            vad_filter (bool): Detect on VAD-selected speech windows instead (default: False)
+            vad_parameters (dict, optional): VAD configuration parameters
+            num_windows (int): Maximum number of 30 second windows to score (default: 3)
+            top_k (int): Number of candidates kept in all_language_probs (default: 5)
         
         Returns:
             TranscriptionInfo: Language detection information
@@ -521,14 +1660,21 @@ class PingalaTranscriber:
             FileNotFoundError: If audio file doesn't exist
             RuntimeError: If language detection fails
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        _check_audio_input(audio_path)
+        audio_path = self._cached_audio(audio_path)
         
-        return self.backend.detect_language(audio_path)
+        return self.backend.detect_language(
+            audio_path,
+            max_duration=max_duration,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
+            num_windows=num_windows,
+            top_k=top_k
+        )
     
     def transcribe_file(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         best_of: Optional[int] = None,
         patience: float = 1.0,
@@ -555,18 +1701,28 @@ class PingalaTranscriber:
         language: Optional[str] = None,
         task: str = "transcribe",
         hotwords: Optional[str] = None,
-        hallucination_silence_threshold: Optional[float] = None
+        hallucination_silence_threshold: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        use_cache: bool = True
     ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
         """
         Transcribe an audio file with full control over parameters.
         Note: Not all parameters are supported by all backends.
+        When the transcriber has a cache_dir, results for the same audio content,
+        model and parameters are returned from the on-disk cache.
+        When it has a silence_threshold_db, silent audio returns no segments
+        without running the model.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
             beam_size (int): Beam size for decoding (default: 5)
             word_timestamps (bool): Include word-level timestamps (default: False)
             language (str, optional): Language code (e.g., "en")
             task (str): Task type - "transcribe" or "translate" (default: "transcribe")
+            batch_size (int, optional): Chunks decoded per forward pass for long audio
+                (transformers backend only, default: 8)
+            use_cache (bool): Read and write the result cache, if there is one (default: True).
+                Disable for audio that won't be transcribed again, such as live-stream windows.
             [Additional parameters for ct2 backend]
         
         Returns:
@@ -576,8 +1732,7 @@ class PingalaTranscriber:
             FileNotFoundError: If audio file doesn't exist
             RuntimeError: If transcription fails
         """
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        _check_audio_input(audio_path)
         
         # Prepare parameters (backend will filter out unsupported ones)
         params = {
@@ -607,14 +1762,151 @@ class PingalaTranscriber:
             "language": language,
             "task": task,
             "hotwords": hotwords,
-            "hallucination_silence_threshold": hallucination_silence_threshold
+            "hallucination_silence_threshold": hallucination_silence_threshold,
+            "batch_size": batch_size
         }
         
-        return self.backend.transcribe(audio_path, **params)
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = self.cache.make_key(audio_path, self._cache_identity(), params)
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return (
+                    [TranscriptionSegment.from_dict(segment) for segment in cached["segments"]],
+                    TranscriptionInfo.from_dict(cached["info"])
+                )
+        
+        audio, silent_info = self._gate_silence(audio_path, language)
+        if silent_info is not None:
+            return [], silent_info
+        
+        segments, info = self.backend.transcribe(audio, **params)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, {
+                "segments": [segment.to_dict() for segment in segments],
+                "info": info.to_dict()
+            })
+        return segments, info
+    
+    def _cache_identity(self) -> Dict[str, Any]:
+        """Model settings that change transcription results, used in cache keys."""
+        return {
+            "model_name": self.model_name,
+            "backend": self.backend_name,
+            "compute_type": self.compute_type
+        }
+    
+    def transcribe_batch(
+        self,
+        audio_paths: List[AudioInput],
+        batch_size: int = 8,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        vad_filter: Optional[bool] = None,
+        **kwargs
+    ) -> List[Tuple[List[TranscriptionSegment], TranscriptionInfo]]:
+        """
+        Transcribe several audio files, decoding 30 second windows from different
+        files together in batches of batch_size.
+        
+        By default each file's speech is detected first (when faster-whisper's VAD
+        is installed) and only the speech, packed into 30 second windows, is
+        decoded, so windows end in pauses. With vad_filter=False, or without VAD,
+        the audio is cut on a fixed 30 second grid.
+        
+        Batched decoding trades accuracy for throughput compared with transcribe_file:
+        - Each window is decoded without timestamps and becomes one segment, so
+          segments span up to 30 seconds.
+        - A word that straddles a window boundary can be dropped or garbled. On
+          the fixed grid this can happen every 30 seconds; with VAD only where
+          one speech region runs longer than a window.
+        - Speech the VAD misses, such as short or very quiet utterances, is not
+          transcribed.
+        - Windows don't see the previous window's text, and word timestamps and
+          the temperature fallback are not applied.
+        
+        Args:
+            audio_paths (List[AudioInput]): Audio inputs (paths, file objects, arrays or PCM bytes)
+            batch_size (int): Number of windows decoded per forward pass (default: 8)
+            beam_size (int): Beam size for decoding (default: 5)
+            language (str, optional): Language code (e.g., "en"). Detected per file if None.
+            task (str): Task type - "transcribe" or "translate" (default: "transcribe")
+            vad_filter (bool, optional): Decode only VAD-detected speech. None uses VAD
+                when it is installed (default: None)
+            **kwargs: Additional transcription parameters (see transcribe_file)
+        
+        Returns:
+            List[Tuple[List[TranscriptionSegment], TranscriptionInfo]]: Results in input order
+        
+        Raises:
+            FileNotFoundError: If an audio file doesn't exist
+            RuntimeError: If transcription fails
+        """
+        for audio_path in audio_paths:
+            _check_audio_input(audio_path)
+        
+        if vad_filter is None:
+            vad_filter = vad_available()
+        params = _build_transcribe_params(
+            beam_size=beam_size, language=language, task=task, vad_filter=vad_filter, **kwargs
+        )
+        params.pop("batch_size")
+        if params.pop("word_timestamps"):
+            warnings.warn("Word timestamps are not applied by transcribe_batch.")
+        
+        audios = (self.backend.load_audio(self._cached_audio(audio_path)) for audio_path in audio_paths)
+        engine = self.scheduler or self.backend
+        return list(_transcribe_batched(
+            engine,
+            audios,
+            batch_size=batch_size,
+            silence_gate=self.silence_gate,
+            **params
+        ))
+    
+    def enable_batching(self, max_batch_size: int = 8, max_wait_ms: float = 10.0) -> "BatchScheduler":
+        """
+        Batch windows from concurrent transcribe_batch calls into shared forward passes.
+        
+        Once enabled, transcribe_batch calls made from different threads queue their
+        30 second windows with a BatchScheduler, which runs up to max_batch_size
+        windows with the same decoding options together, waiting at most
+        max_wait_ms for a batch to fill.
+        
+        Args:
+            max_batch_size (int): Most windows run in one forward pass (default: 8)
+            max_wait_ms (float): Longest time a window waits for the batch to fill (default: 10)
+        
+        Returns:
+            BatchScheduler: The scheduler, also usable directly through its transcribe() method
+        """
+        from .scheduler import BatchScheduler
+        
+        if self.scheduler is not None:
+            self.scheduler.close()
+        self.scheduler = BatchScheduler(self.backend, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        return self.scheduler
+    
+    def create_streaming_session(self, **kwargs) -> "StreamingSession":
+        """
+        Start incremental transcription of live audio fed in chunks.
+        
+        Args:
+            **kwargs: StreamingSession arguments such as language, min_chunk_seconds
+                and max_buffer_seconds
+        
+        Returns:
+            StreamingSession: Session accepting 16-bit PCM bytes or float32 samples through feed()
+        """
+        from .streaming import StreamingSession
+        
+        return StreamingSession(self, **kwargs)
     
     def transcribe_file_simple(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         language: Optional[str] = None,
         word_timestamps: bool = False
@@ -623,7 +1915,7 @@ class PingalaTranscriber:
         Simple transcription method for backward compatibility.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
             beam_size (int): Beam size for decoding (default: 5)
             language (str, optional): Language code (e.g., "en")
             word_timestamps (bool): Include word-level timestamps (default: False)
@@ -641,7 +1933,7 @@ class PingalaTranscriber:
     
     def transcribe_with_word_timestamps(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         language: Optional[str] = None,
         **kwargs
@@ -650,7 +1942,7 @@ class PingalaTranscriber:
         Transcribe with word-level timestamps enabled.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
             beam_size (int): Beam size for decoding (default: 5)
             language (str, optional): Language code (e.g., "en")
             **kwargs: Additional transcription parameters
@@ -666,9 +1958,84 @@ class PingalaTranscriber:
             **kwargs
         )
     
+    def transcribe_stream(
+        self,
+        audio_path: AudioInput,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **kwargs
+    ) -> Tuple[Iterator[TranscriptionSegment], TranscriptionInfo]:
+        """
+        Start a transcription and return a lazy segment iterator with its info.
+        Note: Only ct2 backend decodes incrementally; other backends transcribe
+        the whole file before returning.
+        
+        Args:
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
+            beam_size (int): Beam size for decoding (default: 5)
+            language (str, optional): Language code (e.g., "en")
+            word_timestamps (bool): Include word-level timestamps (default: False)
+            **kwargs: Additional transcription parameters (see transcribe_file)
+        
+        Returns:
+            Tuple[Iterator[TranscriptionSegment], TranscriptionInfo]: Segment iterator and info
+        
+        Raises:
+            FileNotFoundError: If audio file doesn't exist
+            RuntimeError: If transcription fails
+        """
+        _check_audio_input(audio_path)
+        
+        params = _build_transcribe_params(
+            beam_size=beam_size,
+            language=language,
+            word_timestamps=word_timestamps,
+            **kwargs
+        )
+        audio, silent_info = self._gate_silence(audio_path, language)
+        if silent_info is not None:
+            return iter([]), silent_info
+        return self.backend.transcribe_stream(audio, **params)
+    
+    def transcribe_columnar(
+        self,
+        audio_path: AudioInput,
+        beam_size: int = 5,
+        language: Optional[str] = None,
+        word_timestamps: bool = False,
+        **kwargs
+    ) -> "TranscriptResult":
+        """
+        Transcribe into a compact TranscriptResult instead of a list of segments.
+        
+        Segments are packed into NumPy columns as they are decoded, so long
+        word-timestamped transcripts never hold a Python object per word.
+        
+        Args:
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
+            beam_size (int): Beam size for decoding (default: 5)
+            language (str, optional): Language code (e.g., "en")
+            word_timestamps (bool): Include word-level timestamps (default: False)
+            **kwargs: Additional transcription parameters (see transcribe_file)
+        
+        Returns:
+            TranscriptResult: Columnar segments and words with the transcription info
+        """
+        from .result import TranscriptResult
+        
+        segments, info = self.transcribe_stream(
+            audio_path,
+            beam_size=beam_size,
+            language=language,
+            word_timestamps=word_timestamps,
+            **kwargs
+        )
+        return TranscriptResult.from_segments(segments, info)
+    
     def transcribe_file_generator(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         language: Optional[str] = None,
         word_timestamps: bool = False,
@@ -679,7 +2046,7 @@ class PingalaTranscriber:
         Note: Only ct2 backend supports true streaming.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
             beam_size (int): Beam size for decoding (default: 5)
             language (str, optional): Language code (e.g., "en")
             word_timestamps (bool): Include word-level timestamps (default: False)
@@ -688,7 +2055,7 @@ class PingalaTranscriber:
         Yields:
             TranscriptionSegment: Transcription segments as they are processed
         """
-        segments, _ = self.transcribe_file(
+        segments, _ = self.transcribe_stream(
             audio_path,
             beam_size=beam_size,
             language=language,
@@ -701,7 +2068,7 @@ class PingalaTranscriber:
     
     def transcribe_with_vad(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         beam_size: int = 5,
         language: Optional[str] = None,
         vad_parameters: Optional[Dict[str, Any]] = None,
@@ -709,10 +2076,16 @@ class PingalaTranscriber:
     ) -> Tuple[List[TranscriptionSegment], TranscriptionInfo]:
         """
         Transcribe with Voice Activity Detection (VAD) filtering.
-        Note: Only supported by ct2 backend.
+        
+        Silence is removed before decoding. The transformers backend, and the
+        ct2 backend when batch_size is given without word timestamps, pack the
+        detected speech into 30 second windows, decode batch_size windows per
+        forward pass and map the segment times back to the original audio (one
+        segment per window). Otherwise ct2 decodes the speech sequentially with
+        faster-whisper's VAD filter, which keeps finer segments and word timestamps.
         
         Args:
-            audio_path (str): Path to the audio file
+            audio_path (AudioInput): Path, file-like object, float32 array or 16-bit PCM bytes
             beam_size (int): Beam size for decoding (default: 5)
             language (str, optional): Language code (e.g., "en")
             vad_parameters (dict, optional): VAD configuration parameters
@@ -721,26 +2094,22 @@ class PingalaTranscriber:
         Returns:
             Tuple[List[TranscriptionSegment], TranscriptionInfo]: Filtered segments and info
         """
-        if self.backend_name != "ct2":
-            warnings.warn(f"VAD filtering not supported by {self.backend_name} backend. Proceeding without VAD.")
-            return self.transcribe_file(
-                audio_path,
+        default_vad_params = dict(DEFAULT_VAD_PARAMETERS)
+        if vad_parameters:
+            default_vad_params.update(vad_parameters)
+        
+        batch_size = kwargs.get("batch_size")
+        if self.backend_name == "ct2" and batch_size and not kwargs.get("word_timestamps"):
+            kwargs.pop("batch_size")
+            return self.transcribe_batch(
+                [audio_path],
+                batch_size=batch_size,
                 beam_size=beam_size,
                 language=language,
+                vad_filter=True,
+                vad_parameters=default_vad_params,
                 **kwargs
-            )
-        
-        default_vad_params = {
-            "threshold": 0.5,
-            "min_speech_duration_ms": 250,
-            "max_speech_duration_s": float("inf"),
-            "min_silence_duration_ms": 2000,
-            "window_size_samples": 1024,
-            "speech_pad_ms": 400
-        }
-        
-        if vad_parameters:
-            default_vad_params.update(vad_parameters)
+            )[0]
         
         return self.transcribe_file(
             audio_path,
@@ -777,4 +2146,37 @@ class PingalaTranscriber:
         Returns:
             Dict[str, Any]: Model and backend information
         """
-        return self.backend.get_model_info() 
\ No newline at end of file
+        return self.backend.get_model_info()
+    
+    def close(self):
+        """
+        Release this transcriber's reference to the shared model.
+        
+        The model is freed once no other transcriber uses it, unless the model
+        registry's memory budget keeps it resident for reuse.
+        The transcriber can't be used after closing.
+        """
+        scheduler = getattr(self, "scheduler", None)
+        if scheduler is not None:
+            scheduler.close()
+            self.scheduler = None
+        
+        backend = getattr(self, "backend", None)
+        if backend is not None:
+            backend.unload()
+    
+    def unload(self):
+        """Alias for close()."""
+        self.close()
+    
+    def __enter__(self) -> "PingalaTranscriber":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass 
\ No newline at end of file
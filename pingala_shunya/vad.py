@@ -0,0 +1,173 @@
+"""
+Voice activity detection stage for Pingala Shunya.
+Packs detected speech into 30 second windows that any backend can decode in batches.
+Developed by Shunya Labs.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import bisect
+
+from .audio import SAMPLE_RATE, WINDOW_SAMPLES
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Defaults used by PingalaTranscriber.transcribe_with_vad
+DEFAULT_VAD_PARAMETERS = {
+    "threshold": 0.5,
+    "min_speech_duration_ms": 250,
+    "max_speech_duration_s": float("inf"),
+    "min_silence_duration_ms": 2000,
+    "window_size_samples": 1024,
+    "speech_pad_ms": 400
+}
+
+
+class SpeechWindow:
+    """
+    Up to 30 seconds of speech cut from one recording, with the silence removed.
+
+    chunks holds (window sample, source sample) pairs: the speech starting at
+    that sample of the window starts at that sample of the original audio.
+    """
+
+    __slots__ = ("samples", "chunks")
+
+    def __init__(self, samples: "np.ndarray", chunks: List[Tuple[int, int]]):
+        self.samples = samples
+        self.chunks = chunks
+
+    @property
+    def duration(self) -> float:
+        """Seconds of speech in the window."""
+        return len(self.samples) / SAMPLE_RATE
+
+    def to_source_time(self, seconds: float) -> float:
+        """Map a time relative to the window start to a time in the original audio."""
+        sample = max(0, int(round(seconds * SAMPLE_RATE)))
+        index = bisect.bisect_right(self.chunks, (sample, float("inf"))) - 1
+        window_start, source_start = self.chunks[max(0, index)]
+        return (source_start + sample - window_start) / SAMPLE_RATE
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __repr__(self) -> str:
+        return f"SpeechWindow(duration={self.duration:.2f}s, chunks={len(self.chunks)})"
+
+
+def vad_available() -> bool:
+    """Whether detect_speech() can run, i.e. faster-whisper and its Silero VAD are installed."""
+    import importlib.util
+
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def detect_speech(audio: "np.ndarray", vad_parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, int]]:
+    """
+    Find speech regions with faster-whisper's Silero VAD.
+
+    Parameters that the installed faster-whisper's VadOptions doesn't know
+    (window_size_samples was dropped in 1.0) are ignored.
+
+    Args:
+        audio (np.ndarray): float32 samples at 16 kHz
+        vad_parameters (dict, optional): VadOptions parameters
+
+    Returns:
+        List[Dict[str, int]]: Regions as {"start": sample, "end": sample}, in order
+    """
+    import inspect
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    accepted = inspect.signature(VadOptions).parameters
+    options = {name: value for name, value in (vad_parameters or {}).items() if name in accepted}
+    return get_speech_timestamps(audio, VadOptions(**options))
+
+
+def pack_speech_windows(
+    audio: "np.ndarray",
+    speech_chunks: List[Dict[str, int]],
+    window_samples: int = WINDOW_SAMPLES
+) -> List[SpeechWindow]:
+    """
+    Concatenate speech regions into as few windows of window_samples as possible.
+
+    Regions are packed in order; a region that doesn't fit in the current
+    window continues in the next one, so no window exceeds window_samples.
+    A single region covering the whole audio gives the plain 30 second grid.
+
+    Args:
+        audio (np.ndarray): float32 samples at 16 kHz
+        speech_chunks (List[Dict[str, int]]): Regions as returned by detect_speech()
+        window_samples (int): Window size in samples (default: 30 seconds)
+
+    Returns:
+        List[SpeechWindow]: Windows in timeline order
+    """
+    import numpy as np
+
+    windows = []
+    pieces = []
+    chunks = []
+    filled = 0
+
+    def flush():
+        nonlocal pieces, chunks, filled
+        if pieces:
+            samples = pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+            windows.append(SpeechWindow(samples, chunks))
+        pieces, chunks, filled = [], [], 0
+
+    for chunk in speech_chunks:
+        start = max(0, chunk["start"])
+        end = min(len(audio), chunk["end"])
+        while start < end:
+            size = min(end - start, window_samples - filled)
+            pieces.append(audio[start:start + size])
+            chunks.append((filled, start))
+            filled += size
+            start += size
+            if filled >= window_samples:
+                flush()
+    flush()
+    return windows
+
+
+def speech_windows(
+    audio: "np.ndarray",
+    vad_parameters: Optional[Dict[str, Any]] = None,
+    window_samples: int = WINDOW_SAMPLES
+) -> List[SpeechWindow]:
+    """Detect speech in audio and pack it into windows (see pack_speech_windows)."""
+    return pack_speech_windows(audio, detect_speech(audio, vad_parameters), window_samples)
+
+
+def select_speech_windows(
+    audio: "np.ndarray",
+    num_windows: int = 3,
+    vad_parameters: Optional[Dict[str, Any]] = None
+) -> Tuple[List["np.ndarray"], float]:
+    """
+    Pick up to num_windows 30 second windows of speech spread across the audio.
+
+    Args:
+        audio (np.ndarray): float32 samples at 16 kHz
+        num_windows (int): Maximum number of windows to return
+        vad_parameters (dict, optional): VadOptions parameters (see detect_speech)
+
+    Returns:
+        Tuple[List[np.ndarray], float]: Speech windows and total speech duration in seconds
+    """
+    windows = [window.samples for window in speech_windows(audio, vad_parameters)]
+    speech_samples = sum(len(window) for window in windows)
+
+    if len(windows) > num_windows:
+        if num_windows <= 1:
+            windows = windows[:1]
+        else:
+            # Spread the windows evenly over the recording
+            last = len(windows) - 1
+            windows = [windows[round(i * last / (num_windows - 1))] for i in range(num_windows)]
+
+    return windows, speech_samples / SAMPLE_RATE
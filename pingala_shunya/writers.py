@@ -0,0 +1,286 @@
+"""
+Streaming transcript writers for Pingala Shunya.
+Writes SRT, WebVTT, text, JSON and TSV one segment at a time.
+Developed by Shunya Labs.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, TextIO, Type
+import functools
+import json
+import sys
+
+if TYPE_CHECKING:
+    from .transcriber import TranscriptionInfo
+
+
+def format_timestamp(seconds: float, decimal_marker: str = ",") -> str:
+    """
+    Format seconds as HH:MM:SS,mmm (or with another decimal marker).
+
+    The time is rounded to whole milliseconds once and split with integer
+    arithmetic, so 0.3 seconds formats as 00:00:00,300 rather than ,299.
+    """
+    milliseconds = int(seconds * 1000 + 0.5)
+    if milliseconds < 0:
+        milliseconds = 0
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return "%s%s%03d" % (_clock(secs), decimal_marker, milliseconds)
+
+
+@functools.lru_cache(maxsize=1024)
+def _clock(seconds: int) -> str:
+    """HH:MM:SS for whole seconds; cached since consecutive timestamps share it."""
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return "%02d:%02d:%02d" % (hours, minutes, seconds)
+
+
+class SegmentWriter:
+    """
+    Base class for writers that stream segments to a text file.
+
+    Call begin() once, write() for every segment as it arrives and end() at
+    the end; or use write_all(), or the writer as a context manager (which
+    calls begin() on entry and end() on a clean exit). Each segment is
+    formatted into a list of parts and written with a single write() call, so
+    formatting is linear in the size of the output and nothing but the
+    current segment is held in memory.
+    """
+
+    # File extension for outputs in this format
+    extension = ""
+
+    def __init__(self, file: TextIO, word_timestamps: bool = False, flush: bool = False):
+        """
+        Args:
+            file (TextIO): Destination opened in text mode
+            word_timestamps (bool): Include word timings where the format supports them (default: False)
+            flush (bool): Flush after every segment, e.g. for live output to a terminal (default: False)
+        """
+        self.file = file
+        self.word_timestamps = word_timestamps
+        self.flush = flush
+        self.count = 0
+
+    def begin(self, info: Optional["TranscriptionInfo"] = None):
+        """Write the document header."""
+        header = self.format_header(info)
+        if header:
+            self.file.write(header)
+
+    def write(self, segment: Any):
+        """Format and write one segment."""
+        self.count += 1
+        self.file.write(self.format_segment(segment, self.count))
+        if self.flush:
+            self.file.flush()
+
+    def end(self):
+        """Write the document footer and flush."""
+        footer = self.format_footer()
+        if footer:
+            self.file.write(footer)
+        self.file.flush()
+
+    def write_all(self, segments: Iterable[Any], info: Optional["TranscriptionInfo"] = None) -> int:
+        """Write a whole document from an iterable of segments and return the segment count."""
+        self.begin(info)
+        for segment in segments:
+            self.write(segment)
+        self.end()
+        return self.count
+
+    def format_header(self, info: Optional["TranscriptionInfo"]) -> str:
+        return ""
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        raise NotImplementedError
+
+    def format_footer(self) -> str:
+        return ""
+
+    def __enter__(self) -> "SegmentWriter":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.end()
+
+
+class SRTWriter(SegmentWriter):
+    """SubRip subtitles; with word_timestamps the cue text is built from the words."""
+
+    extension = ".srt"
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        if self.word_timestamps and segment.words:
+            text = "".join(word.word for word in segment.words).strip()
+        else:
+            text = segment.text.strip()
+        return (
+            f"{index}\n"
+            f"{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}\n"
+            f"{text}\n\n"
+        )
+
+
+class VTTWriter(SegmentWriter):
+    """WebVTT subtitles; with word_timestamps each word carries <start>word</end> timing tags."""
+
+    extension = ".vtt"
+
+    def format_header(self, info: Optional["TranscriptionInfo"]) -> str:
+        return "WEBVTT\n\n"
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        parts = [
+            format_timestamp(segment.start, "."), " --> ", format_timestamp(segment.end, "."), "\n"
+        ]
+        if self.word_timestamps and segment.words:
+            words = []
+            for word in segment.words:
+                words.append(
+                    f"<{format_timestamp(word.start, '.')}>{word.word}</{format_timestamp(word.end, '.')}>"
+                )
+            parts.append(" ".join(words).strip())
+        else:
+            parts.append(segment.text.strip())
+        parts.append("\n\n")
+        return "".join(parts)
+
+
+class TextWriter(SegmentWriter):
+    """Timestamped plain text, one line per segment, optionally with confidence and words."""
+
+    extension = ".txt"
+
+    def __init__(
+        self,
+        file: TextIO,
+        word_timestamps: bool = False,
+        flush: bool = False,
+        show_confidence: bool = False,
+        show_words: bool = False,
+        time_width: int = 0
+    ):
+        """
+        Args:
+            show_confidence (bool): Append each segment's confidence (default: False)
+            show_words (bool): Add a line with word timings and probabilities (default: False)
+            time_width (int): Minimum width of the timestamps, for aligned columns (default: 0)
+        """
+        super().__init__(file, word_timestamps, flush)
+        self.show_confidence = show_confidence
+        self.show_words = show_words
+        self.time_width = time_width
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        width = self.time_width
+        confidence = segment.confidence if self.show_confidence else None
+        confidence_str = f" (conf: {confidence:.3f})" if confidence else ""
+        parts = [f"[{segment.start:{width}.2f}s -> {segment.end:{width}.2f}s]{confidence_str} {segment.text}\n"]
+        if self.show_words and segment.words:
+            parts.append("  Words: ")
+            for word in segment.words:
+                parts.append(f"{word.word}[{word.start:.1f}-{word.end:.1f}]({word.probability:.2f}) ")
+            parts.append("\n")
+        return "".join(parts)
+
+
+class JSONWriter(SegmentWriter):
+    """
+    A JSON document {"info": {...}, "segments": [...]} written segment by segment.
+
+    The info passed to begin() is written first; segments are serialized with
+    their to_dict(), including words when word_timestamps is set.
+    """
+
+    extension = ".json"
+
+    def format_header(self, info: Optional["TranscriptionInfo"]) -> str:
+        return '{"info": ' + json.dumps(info.to_dict() if info is not None else None) + ', "segments": ['
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        data = segment.to_dict()
+        if not self.word_timestamps:
+            data.pop("words", None)
+        separator = "\n  " if index == 1 else ",\n  "
+        return separator + json.dumps(data, ensure_ascii=False)
+
+    def format_footer(self) -> str:
+        return "\n]}\n" if self.count else "]}\n"
+
+
+class TSVWriter(SegmentWriter):
+    """
+    Tab-separated start, end (integer milliseconds) and text.
+
+    With word_timestamps, there is one row per word instead of per segment.
+    """
+
+    extension = ".tsv"
+
+    def format_header(self, info: Optional["TranscriptionInfo"]) -> str:
+        return "start\tend\ttext\n"
+
+    def format_segment(self, segment: Any, index: int) -> str:
+        if self.word_timestamps and segment.words:
+            return "".join(
+                f"{_milliseconds(word.start)}\t{_milliseconds(word.end)}\t{_tsv_text(word.word)}\n"
+                for word in segment.words
+            )
+        return f"{_milliseconds(segment.start)}\t{_milliseconds(segment.end)}\t{_tsv_text(segment.text)}\n"
+
+
+# Writer class for each output format name
+WRITERS: Dict[str, Type[SegmentWriter]] = {
+    "text": TextWriter,
+    "srt": SRTWriter,
+    "vtt": VTTWriter,
+    "json": JSONWriter,
+    "tsv": TSVWriter,
+}
+
+
+def get_writer(output_format: str, file: TextIO, **options) -> SegmentWriter:
+    """Create the writer for an output format name (see WRITERS)."""
+    try:
+        writer_class = WRITERS[output_format]
+    except KeyError:
+        raise ValueError(f"Unsupported output format: {output_format}. Supported: {', '.join(WRITERS)}")
+    return writer_class(file, **options)
+
+
+def write_segments(
+    segments: Iterable[Any],
+    output_format: str,
+    output_file: Optional[str] = None,
+    info: Optional["TranscriptionInfo"] = None,
+    **options
+) -> int:
+    """
+    Stream segments to a file, or to stdout if output_file is None.
+
+    Args:
+        segments (Iterable): Segments, e.g. the lazy iterator of transcribe_stream()
+        output_format (str): One of "text", "srt", "vtt", "json" or "tsv"
+        output_file (str, optional): Destination path
+        info (TranscriptionInfo, optional): Written by formats with a header (JSON)
+        **options: Writer options (word_timestamps, flush, show_confidence, ...)
+
+    Returns:
+        int: Number of segments written
+    """
+    if output_file is None:
+        return get_writer(output_format, sys.stdout, **options).write_all(segments, info)
+    with open(output_file, "w", encoding="utf-8") as f:
+        return get_writer(output_format, f, **options).write_all(segments, info)
+
+
+def _milliseconds(seconds: float) -> int:
+    return max(0, int(seconds * 1000 + 0.5))
+
+
+def _tsv_text(text: str) -> str:
+    return text.strip().replace("\t", " ").replace("\n", " ")
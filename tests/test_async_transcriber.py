@@ -0,0 +1,123 @@
+"""Tests for AsyncPingalaTranscriber with a stub transcriber."""
+
+import asyncio
+import threading
+
+from pingala_shunya.async_transcriber import AsyncPingalaTranscriber
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment
+
+
+class StubTranscriber:
+    """Yields num_segments segments per file and records generator closes."""
+
+    cache = None
+
+    def __init__(self, num_segments=5):
+        self.num_segments = num_segments
+        self.closed = 0
+        self.lock = threading.Lock()
+
+    def transcribe_stream(self, audio_path, **kwargs):
+        def generate():
+            try:
+                for i in range(self.num_segments):
+                    yield TranscriptionSegment(float(i), float(i + 1), f" {audio_path} {i}")
+            finally:
+                with self.lock:
+                    self.closed += 1
+
+        return generate(), TranscriptionInfo("en", 1.0, float(self.num_segments), float(self.num_segments))
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=10))
+
+
+def test_break_releases_slot_for_next_request():
+    stub = StubTranscriber()
+
+    async def main():
+        transcriber = AsyncPingalaTranscriber(stub, max_concurrency=1)
+        stream = transcriber.transcribe_stream("a.wav")
+        async for segment in stream:
+            break
+        # The stream is still referenced here, and must not hold the only slot
+        assert transcriber.active_requests == 0
+        segments, info = await transcriber.transcribe("b.wav")
+        await stream.aclose()
+        await transcriber.close()
+        return segments
+
+    segments = run(main())
+    assert [segment.text for segment in segments] == [f" b.wav {i}" for i in range(5)]
+    assert stub.closed == 2
+
+
+def test_dropped_stream_closes_decoder():
+    stub = StubTranscriber()
+
+    async def main():
+        transcriber = AsyncPingalaTranscriber(stub, max_concurrency=1)
+        async for segment in transcriber.transcribe_stream("a.wav"):
+            break
+        await transcriber.close()
+
+    run(main())
+    assert stub.closed == 1
+
+
+def test_stream_exhaustion_and_async_with():
+    stub = StubTranscriber(num_segments=3)
+
+    async def main():
+        transcriber = AsyncPingalaTranscriber(stub, max_concurrency=1)
+        async with transcriber.transcribe_stream("a.wav") as stream:
+            texts = [segment.text async for segment in stream]
+            info = stream.info
+        async for _ in stream:
+            raise AssertionError("a finished stream yields nothing")
+        await transcriber.close()
+        return texts, info
+
+    texts, info = run(main())
+    assert texts == [" a.wav 0", " a.wav 1", " a.wav 2"]
+    assert info.language == "en"
+    assert stub.closed == 1
+
+
+def test_cancelled_stream_releases_slot():
+    stub = StubTranscriber()
+    started = threading.Event()
+    release = threading.Event()
+    transcribe_stream = stub.transcribe_stream
+
+    def slow_stream(audio_path, **kwargs):
+        iterator, info = transcribe_stream(audio_path, **kwargs)
+
+        def generate():
+            for segment in iterator:
+                started.set()
+                release.wait(5)
+                yield segment
+
+        return generate(), info
+
+    stub.transcribe_stream = slow_stream
+
+    async def main():
+        transcriber = AsyncPingalaTranscriber(stub, max_concurrency=1)
+        stream = transcriber.transcribe_stream("a.wav")
+        task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        task.cancel()
+        release.set()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        assert transcriber.active_requests == 0
+        segments, _ = await transcriber.transcribe("b.wav")
+        await transcriber.close()
+        return segments
+
+    assert len(run(main())) == 5
@@ -0,0 +1,74 @@
+"""Tests for the command-line helpers."""
+
+import subprocess
+import sys
+
+import pytest
+
+from pingala_shunya.cli import output_paths_for
+
+HEAVY_MODULES = ("numpy", "torch", "faster_whisper", "transformers", "pingala_shunya.transcriber")
+
+
+def test_output_dir_keeps_subdirectories(tmp_path):
+    inputs = [tmp_path / "a" / "x.wav", tmp_path / "b" / "x.wav", tmp_path / "a" / "y.mp3"]
+    outputs = output_paths_for(inputs, "srt", str(tmp_path / "out"))
+    assert outputs == [
+        tmp_path / "out" / "a" / "x.srt",
+        tmp_path / "out" / "b" / "x.srt",
+        tmp_path / "out" / "a" / "y.srt",
+    ]
+
+
+def test_single_directory_maps_directly_into_output_dir(tmp_path):
+    inputs = [tmp_path / "rec" / "x.wav", tmp_path / "rec" / "y.wav"]
+    outputs = output_paths_for(inputs, "vtt", str(tmp_path / "out"))
+    assert outputs == [tmp_path / "out" / "x.vtt", tmp_path / "out" / "y.vtt"]
+
+
+def test_outputs_next_to_inputs(tmp_path):
+    inputs = [tmp_path / "a" / "x.wav", tmp_path / "b" / "x.wav"]
+    assert output_paths_for(inputs, "text", None) == [tmp_path / "a" / "x.txt", tmp_path / "b" / "x.txt"]
+
+
+@pytest.mark.parametrize("output_dir", [None, "out"])
+def test_colliding_outputs_are_rejected(tmp_path, output_dir):
+    inputs = [tmp_path / "a" / "x.wav", tmp_path / "a" / "x.mp3"]
+    with pytest.raises(ValueError, match="same output"):
+        output_paths_for(inputs, "srt", output_dir and str(tmp_path / output_dir))
+
+
+def test_cli_import_and_help_skip_heavy_modules():
+    # A fresh interpreter, since this test session has already imported them
+    script = (
+        "import sys\n"
+        "import pingala_shunya.cli as cli\n"
+        "sys.argv = ['pingala', '--help']\n"
+        "try:\n"
+        "    cli.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print([name for name in {HEAVY_MODULES!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+@pytest.mark.parametrize("device, expected", [("auto", "cpu"), ("cuda", "cuda")])
+def test_processes_run_on_cpu_unless_device_is_given(tmp_path, monkeypatch, device, expected):
+    from pingala_shunya import cli, parallel
+
+    created = []
+
+    def fake_pool(**kwargs):
+        created.append(kwargs)
+        raise RuntimeError("stop before starting workers")
+
+    monkeypatch.setattr(parallel, "ProcessPoolTranscriber", fake_pool)
+    inputs = [tmp_path / "a.wav", tmp_path / "b.wav"]
+    for path in inputs:
+        path.write_bytes(b"")
+    monkeypatch.setattr(sys, "argv", ["pingala", *map(str, inputs), "--processes", "2", "--device", device])
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert created[0]["device"] == expected
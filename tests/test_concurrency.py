@@ -0,0 +1,131 @@
+"""Concurrent transcribe calls on one shared model, with a stub faster-whisper model."""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pingala_shunya.audio import SAMPLE_RATE
+from pingala_shunya.transcriber import CT2Backend, PingalaTranscriber
+
+NUM_CALLS = 200
+
+
+class StubWhisperModel:
+    """
+    Transcribes audio whose samples hold one level per second, as faster-whisper would.
+
+    Each second becomes one segment named after its level. Audio shorter than a
+    second makes language detection fail with IndexError, like real silent clips,
+    and segments are decoded lazily with a short sleep so calls interleave.
+    """
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, audio, beam_size=5, word_timestamps=False, language=None, **kwargs):
+        if language is None and len(audio) < SAMPLE_RATE:
+            raise IndexError("list index out of range")
+        duration = len(audio) / SAMPLE_RATE
+        info = SimpleNamespace(
+            language=language or "hi",
+            language_probability=0.9,
+            duration=duration,
+            duration_after_vad=duration,
+        )
+        return self._segments(audio, beam_size, word_timestamps), info
+
+    def _segments(self, audio, beam_size, word_timestamps):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            for second in range(max(1, len(audio) // SAMPLE_RATE)):
+                time.sleep(0.0005)
+                level = int(round(float(audio[second * SAMPLE_RATE]) * 1000))
+                text = f" s{level}b{beam_size}"
+                words = [SimpleNamespace(word=text, start=second, end=second + 0.5, probability=0.9)]
+                yield SimpleNamespace(
+                    start=float(second),
+                    end=second + 1.0,
+                    text=text,
+                    words=words if word_timestamps else None,
+                    avg_logprob=-0.1 * level,
+                    no_speech_prob=0.01,
+                    compression_ratio=1.2,
+                    temperature=0.0,
+                )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def shared_model(monkeypatch):
+    model = StubWhisperModel()
+    monkeypatch.setattr(
+        CT2Backend, "_create_model",
+        staticmethod(lambda model_name, device, compute_type, **kwargs: (model, "/nonexistent/stub-model", True))
+    )
+    with PingalaTranscriber("stub-concurrency-model", device="cpu", backend="ct2", num_workers=4) as transcriber:
+        yield transcriber, model
+
+
+def make_requests():
+    rng = random.Random(0)
+    requests = []
+    for i in range(NUM_CALLS):
+        seconds = rng.choice([0.5, 1, 2, 3])
+        levels = np.repeat(np.arange(i, i + 4, dtype=np.float32) / 1000, SAMPLE_RATE)
+        audio = levels[:int(seconds * SAMPLE_RATE)]
+        params = {
+            "beam_size": rng.choice([1, 5]),
+            "word_timestamps": rng.random() < 0.5,
+            "language": rng.choice([None, "en"]),
+        }
+        requests.append((audio, params))
+    return requests
+
+
+def as_dicts(result):
+    segments, info = result
+    return [segment.to_dict() for segment in segments], info.to_dict()
+
+
+def test_threaded_calls_match_sequential_results(shared_model):
+    transcriber, model = shared_model
+    requests = make_requests()
+
+    with pytest.warns(UserWarning, match="Language detection failed"):
+        expected = [as_dicts(transcriber.transcribe_file(audio, **params)) for audio, params in requests]
+
+    with pytest.warns(UserWarning, match="Language detection failed"):
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [pool.submit(transcriber.transcribe_file, audio, **params) for audio, params in requests]
+            actual = [as_dicts(future.result()) for future in futures]
+
+    assert actual == expected
+    # The calls really overlapped on the shared model
+    assert model.max_active > 1
+    # Fallbacks stay local to their call instead of changing the shared backend
+    assert transcriber.backend.word_timestamps_supported is True
+
+
+def test_threaded_streams_on_shared_model(shared_model):
+    transcriber, _ = shared_model
+    requests = [(audio, params) for audio, params in make_requests() if params["language"]]
+
+    def run(audio, params):
+        segments, info = transcriber.transcribe_stream(audio, **params)
+        return [segment.to_dict() for segment in segments], info.to_dict()
+
+    expected = [run(audio, params) for audio, params in requests]
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        actual = list(pool.map(lambda request: run(*request), requests))
+    assert actual == expected
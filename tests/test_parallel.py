@@ -0,0 +1,74 @@
+"""Tests for ProcessPoolTranscriber's dispatch, with threads standing in for worker processes."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pingala_shunya import parallel
+from pingala_shunya.parallel import ProcessPoolTranscriber
+
+
+class StubWorkerTranscriber:
+    """Sleeps for one millisecond per "second" of audio, where the audio is its duration."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = []
+
+    def transcribe_file(self, audio, **kwargs):
+        with self.lock:
+            self.started.append(audio)
+        if audio < 0:
+            raise RuntimeError(f"bad file {audio}")
+        time.sleep(audio / 1000)
+        return [], audio
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    worker = StubWorkerTranscriber()
+    probed = []
+
+    def probe(audio):
+        probed.append(audio)
+        return abs(audio)
+
+    monkeypatch.setattr(parallel, "_worker_transcriber", worker)
+    monkeypatch.setattr(parallel, "probe_duration", probe)
+    pool = ProcessPoolTranscriber.__new__(ProcessPoolTranscriber)
+    pool.num_workers = 2
+    pool._executor = ThreadPoolExecutor(max_workers=2)
+    yield pool, worker, probed
+    pool._executor.shutdown(wait=True)
+
+
+def test_results_in_input_order_with_longest_first_dispatch(pool):
+    pool, worker, _ = pool
+    durations = [5, 1, 30, 2, 8, 1, 20, 3]
+    results = [info for _, info in pool.transcribe_files(durations, lookahead=len(durations))]
+    assert results == durations
+    # The longest files of the window went to the workers first
+    assert worker.started[:2] == [30, 20]
+
+
+def test_inputs_are_probed_lazily_within_the_lookahead(pool):
+    pool, _, probed = pool
+    audio = iter([1] * 100)
+    results = pool.transcribe_files(audio, lookahead=4)
+    next(results)
+    assert len(probed) <= 5
+    assert len(list(results)) == 99
+    assert len(probed) == 100
+
+
+def test_exceptions_are_returned_in_place(pool):
+    pool, _, _ = pool
+    results = list(pool.transcribe_files([1, -1, 2], return_exceptions=True))
+    assert results[0][1] == 1
+    assert isinstance(results[1], RuntimeError)
+    assert results[2][1] == 2
+
+    with pytest.raises(RuntimeError):
+        list(pool.transcribe_files([1, -1, 2]))
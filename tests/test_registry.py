@@ -0,0 +1,68 @@
+"""Tests for the model registry's loading and sharing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pingala_shunya.registry import ModelRegistry
+
+
+def test_different_models_load_in_parallel():
+    registry = ModelRegistry()
+    both_loading = threading.Barrier(2, timeout=5)
+
+    def loader(name):
+        def load():
+            # Deadlocks (and times out) if the second load waits for the first
+            both_loading.wait()
+            return name
+        return load
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        models = list(pool.map(lambda name: registry.acquire(name, loader(name)), ["a", "b"]))
+    assert models == ["a", "b"]
+
+
+def test_concurrent_requests_share_one_load():
+    registry = ModelRegistry()
+    loads = []
+    release = threading.Event()
+
+    def load():
+        loads.append(1)
+        release.wait(5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(registry.acquire, "model", load) for _ in range(8)]
+        release.set()
+        models = [future.result() for future in futures]
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+    assert registry.stats()[0]["refcount"] == 8
+
+
+def test_failed_load_is_raised_to_waiters_and_retried_later():
+    registry = ModelRegistry()
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise OSError("download failed")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        owner = pool.submit(registry.acquire, "model", failing)
+        started.wait(5)
+        waiter = pool.submit(registry.acquire, "model", lambda: pytest.fail("second load started"))
+        # Let the waiter reach the pending load before it fails
+        time.sleep(0.1)
+        release.set()
+        for future in (owner, waiter):
+            with pytest.raises(OSError, match="download failed"):
+                future.result()
+
+    assert registry.stats() == []
+    assert registry.acquire("model", lambda: "loaded") == "loaded"
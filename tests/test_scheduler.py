@@ -0,0 +1,60 @@
+"""Tests for the micro-batching scheduler with stub backends."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pingala_shunya.scheduler import BatchScheduler
+
+
+class ShortBackend:
+    """Returns fewer results than windows, like a misbehaving backend."""
+
+    def __init__(self, num_results):
+        self.num_results = num_results
+
+    def detect_language_windows(self, windows):
+        return [[("en", 0.9)]] * min(self.num_results, len(windows))
+
+
+class LengthBackend:
+    """Detects each window's length as its language."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def detect_language_windows(self, windows):
+        self.batch_sizes.append(len(windows))
+        return [[(str(len(window)), 1.0)] for window in windows]
+
+
+def test_missing_results_fail_the_callers_instead_of_hanging():
+    with BatchScheduler(ShortBackend(0), max_wait_ms=0) as scheduler:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(scheduler.detect_language_windows, [np.zeros(10)])
+            with pytest.raises(RuntimeError, match="0 results for a batch of 1"):
+                future.result(timeout=5)
+
+
+def test_windows_with_results_still_get_them():
+    with BatchScheduler(ShortBackend(1), max_batch_size=2, max_wait_ms=1000) as scheduler:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(scheduler.detect_language_windows, [np.zeros(10)])
+            second = pool.submit(scheduler.detect_language_windows, [np.zeros(20)])
+            outcomes = []
+            for future in (first, second):
+                try:
+                    outcomes.append(future.result(timeout=5))
+                except RuntimeError:
+                    outcomes.append(None)
+    assert sorted(outcomes, key=lambda outcome: outcome is None) == [[[("en", 0.9)]], None]
+
+
+def test_concurrent_callers_share_batches():
+    backend = LengthBackend()
+    with BatchScheduler(backend, max_batch_size=4, max_wait_ms=1000) as scheduler:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda n: scheduler.detect_language_windows([np.zeros(n)]), range(1, 5)))
+    assert results == [[[(str(n), 1.0)]] for n in range(1, 5)]
+    assert backend.batch_sizes == [4]
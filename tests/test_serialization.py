@@ -0,0 +1,75 @@
+"""Tests for the binary transcript file format."""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+
+from pingala_shunya.serialization import load_transcript, save_transcript
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment, WordSegment
+
+INFO = TranscriptionInfo("en", 0.9, 2.0, 2.0)
+
+
+def segments(name):
+    return [TranscriptionSegment(0.0, 1.0, f" {name}", [WordSegment(f" {name}", 0.0, 0.5, 0.8)], -0.1)]
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "out.bin"
+    save_transcript(path, segments("héllo"), INFO)
+    segment = load_transcript(path).to_segments()[0]
+    assert segment.text == " héllo"
+    assert segment.avg_logprob == pytest.approx(-0.1)
+    # Scores are stored as float32
+    assert segment.words[0].probability == pytest.approx(0.8)
+    assert segment.words[0].word == " héllo"
+    assert load_transcript(path).info.language == "en"
+
+
+def test_scores_round_trip_at_float32_precision(tmp_path):
+    rng = random.Random(0)
+    original = []
+    for i in range(50):
+        start = i * 30 + rng.random()
+        words = [WordSegment(f" w{j}", start + j * 0.37, start + j * 0.37 + 0.2, rng.random()) for j in range(5)]
+        original.append(TranscriptionSegment(
+            start, start + 2.5, "".join(word.word for word in words), words,
+            avg_logprob=-rng.random(), no_speech_prob=rng.random() / 10,
+            compression_ratio=1 + rng.random(), temperature=rng.choice([0.0, 0.2])
+        ))
+    path = tmp_path / "scores.bin"
+    save_transcript(path, original, INFO)
+
+    def float32(value):
+        return float(np.float32(value))
+
+    fields = ("start", "end", "avg_logprob", "no_speech_prob", "compression_ratio", "temperature")
+    for expected, segment in zip(original, load_transcript(path).to_segments()):
+        assert [getattr(segment, name) for name in fields] == [float32(getattr(expected, name)) for name in fields]
+        assert [(word.start, word.end, word.probability) for word in segment.words] == [
+            (float32(word.start), float32(word.end), float32(word.probability)) for word in expected.words
+        ]
+
+
+def test_concurrent_saves_to_one_path(tmp_path):
+    path = tmp_path / "out.bin"
+    errors = []
+
+    def save(name):
+        try:
+            for _ in range(20):
+                save_transcript(path, segments(name), INFO)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=save, args=(f"t{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [p.name for p in tmp_path.iterdir()] == ["out.bin"]
+    assert load_transcript(path).text.startswith("t")
@@ -0,0 +1,150 @@
+"""Tests for the HTTP/WebSocket server on localhost with a stub transcriber."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import FormData
+from aiohttp.test_utils import TestClient, TestServer
+
+from pingala_shunya.async_transcriber import AsyncPingalaTranscriber
+from pingala_shunya.audio import SAMPLE_RATE
+from pingala_shunya.server import TranscriptionServer
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment, WordSegment
+
+BLOCK_SAMPLES = SAMPLE_RATE // 2  # One word per half second of audio
+LEVEL = 100  # PCM value step between blocks, so block i has value i * LEVEL
+
+
+class StubTranscriber:
+    """Word i is the i-th half-second block of audio, whose PCM value is i * LEVEL."""
+
+    cache = None
+
+    def __init__(self):
+        self.calls = 0
+
+    def _words(self, samples):
+        # Runs of equal samples are words; a short run is the tail of a word the session already trimmed
+        values = np.round(samples * 32768 / LEVEL).astype(int)
+        boundaries = np.flatnonzero(np.diff(values)) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(values)]])
+        words = []
+        for start, end in zip(starts, ends):
+            if end - start >= 0.45 * SAMPLE_RATE:
+                t = start / SAMPLE_RATE
+                words.append(WordSegment(f" w{values[start]}", t, t + 0.4, 0.9))
+        return words
+
+    def transcribe_file(self, audio, **kwargs):
+        self.calls += 1
+        words = self._words(_samples(audio))
+        segments = [TranscriptionSegment(words[0].start, words[-1].end, "".join(w.word for w in words), words)] if words else []
+        duration = len(_samples(audio)) / SAMPLE_RATE
+        return segments, TranscriptionInfo("en", 0.97, duration, duration)
+
+    def transcribe_stream(self, audio, **kwargs):
+        segments, info = self.transcribe_file(audio, **kwargs)
+        return iter(segments), info
+
+    def get_model_info(self):
+        return {"backend": "stub"}
+
+    def close(self):
+        pass
+
+
+def _samples(audio):
+    if hasattr(audio, "read"):
+        # Uploaded files are PCM here; the real backends decode containers
+        audio.seek(0)
+        audio = audio.read()
+    if isinstance(audio, (bytes, bytearray)):
+        return np.frombuffer(audio, dtype="<i2").astype(np.float32) / 32768
+    return audio
+
+
+def pcm(num_words):
+    blocks = [np.full(BLOCK_SAMPLES, i * LEVEL, dtype="<i2") for i in range(num_words)]
+    return np.concatenate(blocks).tobytes()
+
+
+def run_with_client(test):
+    async def main():
+        stub = StubTranscriber()
+        server = TranscriptionServer(AsyncPingalaTranscriber(stub, max_concurrency=1))
+        async with TestClient(TestServer(server.create_app())) as client:
+            return await test(client, stub)
+
+    return asyncio.run(asyncio.wait_for(main(), timeout=30))
+
+
+def test_health():
+    async def test(client, stub):
+        response = await client.get("/health")
+        assert response.status == 200
+        data = await response.json()
+        assert data["status"] == "ok"
+        assert data["model"] == {"backend": "stub"}
+
+    run_with_client(test)
+
+
+def test_transcribe_raw_pcm_and_multipart():
+    async def test(client, stub):
+        response = await client.post("/v1/transcribe?language=en", data=pcm(3), headers={"Content-Type": "audio/pcm"})
+        assert response.status == 200
+        result = (await response.json())["results"][0]
+        assert result["segments"][0]["text"] == " w0 w1 w2"
+        assert result["info"]["language"] == "en"
+
+        form = FormData()
+        form.add_field("file", pcm(2), filename="a.pcm")
+        form.add_field("file", pcm(4), filename="b.pcm")
+        response = await client.post("/v1/transcribe", data=form)
+        assert response.status == 200
+        results = (await response.json())["results"]
+        assert [result["filename"] for result in results] == ["a.pcm", "b.pcm"]
+
+    run_with_client(test)
+
+
+def test_transcribe_without_audio_is_rejected():
+    async def test(client, stub):
+        response = await client.post("/v1/transcribe", data=b"", headers={"Content-Type": "audio/pcm"})
+        assert response.status == 400
+
+    run_with_client(test)
+
+
+def test_websocket_stream_commits_incrementally():
+    num_words = 12
+
+    async def test(client, stub):
+        messages = []
+        async with client.ws_connect("/v1/stream") as ws:
+            await ws.send_json({"language": "en"})
+            audio = pcm(num_words)
+            chunk = BLOCK_SAMPLES * 2  # 0.5 s of 16-bit samples
+            for position in range(0, len(audio), chunk):
+                await ws.send_bytes(audio[position:position + chunk])
+            await ws.send_json({"type": "end"})
+            async for message in ws:
+                data = message.json()
+                messages.append(data)
+                if data["type"] in ("done", "error"):
+                    break
+        return messages, stub.calls
+
+    messages, calls = run_with_client(test)
+    assert messages[-1]["type"] == "done"
+    assert messages[-1]["info"]["duration"] == pytest.approx(num_words * 0.5)
+    committed = [m["segment"] for m in messages if m["type"] == "segment"]
+    assert " ".join(segment["text"] for segment in committed) == " ".join(f"w{i}" for i in range(num_words))
+    # Segments arrive while audio is still streaming, not only after "end"
+    assert len(committed) > 1
+    # One decode per second of audio plus the final one, not one per message
+    assert calls <= num_words * 0.5 + 2
@@ -0,0 +1,96 @@
+"""Tests for the JSON Lines bulk sink."""
+
+import json
+import warnings
+
+import pytest
+
+from pingala_shunya.sinks import JSONLSink, open_sink
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment, WordSegment
+
+INFO = TranscriptionInfo("en", 0.9, 2.0, 2.0, [("en", 0.9)])
+
+
+def segments(name):
+    return [TranscriptionSegment(0.0, 1.0, f" {name}", [WordSegment(f" {name}", 0.0, 0.5, 0.8)], -0.1)]
+
+
+def write_records(path, names, batch_size=2):
+    with open_sink(str(path), batch_size=batch_size) as sink:
+        for name in names:
+            sink.write(name, segments(name), INFO)
+
+
+def read_ids(path):
+    ids = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            ids.append(json.loads(line)["id"])
+        except ValueError:
+            ids.append(None)
+    return ids
+
+
+def test_record_contents(tmp_path):
+    path = tmp_path / "out.jsonl"
+    write_records(path, ["a"])
+    record = json.loads(path.read_text(encoding="utf-8"))
+    assert record["id"] == "a"
+    assert record["text"] == "a"
+    assert record["language"] == "en"
+    assert record["segments"][0]["words"][0]["probability"] == 0.8
+    assert record["segments"][0]["confidence"] == pytest.approx(0.904837, rel=1e-5)
+
+
+def test_resume_skips_written_ids(tmp_path):
+    path = tmp_path / "out.jsonl"
+    write_records(path, ["a", "b", "c"])
+    with open_sink(str(path)) as sink:
+        assert "b" in sink
+        assert sink.write("b", segments("b"), INFO) is False
+        assert sink.write("d", segments("d"), INFO) is True
+    assert read_ids(path) == ["a", "b", "c", "d"]
+
+
+def test_corrupt_middle_line_is_skipped_not_truncated(tmp_path):
+    path = tmp_path / "out.jsonl"
+    write_records(path, ["a", "b", "c", "d", "e"])
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[1] = "{not json\n"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    with pytest.warns(UserWarning, match="unreadable"):
+        sink = JSONLSink(str(path))
+    sink.close()
+    assert sink.completed_ids == {"a", "c", "d", "e"}
+    assert read_ids(path) == ["a", None, "c", "d", "e"]
+
+
+def test_torn_last_line_is_truncated(tmp_path):
+    path = tmp_path / "out.jsonl"
+    write_records(path, ["a", "b"])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "c", "te')
+
+    with pytest.warns(UserWarning, match="Truncating"):
+        with open_sink(str(path)) as sink:
+            sink.write("c", segments("c"), INFO)
+    assert read_ids(path) == ["a", "b", "c"]
+
+
+def test_unterminated_complete_last_line_is_kept(tmp_path):
+    path = tmp_path / "out.jsonl"
+    write_records(path, ["a", "b"])
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with open_sink(str(path)) as sink:
+            assert "b" in sink
+            sink.write("c", segments("c"), INFO)
+    assert read_ids(path) == ["a", "b", "c"]
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        open_sink(str(tmp_path / "out.txt"))
@@ -0,0 +1,85 @@
+"""Tests for StreamingSession's LocalAgreement commits with a stub transcriber."""
+
+import numpy as np
+
+from pingala_shunya.audio import SAMPLE_RATE
+from pingala_shunya.streaming import StreamingSession
+from pingala_shunya.transcriber import TranscriptionInfo, TranscriptionSegment, WordSegment
+
+WORD_SECONDS = 0.5
+NUM_WORDS = 20
+
+
+class StubTranscriber:
+    """
+    Transcribes "audio" whose sample values are their own stream times.
+
+    Word i spans [i * 0.5, i * 0.5 + 0.4) seconds. The last word of each
+    hypothesis is misrecognized unless the call is the final one, like a
+    word cut off at the end of the window.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe_file(self, audio, **kwargs):
+        self.calls.append((len(audio), kwargs))
+        offset = float(audio[0])
+        end = offset + len(audio) / SAMPLE_RATE
+        words = []
+        for i in range(NUM_WORDS):
+            start = i * WORD_SECONDS
+            if start >= offset - 1e-3 and start + 0.4 <= end + 1e-3:
+                words.append(WordSegment(f" w{i}", start - offset, start + 0.4 - offset, 0.9))
+        if words and end < NUM_WORDS * WORD_SECONDS - 1e-3:
+            words[-1] = WordSegment(words[-1].word + "?", words[-1].start, words[-1].end, 0.3)
+        segments = [TranscriptionSegment(words[0].start, words[-1].end, "".join(w.word for w in words), words)] if words else []
+        return segments, TranscriptionInfo("en", 1.0, len(audio) / SAMPLE_RATE, len(audio) / SAMPLE_RATE)
+
+
+def stream_times(seconds):
+    return (np.arange(int(seconds * SAMPLE_RATE), dtype=np.float64) / SAMPLE_RATE).astype(np.float32)
+
+
+def run_session(chunk_seconds=0.5, **session_kwargs):
+    stub = StubTranscriber()
+    session = StreamingSession(stub, language="en", **session_kwargs)
+    audio = stream_times(NUM_WORDS * WORD_SECONDS)
+    chunk = int(chunk_seconds * SAMPLE_RATE)
+    updates = [session.feed(audio[i:i + chunk]) for i in range(0, len(audio), chunk)]
+    updates.append(session.finish())
+    return stub, session, updates
+
+
+def test_transcript_is_complete_and_in_order():
+    stub, session, updates = run_session()
+    expected = " ".join(f"w{i}" for i in range(NUM_WORDS))
+    assert session.transcript() == expected
+
+    committed = [word for update in updates for segment in update.committed for word in segment.words]
+    assert [word.word for word in committed] == [f" w{i}" for i in range(NUM_WORDS)]
+    assert all(a.end <= b.start for a, b in zip(committed, committed[1:]))
+    # Agreement commits most words while audio is still arriving, not only at finish()
+    assert sum(len(segment.words) for update in updates[:-1] for segment in update.committed) >= NUM_WORDS - 2
+
+
+def test_unstable_last_word_is_never_committed_early():
+    _, session, updates = run_session()
+    for update in updates:
+        for segment in update.committed:
+            assert "?" not in segment.text
+    # Before finish(), partial hypotheses carry the misrecognized word
+    assert any(update.partial is not None and "?" in update.partial.text for update in updates[:-1])
+
+
+def test_buffer_stays_bounded():
+    stub, _, _ = run_session(max_buffer_seconds=3.0)
+    longest = max(length for length, _ in stub.calls)
+    assert longest <= (3.0 + 0.5) * SAMPLE_RATE
+
+
+def test_windows_bypass_result_cache():
+    stub, _, _ = run_session()
+    assert stub.calls
+    assert all(kwargs["use_cache"] is False for _, kwargs in stub.calls)
+    assert all(kwargs["word_timestamps"] for _, kwargs in stub.calls)
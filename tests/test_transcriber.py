@@ -0,0 +1,143 @@
+"""Tests for transcriber helpers that don't need a model."""
+
+import os
+
+import pytest
+
+from pingala_shunya import transcriber
+
+
+@pytest.fixture
+def cores_64(monkeypatch):
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.setattr(transcriber, "available_cpu_count", lambda: 64)
+
+
+def test_cpu_threads_are_split_between_ct2_workers(cores_64):
+    assert transcriber._resolve_device("cpu", None, 0, "ct2", 8) == ("cpu", "int8", 8)
+    assert transcriber._resolve_device("cpu", None, 0, "ct2", 1) == ("cpu", "int8", 64)
+    assert transcriber._resolve_device("cpu", None, 0, "ct2", 100)[2] == 1
+
+
+def test_explicit_cpu_threads_and_omp_are_kept(cores_64, monkeypatch):
+    assert transcriber._resolve_device("cpu", None, 4, "ct2", 8)[2] == 4
+    monkeypatch.setenv("OMP_NUM_THREADS", "2")
+    assert transcriber._resolve_device("cpu", None, 0, "ct2", 8)[2] == 0
+
+
+def test_available_cpu_count_respects_affinity(monkeypatch):
+    if not hasattr(os, "sched_getaffinity"):
+        pytest.skip("no affinity API on this platform")
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: {0, 1, 2})
+    assert transcriber.available_cpu_count() == 3
+
+
+def test_silence_gate_does_not_fill_audio_buffer_cache(tmp_path, monkeypatch):
+    import numpy as np
+
+    from pingala_shunya.audio import SilenceGate, audio_buffer_cache
+
+    class SilentBackend:
+        def load_audio(self, audio_path):
+            return np.zeros(16000, dtype=np.float32)
+
+    path = tmp_path / "silence.wav"
+    path.write_bytes(b"RIFF")
+    model = transcriber.PingalaTranscriber.__new__(transcriber.PingalaTranscriber)
+    model.backend = SilentBackend()
+    model.silence_gate = SilenceGate(-50)
+    monkeypatch.setattr(audio_buffer_cache, "put", lambda key, buffer: pytest.fail("gate cached the audio"))
+
+    buffer, info = model._gate_silence(str(path), "en")
+    assert info.duration == 1.0
+    assert buffer.source == str(path)
+
+
+class StubPipeline:
+    """Fails with the given errors while timestamps are requested, then returns plain text."""
+
+    def __init__(self, error):
+        self.error = error
+        self.calls = []
+
+    def __call__(self, audio, return_timestamps, **kwargs):
+        self.calls.append(return_timestamps)
+        if return_timestamps:
+            raise self.error
+        return {"text": " hello"}
+
+
+def transformers_backend(error):
+    from types import SimpleNamespace
+
+    backend = transcriber.TransformersBackend()
+    backend.pipe = StubPipeline(error)
+    backend.model = SimpleNamespace(generation_config=SimpleNamespace(lang_to_id=None))
+    return backend
+
+
+def test_transformers_falls_back_only_for_timestamp_errors():
+    import numpy as np
+
+    audio = np.zeros(16000, dtype=np.float32)
+    backend = transformers_backend(ValueError("You are trying to return timestamps, but the generation config is not properly set."))
+    with pytest.warns(UserWarning, match="Timestamp prediction failed"):
+        segments, _ = backend.transcribe(audio)
+    assert [segment.text for segment in segments] == ["hello"]
+    assert backend.pipe.calls == [True, False]
+
+    backend = transformers_backend(RuntimeError("CUDA out of memory"))
+    with pytest.raises(RuntimeError, match="out of memory"):
+        backend.transcribe(audio)
+    assert backend.pipe.calls == [True]
+
+
+class WindowBackend:
+    """Decodes each window to its length in seconds."""
+
+    def load_audio(self, audio):
+        return audio
+
+    def decode_windows(self, windows, languages, **kwargs):
+        return [
+            transcriber.TranscriptionSegment(0.0, len(window) / 16000, f" {len(window) // 16000}s", [], -0.1, 0.0)
+            for window in windows
+        ]
+
+
+@pytest.fixture
+def batch_transcriber(monkeypatch):
+    import numpy as np
+
+    from pingala_shunya import vad
+
+    # Speech at 0-10 s and 40-50 s of a 70 s recording
+    monkeypatch.setattr(vad, "detect_speech", lambda audio, params=None: [
+        {"start": 0, "end": 10 * 16000}, {"start": 40 * 16000, "end": 50 * 16000}
+    ])
+    model = transcriber.PingalaTranscriber.__new__(transcriber.PingalaTranscriber)
+    model.backend = WindowBackend()
+    model.scheduler = None
+    model.silence_gate = None
+    return model, np.zeros(70 * 16000, dtype=np.float32)
+
+
+def test_transcribe_batch_packs_speech_by_default(batch_transcriber, monkeypatch):
+    model, audio = batch_transcriber
+    monkeypatch.setattr(transcriber, "vad_available", lambda: True)
+
+    [(segments, info)] = model.transcribe_batch([audio], language="en")
+    assert [segment.text for segment in segments] == [" 20s"]
+    assert (segments[0].start, segments[0].end) == (0.0, 50.0)
+    assert info.duration_after_vad == 20.0
+
+    [(segments, _)] = model.transcribe_batch([audio], language="en", vad_filter=False)
+    assert [segment.text for segment in segments] == [" 30s", " 30s", " 10s"]
+
+
+def test_transcribe_batch_uses_the_grid_without_vad(batch_transcriber, monkeypatch):
+    model, audio = batch_transcriber
+    monkeypatch.setattr(transcriber, "vad_available", lambda: False)
+
+    [(segments, _)] = model.transcribe_batch([audio], language="en")
+    assert len(segments) == 3
@@ -0,0 +1,35 @@
+"""Tests for the streaming transcript writers' output format."""
+
+import io
+
+from pingala_shunya.transcriber import TranscriptionSegment, WordSegment
+from pingala_shunya.writers import get_writer
+
+SEGMENTS = [
+    TranscriptionSegment(0.3, 2.0, " Hello world.", [WordSegment(" Hello", 0.3, 0.8, 0.9), WordSegment(" world.", 0.9, 2.0, 0.8)]),
+    TranscriptionSegment(2.5, 4.25, " Again.", [WordSegment(" Again.", 2.5, 4.25, 0.9)]),
+]
+
+
+def render(output_format, **options):
+    buffer = io.StringIO()
+    get_writer(output_format, buffer, **options).write_all(SEGMENTS)
+    return buffer.getvalue()
+
+
+def test_srt():
+    expected = (
+        "1\n00:00:00,300 --> 00:00:02,000\nHello world.\n\n"
+        "2\n00:00:02,500 --> 00:00:04,250\nAgain.\n\n"
+    )
+    assert render("srt") == expected
+    # Words are joined as decoded, without doubling their leading spaces
+    assert render("srt", word_timestamps=True) == expected
+
+
+def test_vtt_word_timestamps():
+    assert render("vtt", word_timestamps=True) == (
+        "WEBVTT\n\n"
+        "00:00:00.300 --> 00:00:02.000\n<00:00:00.300> Hello</00:00:00.800> <00:00:00.900> world.</00:00:02.000>\n\n"
+        "00:00:02.500 --> 00:00:04.250\n<00:00:02.500> Again.</00:00:04.250>\n\n"
+    )